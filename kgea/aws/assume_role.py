@@ -2,11 +2,14 @@
 Core AWS AssumeRole configuration
 """
 #!/usr/bin/env python
-from typing import Dict, Tuple, Optional
+from typing import Dict, Tuple, Optional, Any
 # from os import getenv
 from os.path import expanduser
 
 from datetime import datetime
+from time import time
+
+import threading
 
 from json import dumps
 # import configparser
@@ -24,6 +27,15 @@ logger.setLevel(logging.INFO)
 _KGEA_APP_CONFIG: Dict = get_app_config()
 aws_config: Dict = _KGEA_APP_CONFIG['aws']
 
+# Assumed role credentials are renewed this number of seconds ahead of their expiration
+Credentials_Refresh_Margin = \
+    _KGEA_APP_CONFIG['Credentials_Refresh_Margin'] if 'Credentials_Refresh_Margin' in _KGEA_APP_CONFIG else 300
+
+# Delay (in seconds) before a failed renewal is retried, doubled after each
+# further consecutive failure, up to the maximum delay (while the credentials are still valid)
+_REFRESH_RETRY_DELAY = 30
+_REFRESH_MAX_RETRY_DELAY = 240
+
 home = expanduser("~")
 AWS_CONFIG_ROOT = home + "/.aws/"
 
@@ -57,6 +69,35 @@ class AssumeRole:
             self.expiration = datetime.now()
             self.aws_session: Optional[boto3.Session] = None
 
+        # Pool of AWS service clients, one per thread, service and client configuration.
+        # Clients are only rebuilt when the (assumed role) credentials are renewed,
+        # that is, when the credentials 'generation' number has changed.
+        self._clients = threading.local()
+        self._client_lock = threading.Lock()
+        self._credentials_generation: int = 0
+        self._session_generation: int = 0
+
+        # Single-flight lock of STS credential renewals, with their metrics, and the
+        # number of consecutive failed renewals and time before which they are not retried
+        self._refresh_lock = threading.Lock()
+        self._refresh_failures: int = 0
+        self._next_refresh_attempt: float = 0
+        self._refresh_metrics: Dict = {
+            'refreshes': 0,
+            'failures': 0,
+            'last_refresh': None,
+            'last_latency': 0.0,
+            'max_latency': 0.0,
+            'total_latency': 0.0
+        }
+
+        # Background credentials refresher thread, see start_refresher()
+        self._refresher: Optional[threading.Thread] = None
+        self._refresher_stop = threading.Event()
+
+        # boto3 session of the default credentials, see get_credentials_state()
+        self._default_session: Optional[boto3.Session] = None
+
         # Connect to AWS STS ... using local guest credentials
         self.sts_client = None
         try:
@@ -67,6 +108,23 @@ class AssumeRole:
             print('ERROR: AWS STS configuration failed to load')
             print(ex)
 
+    def _needs_refresh(self, margin: float = 0) -> bool:
+        """
+        :param margin: number of seconds ahead of the expiration of the current credentials
+        :return: True if there are no current credentials or they expire within the margin
+        """
+        return not self.assumed_role_object or \
+            self.expiration.timestamp() - margin <= time()
+
+    def _refresh_due(self) -> bool:
+        """
+        :return: True if the credentials are expired, or expire within the refresh margin
+                 (unless their last renewal failed, then is only retried after a delay)
+        """
+        if self._needs_refresh():
+            return True
+        return self._needs_refresh(Credentials_Refresh_Margin) and time() >= self._next_refresh_attempt
+
     def get_credentials_dict(self) -> Tuple[Dict, bool]:
         """
         :return: 2-Tuple consisting first, of a  Python dictionary,
@@ -81,11 +139,25 @@ class AssumeRole:
         """
         session_renewed: bool = False
         
-        if not self.assumed_role_object or \
-                self.expiration.timestamp() <= datetime.now().timestamp():
-            
-            session_renewed = True
+        if self._refresh_due():
+            with self._refresh_lock:
+                # Single-flight: concurrent callers wait for the one STS call in progress, rather
+                # than each renewing the credentials (nor each retrying the renewal, if it failed)
+                if self._refresh_due():
+                    session_renewed = self._refresh_credentials()
+        
+        return self.credentials_dict, session_renewed
+
+    def _refresh_credentials(self) -> bool:
+        """
+        Renew the assumed role credentials with an STS call. A failed renewal is only fatal
+        if the current credentials are expired; otherwise, it is retried after a (backoff)
+        delay, the current credentials being used meanwhile. Caller must hold the refresh lock.
 
+        :return: True if the credentials were renewed
+        """
+        start = time()
+        try:
             # Full STS "Assume Role" method signature, returns temporary security credentials.
             # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sts.html#STS.Client.assume_role
             #
@@ -136,19 +208,103 @@ class AssumeRole:
                     RoleSessionName="AssumeRoleSession",
                     ExternalId=self.guest_external_id
                 )
+        except Exception as ex:
+            self._refresh_metrics['failures'] += 1
+            self._refresh_failures += 1
+            retry_delay = min(_REFRESH_RETRY_DELAY * 2 ** (self._refresh_failures - 1), _REFRESH_MAX_RETRY_DELAY)
+            self._next_refresh_attempt = time() + retry_delay
+            logger.error(f"AssumeRole credentials renewal failed (retried in {retry_delay} seconds): {str(ex)}")
+            if self._needs_refresh():
+                raise ex
+            return False
+
+        # Format resulting temporary credentials into
+        # a Python dictionary using known field names
+        credentials = self.assumed_role_object["Credentials"]
+        self.credentials_dict = {
+            "sessionId": credentials["AccessKeyId"],
+            "sessionKey": credentials["SecretAccessKey"],
+            "sessionToken": credentials["SessionToken"],
+        }
+        self.expiration = credentials["Expiration"]
+        self._credentials_generation += 1
+        self._refresh_failures = 0
+        self._next_refresh_attempt = 0
+
+        latency = time() - start
+        self._refresh_metrics['refreshes'] += 1
+        self._refresh_metrics['last_refresh'] = datetime.now().isoformat()
+        self._refresh_metrics['last_latency'] = latency
+        self._refresh_metrics['max_latency'] = max(latency, self._refresh_metrics['max_latency'])
+        self._refresh_metrics['total_latency'] += latency
+        logger.info(f"AssumeRole credentials renewed in {latency:.3f} seconds, expiring at {str(self.expiration)}")
+
+        return True
+
+    def get_refresh_metrics(self) -> Dict:
+        """
+        :return: dictionary of credentials renewal metrics: number of renewals and
+                 failures, time of the last renewal and STS call latencies (in seconds)
+        """
+        return dict(self._refresh_metrics)
+
+    def start_refresher(self):
+        """
+        Start a background (daemon) thread renewing the assumed role credentials
+        ahead of their expiration, such that requests never wait for STS calls.
+        Nothing is done if default credentials are used (boto3 renews those itself).
+        """
+        if self._default_credentials or self._refresher:
+            return
+        self._refresher_stop.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name="AssumeRoleRefresher", daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        """
+        Stop the background credentials refresher thread, if running.
+        """
+        if not self._refresher:
+            return
+        self._refresher_stop.set()
+        self._refresher.join(timeout=5)
+        self._refresher = None
+
+    def _refresh_loop(self):
+        while not self._refresher_stop.is_set():
+            try:
+                self.get_credentials_dict()
+                # wake up when the credentials enter the refresh margin, or
+                # when their renewal is to be retried (if the last one failed)
+                delay = max(
+                    self.expiration.timestamp() - Credentials_Refresh_Margin - time(),
+                    self._next_refresh_attempt - time(),
+                    1
+                )
+            except Exception as ex:
+                logger.error(f"AssumeRole background credentials refresher: {str(ex)}")
+                delay = max(self._next_refresh_attempt - time(), 1)
+            self._refresher_stop.wait(delay)
+
+    def get_credentials_state(self) -> Tuple[Any, Optional[float]]:
+        """
+        Identify the current credentials, e.g. to invalidate data (like presigned URLs)
+        signed with previous credentials, without exposing the credentials themselves.
+
+        :return: 2-Tuple of a token which changes whenever the credentials are renewed,
+                 and the expiration timestamp of the credentials (None if unknown)
+        """
+        if self._default_credentials:
+            with self._client_lock:
+                if not self._default_session:
+                    self._default_session = boto3.Session()
+            # default (e.g. EC2 instance profile) credentials are renewed by boto3 itself
+            credentials = self._default_session.get_credentials().get_frozen_credentials()
+            return credentials.access_key, None
+        else:
+            self.get_credentials_dict()
+            return self._credentials_generation, self.expiration.timestamp()
 
-            # Format resulting temporary credentials into
-            # a Python dictionary using known field names
-            credentials = self.assumed_role_object["Credentials"]
-            self.credentials_dict = {
-                "sessionId": credentials["AccessKeyId"],
-                "sessionKey": credentials["SecretAccessKey"],
-                "sessionToken": credentials["SessionToken"],
-            }
-            self.expiration = credentials["Expiration"]
-        
-        return self.credentials_dict, session_renewed
-    
     def get_credentials_jsons(self) -> str:
         """
         :return: JSON formatted string of temporary AWS credentials of form
@@ -171,8 +327,60 @@ class AssumeRole:
             credentials, _ = self.get_credentials_dict()
             return dumps(credentials)
 
+    @staticmethod
+    def _config_key(config: Optional[Config]) -> str:
+        """
+        :param config: botocore client configuration
+        :return: hashable key of the client configuration options
+        """
+        if not config:
+            return ''
+        # the (public) attributes of botocore Config objects are their options
+        return repr([(option, getattr(config, option, None)) for option in Config.OPTION_DEFAULTS])
+
+    def _renew_session(self) -> int:
+        """
+        Ensure that the boto3 session of the assumed role has current credentials.
+
+        :return: current credentials generation number
+        """
+        credentials, _ = self.get_credentials_dict()
+
+        # The one boto3 session shared by all threads is rebuilt once per credentials renewal,
+        # whether the renewal was triggered here or by the background credentials refresher
+        if not self.aws_session or self._session_generation != self._credentials_generation:
+            self.aws_session = boto3.Session(
+                aws_access_key_id=credentials["sessionId"],
+                aws_secret_access_key=credentials["sessionKey"],
+                aws_session_token=credentials["sessionToken"]
+            )
+            self._session_generation = self._credentials_generation
+
+        return self._credentials_generation
+
+    def _new_client(self, service: str, config: Optional[Config] = None):
+        """
+        Build a new AWS service client. Client construction is serialized
+        since boto3 (default) sessions are not thread safe.
+
+        :param service:
+        :param config:
+        :return: (client, credentials generation number) 2-Tuple
+        """
+        with self._client_lock:
+            if self._default_credentials:
+                logging.debug("AssumeRole.get_client(): using default credentials")
+                return boto3.client(service, config=config), 0
+            else:
+                generation = self._renew_session()
+                return self.aws_session.client(service, config=config), generation
+
     def get_client(self, service: str, config: Optional[Config] = None):
         """
+        Get an AWS service client from the pool of clients of the current thread,
+        thus reusing its HTTP connection pool and endpoint resolution.
+        A new client is only built when none is yet available for the given
+        service and configuration or the assumed role credentials were renewed.
 
         :param service:
         :param config:
@@ -188,21 +396,27 @@ class AssumeRole:
         #     "sessionToken": "temp-session-token"
         # }
         #
+        if not hasattr(self._clients, 'pool'):
+            self._clients.pool = dict()
+
         if self._default_credentials:
-            logging.debug("AssumeRole.get_client(): using default credentials")
-            return boto3.client(service, config=config)
+            generation = 0
+        elif self.aws_session and self._session_generation == self._credentials_generation and \
+                not self._refresh_due():
+            # the current session is checked without the lock (thus, threads do not serialize on it)...
+            generation = self._session_generation
         else:
-            credentials, session_renewed = self.get_credentials_dict()
+            # ...which is only taken when the credentials (thus, the session) are due to be renewed
+            with self._client_lock:
+                generation = self._renew_session()
 
-            if not self.aws_session or session_renewed:
-
-                self.aws_session = boto3.Session(
-                    aws_access_key_id=credentials["sessionId"],
-                    aws_secret_access_key=credentials["sessionKey"],
-                    aws_session_token=credentials["sessionToken"]
-                )
+        key = (service, self._config_key(config))
+        entry = self._clients.pool.get(key, None)
+        if not entry or entry[1] != generation:
+            entry = self._new_client(service, config=config)
+            self._clients.pool[key] = entry
 
-            return self.aws_session.client(service, config=config)
+        return entry[0]
 
     def get_resource(self, service, **kwargs):
         """
@@ -211,15 +425,9 @@ class AssumeRole:
         :param kwargs:
         :return:
         """
-        if self._default_credentials:
-            return boto3.resource('s3', **kwargs)
-        else:
-            credentials, session_renewed = self.get_credentials_dict()
-
-            if not self.aws_session or session_renewed:
-                self.aws_session = boto3.Session(
-                    aws_access_key_id=credentials["sessionId"],
-                    aws_secret_access_key=credentials["sessionKey"],
-                    aws_session_token=credentials["sessionToken"]
-                )
-            return self.aws_session.resource(service_name=service, **kwargs)
+        with self._client_lock:
+            if self._default_credentials:
+                return boto3.resource('s3', **kwargs)
+            else:
+                self._renew_session()
+                return self.aws_session.resource(service_name=service, **kwargs)
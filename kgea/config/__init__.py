@@ -155,13 +155,33 @@ REGISTER_KNOWLEDGE_GRAPH = BACKEND + "register/graph"  # POST
 REGISTER_FILESET = BACKEND + "register/fileset"  # POST
 PUBLISH_FILE_SET = BACKEND + "publish"  # GET
 
+# Paths, relative to the BACKEND_PATH, of the backend endpoints
+# directly routed by aiohttp (see kgea.server.web_services.main())
+STREAM_UPLOAD_FILE_PATH = "upload/stream"
+UPLOAD_SESSION_PATH = "upload/session"
+UPLOAD_PROGRESS_EVENTS_PATH = "upload/progress/events"
+TRANSFER_METRICS_PATH = "transfers"
+
 # upload controller
 SETUP_UPLOAD_CONTEXT = BACKEND + "upload"  # GET
 UPLOAD_FILE = BACKEND + "upload"  # POST
+STREAM_UPLOAD_FILE = BACKEND + STREAM_UPLOAD_FILE_PATH  # POST
+UPLOAD_SESSION = BACKEND + UPLOAD_SESSION_PATH  # POST, GET, DELETE (and /part PUT, /complete POST)
 DIRECT_URL_TRANSFER = BACKEND + "upload/url"  # GET
 CANCEL_UPLOAD = BACKEND + "upload/cancel"  # DELETE
 
 GET_UPLOAD_STATUS = BACKEND + "upload/progress"  # GET
+UPLOAD_PROGRESS_EVENTS = BACKEND + UPLOAD_PROGRESS_EVENTS_PATH  # GET (text/event-stream)
+TRANSFER_METRICS = BACKEND + TRANSFER_METRICS_PATH  # GET
+
+
+def get_fileset_versions_url(kg_id: str):
+    """
+
+    :param kg_id:
+    :return:
+    """
+    return GET_KNOWLEDGE_GRAPH_CATALOG + "/" + kg_id + "/versions"  # GET
 
 
 # content controllers
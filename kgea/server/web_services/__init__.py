@@ -6,13 +6,58 @@ import connexion
 from connexion.apps import aiohttp_app
 import aiohttp_cors
 
-from kgea.server.web_services.catalog import KnowledgeGraphCatalog
+from kgea.config import (
+    BACKEND_PATH,
+    STREAM_UPLOAD_FILE_PATH,
+    UPLOAD_SESSION_PATH,
+    UPLOAD_PROGRESS_EVENTS_PATH,
+    TRANSFER_METRICS_PATH
+)
+from kgea.server.web_services.catalog import (
+    KnowledgeGraphCatalog,
+    start_catalog_reconciler,
+    stop_catalog_reconciler,
+    start_catalog_store_syncer,
+    stop_catalog_store_syncer,
+    start_catalog_index_writer,
+    stop_catalog_index_writer
+)
 from kgea.server.web_services.kgea_session import KgeaSession
+from kgea.server.web_services.kgea_file_ops import the_role
+from aiohttp import web
+from kgea.server.web_services.kgea_async_file_ops import (
+    shutdown_s3_executor,
+    start_upload_session_reaper,
+    stop_upload_session_reaper
+)
+from kgea.server.web_services.kgea_handlers import (
+    kge_stream_upload_file,
+    kge_open_upload_session,
+    kge_get_upload_session_parts,
+    kge_upload_session_part,
+    kge_complete_upload_session,
+    kge_abort_upload_session,
+    kge_transfer_metrics,
+    kge_upload_progress_events
+)
+from kgea.server.web_services.kgea_transfer_scheduler import shutdown_transfer_scheduler
+from kgea.server.web_services.kgea_upload_tracker import (
+    start_upload_tracker_flusher,
+    stop_upload_tracker_flusher
+)
 import logging
 
 aiohttp_app.logger = logging.getLogger(__name__)
 
 
+def _backend_route(endpoint_path: str) -> str:
+    """
+    :param endpoint_path: path of a backend endpoint, relative to the BACKEND_PATH
+    :return: absolute route of the endpoint, on the web services application
+    """
+    return f"/{BACKEND_PATH}{endpoint_path}"
+
+
 def main():
     """
     KGE Archive Web Services application entry point
@@ -29,7 +74,23 @@ def main():
             "client_max_size": 256*1024**3
         }
     )
-    
+
+    # The streamed and resumable uploads read the request body themselves, thus are routed directly
+    # by aiohttp (connexion would otherwise spool the body in full), ahead of the (/archive) API routes;
+    # likewise for the (streamed) upload progress events. The streamed upload (of a file in a single
+    # request) is no longer used by the upload form, which uses the resumable upload sessions, but
+    # remains available to API clients
+    app.app.router.add_routes([
+        web.post(_backend_route(STREAM_UPLOAD_FILE_PATH), kge_stream_upload_file),
+        web.post(_backend_route(UPLOAD_SESSION_PATH), kge_open_upload_session),
+        web.get(_backend_route(UPLOAD_SESSION_PATH), kge_get_upload_session_parts),
+        web.delete(_backend_route(UPLOAD_SESSION_PATH), kge_abort_upload_session),
+        web.put(_backend_route(f"{UPLOAD_SESSION_PATH}/part"), kge_upload_session_part),
+        web.post(_backend_route(f"{UPLOAD_SESSION_PATH}/complete"), kge_complete_upload_session),
+        web.get(_backend_route(TRANSFER_METRICS_PATH), kge_transfer_metrics),
+        web.get(_backend_route(UPLOAD_PROGRESS_EVENTS_PATH), kge_upload_progress_events)
+    ])
+
     app.add_api('openapi.yaml',
                 arguments={
                     'title': 'OpenAPI for the Biomedical Translator Knowledge Graph EXchange Archive. ' +
@@ -57,6 +118,30 @@ def main():
 
     KgeaSession.initialize(app.app)
 
+    # Keep the catalog in sync with changes made to the KGE Archive by other
+    # instances of the application (or by external scripts), in the background
+    app.app.on_startup.append(start_catalog_reconciler)
+    app.app.on_cleanup.append(stop_catalog_reconciler)
+
+    # Read the changes made to the catalog by the other worker processes (if sharing a catalog store)
+    app.app.on_startup.append(start_catalog_store_syncer)
+    app.app.on_cleanup.append(stop_catalog_store_syncer)
+
+    # Write the catalog index after changes to the catalog, coalescing the changes made in the meantime
+    app.app.on_startup.append(start_catalog_index_writer)
+    app.app.on_cleanup.append(stop_catalog_index_writer)
+
+    # Abort the resumable upload sessions abandoned by their submitters, in the background
+    app.app.on_startup.append(start_upload_session_reaper)
+    app.app.on_cleanup.append(stop_upload_session_reaper)
+
+    # Publish the progress of the uploads run by this process to the (shared) upload tracker backend
+    app.app.on_startup.append(start_upload_tracker_flusher)
+    app.app.on_cleanup.append(stop_upload_tracker_flusher)
+
+    # Renew the assumed role AWS credentials in the background, ahead of their expiration
+    the_role.start_refresher()
+
     app.run(
         port=8080,
         server="aiohttp",
@@ -64,3 +149,9 @@ def main():
     )
 
     KgeaSession.close_global_session()
+
+    shutdown_transfer_scheduler()
+
+    shutdown_s3_executor()
+
+    the_role.stop_refresher()
@@ -15,20 +15,25 @@ KGE_SMARTAPI_DIRECTORY = "translator_knowledge_graph_archive"
 """
 from sys import stderr
 
-from os import getenv
-from os.path import dirname, abspath
+from os import getenv, makedirs, replace as replace_file
+from os.path import dirname, abspath, isfile
 
 from typing import Dict, Union, Set, List, Any, Optional, Tuple
+from collections import OrderedDict
 from enum import Enum
 from string import Template, punctuation
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
+from time import monotonic
 
 # TODO: maybe convert Catalog components to Python Dataclasses?
 # from dataclasses import dataclass
 
 import re
+from bisect import bisect_right
+from hashlib import sha1
 
 import threading
+from contextlib import contextmanager
 from asyncio import (
     create_task,
     gather,
@@ -36,10 +41,11 @@ from asyncio import (
     Queue,
     Task,
     QueueFull,
+    CancelledError,
     run
 )
 
-from io import BytesIO, StringIO
+from io import BytesIO
 import tempfile
 
 import json
@@ -49,14 +55,6 @@ from jsonschema import (
     validate as json_validator
 )
 
-import yaml
-try:
-    from yaml import CLoader as Loader, CDumper as Dumper
-    from yaml.scanner import ScannerError
-except ImportError:
-    from yaml import Loader, Dumper
-    from yaml.scanner import ScannerError
-
 from github import Github
 from github.GithubException import UnknownObjectException, BadCredentialsException
 
@@ -86,6 +84,7 @@ from kgea.server.web_services.kgea_file_ops import (
     get_default_date_stamp,
     get_object_location,
     get_archive_contents,
+    iter_object_entries,
     get_object_key,
     with_version,
     load_s3_text_file,
@@ -96,7 +95,21 @@ from kgea.server.web_services.kgea_file_ops import (
     random_alpha_string,
     object_key_exists,
     extract_data_archive,
-    create_presigned_url
+    create_presigned_url,
+    load_catalog_index,
+    save_catalog_index
+)
+
+from kgea.server.web_services.kgea_async_file_ops import run_in_s3_executor
+
+from kgea.server.web_services.kgea_catalog_store import CatalogStore, get_catalog_store, Catalog_Store_Sync_Interval
+from kgea.server.web_services.kgea_metadata_codec import (
+    get_sidecar_object_key,
+    is_sidecar_object_key,
+    parse_metadata_yaml,
+    get_metadata_etag,
+    encode_metadata_sidecar,
+    decode_metadata_sidecar
 )
 
 from kgea.server.web_services.sha_utils import sha1_manifest
@@ -139,6 +152,52 @@ Number_of_Archiver_Tasks = \
 Number_of_Validator_Tasks = \
     _KGEA_APP_CONFIG['Number_of_Validator_Tasks'] if 'Number_of_Validator_Tasks' in _KGEA_APP_CONFIG else 1
 
+# Force a full scan of the KGE Archive (and regeneration of the catalog index) at startup
+Rebuild_Catalog_Index = \
+    _KGEA_APP_CONFIG['Rebuild_Catalog_Index'] if 'Rebuild_Catalog_Index' in _KGEA_APP_CONFIG else False
+
+# Format version of the persisted catalog index; bump when its structure changes
+CATALOG_INDEX_VERSION = 2
+
+# Interval (in seconds) between the writes of the catalog index of the KGE Archive, after changes to the catalog
+# (the changes made within this interval, e.g. the uploads of the files of a KGE File Set, are written at once)
+Catalog_Index_Save_Interval = \
+    _KGEA_APP_CONFIG['Catalog_Index_Save_Interval'] if 'Catalog_Index_Save_Interval' in _KGEA_APP_CONFIG else 5
+
+# Maximum number of attempts of a (conditional) write of the catalog index, when
+# rewritten by other instances of the application in the meantime (see save_index())
+CATALOG_INDEX_SAVE_ATTEMPTS = 3
+
+# Interval (in seconds) between polls of the catalog index of the KGE Archive by the catalog
+# reconciler, for changes made by other instances of the application; 0 to disable
+Catalog_Reconcile_Interval = \
+    _KGEA_APP_CONFIG['Catalog_Reconcile_Interval'] if 'Catalog_Reconcile_Interval' in _KGEA_APP_CONFIG else 60
+
+# Interval (in seconds) between full reconciliations of the catalog with the KGE Archive, i.e. listings of
+# the whole KGE Archive, for the changes made by external scripts (which do not update the catalog index)
+Catalog_Full_Reconcile_Interval = \
+    _KGEA_APP_CONFIG['Catalog_Full_Reconcile_Interval'] if 'Catalog_Full_Reconcile_Interval' in _KGEA_APP_CONFIG \
+    else 3600
+
+# Full reconciliations revisit the objects modified within this period (in seconds) before the last one,
+# to allow for clock skew and S3 listing delays (objects already seen, with the same ETag, are then skipped)
+CATALOG_SYNC_OVERLAP = 60
+
+# (Optional) local file path of a warm-start cache of the catalog. If set, the catalog
+# is loaded from this file at startup, then revalidated in the background against the KGE Archive
+Catalog_Cache_Path = \
+    _KGEA_APP_CONFIG['Catalog_Cache_Path'] if 'Catalog_Cache_Path' in _KGEA_APP_CONFIG else None
+
+# Lazy loading of the catalog: only the summaries of the KGE File Sets (i.e. not their data
+# file records) are loaded at startup; the data file records of a KGE File Set are loaded
+# upon its first access, then evicted (least recently used first) beyond the hydration budget
+Catalog_Lazy_Loading = \
+    _KGEA_APP_CONFIG['Catalog_Lazy_Loading'] if 'Catalog_Lazy_Loading' in _KGEA_APP_CONFIG else False
+
+# Maximum number of KGE File Sets whose data file records are held in memory, with lazy loading
+Catalog_Hydration_Budget = \
+    _KGEA_APP_CONFIG['Catalog_Hydration_Budget'] if 'Catalog_Hydration_Budget' in _KGEA_APP_CONFIG else 256
+
 # TODO: operational parameter dependent configuration
 MAX_WAIT = 100  # number of iterations until we stop pushing onto the queue. -1 for unlimited waits
 MAX_QUEUE = 0  # amount of queueing until we stop pushing onto the queue. 0 for unlimited queue items
@@ -175,6 +234,213 @@ KgxNodeFFP = re.compile(fr"(?P<filetype>nodes\.({KgxFileExt}))", flags=re.RegexF
 KgxEdgeFFP = re.compile(fr"(?P<filetype>edges\.({KgxFileExt}))", flags=re.RegexFlag.IGNORECASE)
 
 
+# Monotonically increasing revision number of the (in memory) catalog
+_catalog_revision: int = 0
+_catalog_revision_lock = threading.Lock()
+
+# Identifiers of the knowledge graphs changed since last taken by each consumer
+# of take_changed_kg_ids() (None signals that any knowledge graph may have changed)
+_changed_kg_ids: Dict[str, Set[Optional[str]]] = dict()
+
+
+def catalog_changed(kg_id: Optional[str] = None) -> int:
+    """
+    Signal a change to the catalog (i.e. to its knowledge graphs or their KGE File Sets).
+
+    :param kg_id: (optional) identifier of the knowledge graph changed; None if any may have changed
+    :return: new revision number of the catalog
+    """
+    global _catalog_revision
+    with _catalog_revision_lock:
+        _catalog_revision += 1
+        for changed in _changed_kg_ids.values():
+            changed.add(kg_id)
+        return _catalog_revision
+
+
+def take_changed_kg_ids(consumer: str) -> Set[Optional[str]]:
+    """
+    :param consumer: name of the consumer of the changes (e.g. 'search')
+    :return: identifiers of the knowledge graphs changed since the last call by the consumer
+             (None is included if any knowledge graph may have changed, e.g. upon the first call)
+    """
+    with _catalog_revision_lock:
+        changed = _changed_kg_ids.get(consumer, {None})
+        _changed_kg_ids[consumer] = set()
+        return changed
+
+
+def get_catalog_revision() -> int:
+    """
+    :return: current revision number of the catalog, incremented upon each change to the catalog
+    """
+    return _catalog_revision
+
+
+class ReadWriteLock:
+    """
+    Reader/writer lock: any number of threads may concurrently hold the read lock,
+    or a single thread may hold the write lock. Waiting writers take precedence over
+    new readers (thus, writers are not starved by a steady stream of readers).
+
+    Both locks are reentrant, and a thread holding the write lock may also take the read lock.
+    A thread holding (only) the read lock may NOT take the write lock (it would deadlock with
+    any other reader attempting the same), so such an upgrade raises a RuntimeError instead.
+    """
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._waiting_writers: int = 0
+        self._writer: Optional[int] = None
+        self._writer_depth: int = 0
+
+        # per thread read lock depth, and whether the thread
+        # is counted among the readers (i.e. not the writer)
+        self._local = threading.local()
+
+    def acquire_read(self):
+        """
+        Acquire the read lock, blocking while another thread holds (or awaits) the write lock.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        if depth:
+            self._local.depth = depth + 1
+            return
+
+        if self._writer == threading.get_ident():
+            self._local.counted = False
+        else:
+            with self._condition:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+                self._readers += 1
+            self._local.counted = True
+
+        self._local.depth = 1
+
+    def release_read(self):
+        """
+        Release the read lock.
+        """
+        depth = getattr(self._local, 'depth', 0)
+        if not depth:
+            raise RuntimeError("ReadWriteLock.release_read(): read lock not held")
+
+        self._local.depth = depth - 1
+        if self._local.depth == 0 and self._local.counted:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Acquire the write lock, blocking while any other thread holds the read or write lock.
+        """
+        me = threading.get_ident()
+        if self._writer == me:
+            self._writer_depth += 1
+            return
+
+        if getattr(self._local, 'depth', 0):
+            raise RuntimeError("ReadWriteLock.acquire_write(): read lock may not be upgraded to a write lock")
+
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self):
+        """
+        Release the write lock.
+        """
+        if self._writer != threading.get_ident():
+            raise RuntimeError("ReadWriteLock.release_write(): write lock not held")
+
+        self._writer_depth -= 1
+        if not self._writer_depth:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        """
+        Context manager holding the read lock.
+        """
+        self.acquire_read()
+        try:
+            yield self
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """
+        Context manager holding the write lock.
+        """
+        self.acquire_write()
+        try:
+            yield self
+        finally:
+            self.release_write()
+
+
+# Guards the (in memory) catalog state, i.e. the knowledge graphs of the KnowledgeGraphCatalog,
+# their KGE File Sets and data files, which are concurrently read by the request handlers (on the
+# event loop) and mutated by upload threads, the KgeArchiver and the catalog reconciliation.
+# Catalog state mutators hold the write lock; anything iterating over catalog state holds the read
+# lock. Neither is held across any (S3 or other) I/O, so the event loop is never blocked for long.
+catalog_lock = ReadWriteLock()
+
+# Hydrated KGE File Sets (i.e. with their data file records loaded), in least recently used order,
+# indexed by (kg_id, fileset_version); only tracked with lazy loading of the catalog
+_hydrated_file_sets: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+_hydrated_file_sets_lock = threading.Lock()
+
+
+def touch_file_set(file_set):
+    """
+    Record an access to a hydrated KGE File Set, then evict the data file records of the
+    least recently used KGE File Sets beyond the Catalog_Hydration_Budget. KGE File Sets
+    being uploaded or processed are never evicted.
+
+    :param file_set: KgeFileSet accessed
+    """
+    if not Catalog_Lazy_Loading:
+        return
+
+    evicted: List = list()
+    with _hydrated_file_sets_lock:
+        key = (file_set.kg_id, file_set.fileset_version)
+        _hydrated_file_sets[key] = file_set
+        _hydrated_file_sets.move_to_end(key)
+
+        for key, candidate in list(_hydrated_file_sets.items()):
+            if len(_hydrated_file_sets) <= Catalog_Hydration_Budget:
+                break
+            if candidate is file_set or candidate.is_pending():
+                continue
+            del _hydrated_file_sets[key]
+            evicted.append(candidate)
+
+    for candidate in evicted:
+        candidate.dehydrate()
+
+
+def get_hydration_statistics() -> Dict[str, int]:
+    """
+    :return: number of KGE File Sets currently hydrated, and the hydration budget
+    """
+    with _hydrated_file_sets_lock:
+        return {'hydrated': len(_hydrated_file_sets), 'budget': Catalog_Hydration_Budget}
+
+
 def _populate_template(filename, **kwargs) -> str:
     """
     Reads in a string template and populates it with provided named parameter values
@@ -204,7 +470,7 @@ def format_and_compression(file_name) -> Tuple[str, Optional[str]]:
         if m:
             input_format = m['filext']
 
-    if 'tar' in part[-2]:
+    if len(part) > 1 and 'tar' in part[-2]:
         archive = 'tar'
     else:
         archive = None
@@ -230,6 +496,7 @@ class KgeFileType(bytes, Enum):
     KGE_NODES = (3, "nodes", "KGX node data file")
     KGE_EDGES = (4, "edges", "KGX edge data file")
     KGE_ARCHIVE = (5, "archive", "KGE data archive")
+    KGE_MANIFEST = (6, "manifest", "KGE archive manifest (e.g. SHA1 hash) file")
 
     def __new__(cls, value, label: str, name: str):
         obj = bytes.__new__(cls, [value])
@@ -247,6 +514,153 @@ class KgeFileType(bytes, Enum):
         pass
 
 
+def infer_file_type(object_key: str) -> KgeFileType:
+    """
+    Infer the KgeFileType of an archived file from its S3 object key (i.e. its folder and name).
+
+    :param object_key: of the file in AWS S3
+    :return: KgeFileType
+    """
+    file_name = object_key.split('/')[-1]
+    if '.tar.gz' in file_name:
+        return KgeFileType.KGE_ARCHIVE
+    elif file_name.endswith('sha1.txt') or 'manifest/' in object_key:
+        return KgeFileType.KGE_MANIFEST
+    elif file_name == CONTENT_METADATA_FILE:
+        return KgeFileType.KGX_CONTENT_METADATA_FILE
+    elif 'nodes/' in object_key or KgxNodeFFP.search(file_name):
+        return KgeFileType.KGE_NODES
+    elif 'edges/' in object_key or KgxEdgeFFP.search(file_name):
+        return KgeFileType.KGE_EDGES
+    else:
+        return KgeFileType.KGX_DATA_FILE
+
+
+_version_component = re.compile(r"\d+")
+
+
+def fileset_version_key(fileset_version: str) -> Tuple[int, ...]:
+    """
+    :param fileset_version: SemVer version of a KGE File Set (i.e. 'major.minor')
+    :return: sort key of the version, ordering its components numerically (thus, "1.10" after "1.9")
+    """
+    key: List[int] = list()
+    for component in str(fileset_version).split('.'):
+        number = _version_component.match(component)
+        key.append(int(number.group()) if number else -1)
+    return tuple(key)
+
+
+def next_fileset_version(fileset_versions: List[str]) -> str:
+    """
+    :param fileset_versions: existing versions of the KGE File Sets of a knowledge graph
+    :return: next minor version after the latest of the versions ("1.0" if there are none)
+    """
+    if not fileset_versions:
+        return "1.0"
+    latest = max(fileset_versions, key=fileset_version_key)
+    key = fileset_version_key(latest)
+    major = max(key[0], 0)
+    minor = max(key[1], -1) + 1 if len(key) > 1 else 0
+    return f"{major}.{minor}"
+
+
+class KgeDataFile:
+    """
+    Compact record of a (meta-)data file of a KGE File Set. KGE File Sets may contain
+    many thousands of files, thus the record has fixed slots (rather than a dictionary).
+    """
+    __slots__ = (
+        'object_key',
+        'file_name',
+        'file_type',
+        'file_size',
+        'input_format',
+        'input_compression',
+        'last_modified',
+        'kgx_compliant',
+        'errors'
+    )
+
+    def __init__(
+            self,
+            object_key: str,
+            file_name: str,
+            file_type: KgeFileType = KgeFileType.KGX_UNKNOWN,
+            file_size: int = -1,
+            input_format: str = '',
+            input_compression: Optional[str] = None,
+            last_modified: Optional[str] = None,
+            kgx_compliant: bool = False,
+            errors: Optional[List[str]] = None
+    ):
+        """
+        :param object_key: of the file in AWS S3
+        :param file_name: (original) name of the file
+        :param file_type: KgeFileType of the file
+        :param file_size: number of bytes in the file (-1 if unknown)
+        :param input_format: KGX format of the file (e.g. 'tsv'), inferred from its name
+        :param input_compression: compression of the file (e.g. 'gz'), inferred from its name
+        :param last_modified: (ISO formatted) date and time of the last modification of the file in AWS S3
+        :param kgx_compliant: True if the file is known to be KGX compliant
+        :param errors: (optional) list of KGX validation errors of the file
+        """
+        self.object_key: str = object_key
+        self.file_name: str = file_name
+        self.file_type: KgeFileType = file_type
+        self.file_size: int = file_size
+        self.input_format: str = input_format
+        self.input_compression: Optional[str] = input_compression
+        self.last_modified: Optional[str] = last_modified
+        self.kgx_compliant: bool = kgx_compliant
+        # None unless there are errors, to spare an empty list per file
+        self.errors: Optional[List[str]] = errors if errors else None
+
+    def __repr__(self):
+        return f"KgeDataFile('{self.object_key}', {self.file_type.label}, {self.file_size} bytes)"
+
+    def get_errors(self) -> List[str]:
+        """
+        :return: list of KGX validation errors of the file (empty if none)
+        """
+        return self.errors if self.errors else []
+
+    def to_index_entry(self) -> Dict[str, Any]:
+        """
+        :return: JSON serializable dictionary of the data file, for the catalog index
+        """
+        return {
+            "object_key": self.object_key,
+            "file_name": self.file_name,
+            "file_type": self.file_type.value,
+            "file_size": self.file_size,
+            "input_format": self.input_format,
+            "input_compression": self.input_compression,
+            "last_modified": self.last_modified,
+            "kgx_compliant": self.kgx_compliant,
+            "errors": self.get_errors()
+        }
+
+    @classmethod
+    def from_index_entry(cls, object_key: str, entry: Dict[str, Any]):
+        """
+        :param object_key: of the file in AWS S3
+        :param entry: dictionary generated by KgeDataFile.to_index_entry()
+        :return: KgeDataFile
+        """
+        return cls(
+            object_key=object_key,
+            file_name=entry.get("file_name", object_key.split('/')[-1]),
+            file_type=KgeFileType(entry["file_type"]) if "file_type" in entry else infer_file_type(object_key),
+            file_size=entry.get("file_size", -1),
+            input_format=entry.get("input_format", ''),
+            input_compression=entry.get("input_compression", None),
+            last_modified=entry.get("last_modified", None),
+            kgx_compliant=entry.get("kgx_compliant", False),
+            errors=entry.get("errors", None)
+        )
+
+
 class KgeFileSet:
     """
     Class wrapping information about a specific released version of
@@ -293,11 +707,22 @@ class KgeFileSet:
         self.content_metadata: Dict[str, Union[str, bool, List[str]]] = dict()
 
         # this attribute will track all data files of the given version of KGE File Set
-        self.data_files: Dict[str, Dict[str, Any]] = dict()
+        # (only to be modified through the add_data_file(s)(), remove_data_file() and load_data_files() methods)
+        self.data_files: Dict[str, KgeDataFile] = dict()
+
+        # secondary index of the object keys of the node, edge and archive data files
+        self._data_file_keys_by_type: Dict[KgeFileType, Set[str]] = {
+            KgeFileType.KGE_NODES: set(),
+            KgeFileType.KGE_EDGES: set(),
+            KgeFileType.KGE_ARCHIVE: set()
+        }
 
         # no errors to start
         self.errors: List[str] = list()
 
+        # False while the data file records are not held in memory (see hydrate())
+        self._hydrated: bool = True
+
         self.status: KgeFileSetStatusCode
 
         if archive_record:
@@ -318,7 +743,70 @@ class KgeFileSet:
         :return: True if fileset has given status
         """
         return self.status == KgeFileSetStatusCode.VALIDATED
-    
+
+    def is_pending(self) -> bool:
+        """
+        :return: True if the KGE File Set is still being uploaded or processed (by this instance)
+        """
+        return self.status in [KgeFileSetStatusCode.CREATED, KgeFileSetStatusCode.PROCESSING]
+
+    def is_hydrated(self) -> bool:
+        """
+        :return: True if the data file records of the KGE File Set are held in memory
+        """
+        return self._hydrated
+
+    def hydrate(self):
+        """
+        Load the data file records of the KGE File Set from the listing of its KGE Archive
+        folder, if they are not held in memory (i.e. with lazy loading of the catalog).
+        """
+        if not self._hydrated:
+            prefix = f"{get_object_location(self.kg_id)}{self.fileset_version}/"
+            data_files: List[KgeDataFile] = list()
+            for entry in iter_object_entries(default_s3_bucket, prefix=prefix):
+                object_key: str = entry['Key']
+                file_name = object_key.split('/')[-1]
+                if not file_name or file_name == FILE_SET_METADATA_FILE or is_sidecar_object_key(object_key):
+                    continue
+                input_format, input_compression = format_and_compression(file_name)
+                data_files.append(
+                    KgeDataFile(
+                        object_key=object_key,
+                        file_name=file_name,
+                        file_type=infer_file_type(object_key),
+                        input_format=input_format,
+                        input_compression=input_compression,
+                        file_size=entry['Size'],
+                        last_modified=entry['LastModified'].isoformat(),
+                        kgx_compliant=True
+                    )
+                )
+
+            with catalog_lock.write():
+                # unless concurrently hydrated... the data file records are not a change to the catalog
+                if not self._hydrated:
+                    for data_file in data_files:
+                        self._put_data_file(data_file)
+                    self._hydrated = True
+
+            logger.debug(f"hydrate(): {len(data_files)} data files loaded for {self.id()}")
+
+        touch_file_set(self)
+
+    def dehydrate(self):
+        """
+        Evict the data file records of the KGE File Set from memory (see hydrate()),
+        unless the KGE File Set is still being uploaded or processed.
+        """
+        with catalog_lock.write():
+            if self.is_pending() or not self._hydrated:
+                return
+            self.data_files.clear()
+            for object_keys in self._data_file_keys_by_type.values():
+                object_keys.clear()
+            self._hydrated = False
+
     def report_error(self, msg):
         """
         :param msg: single string message or list of string messages
@@ -327,10 +815,9 @@ class KgeFileSet:
         if isinstance(msg, str):
             msg = [msg]
         logger.error("\n".join(msg))
-        lock = threading.Lock()
-        with lock:
+        with catalog_lock.write():
             self.errors.extend(msg)
-            self.status = KgeFileSetStatusCode.ERROR
+            self.set_fileset_status(KgeFileSetStatusCode.ERROR)
 
     def get_fileset_status(self):
         """
@@ -338,6 +825,14 @@ class KgeFileSet:
         """
         return self.status
 
+    def set_fileset_status(self, status: KgeFileSetStatusCode):
+        """
+        :param status: new KgeFileSetStatusCode of the KGE File Set
+        """
+        with catalog_lock.write():
+            self.status = status
+            catalog_changed(self.kg_id)
+
     def get_kg_id(self):
         """
         :return: the knowledge graph identifier string
@@ -388,47 +883,63 @@ class KgeFileSet:
         """
         :return: S3 object keys of file set data files.
         """
-        return set(self.data_files.keys())
+        with catalog_lock.read():
+            return set(self.data_files.keys())
 
     def get_data_file_names(self) -> Set[str]:
         """
         :return: String root file names of the files in the file set.
         """
-        return set([x["file_name"] for x in self.data_files.values()])
+        with catalog_lock.read():
+            return set([x.file_name for x in self.data_files.values()])
+
+    @staticmethod
+    def _indexed_file_types(object_key: str) -> List[KgeFileType]:
+        """
+        :param object_key: of a data file
+        :return: node, edge and/or archive KgeFileType's under which the data file is (secondarily) indexed
+        """
+        file_types: List[KgeFileType] = list()
+        if 'nodes/' in object_key or KgxNodeFFP.search(object_key):
+            file_types.append(KgeFileType.KGE_NODES)
+        if 'edges/' in object_key or KgxEdgeFFP.search(object_key):
+            file_types.append(KgeFileType.KGE_EDGES)
+        if '.tar.gz' in object_key:
+            file_types.append(KgeFileType.KGE_ARCHIVE)
+        return file_types
+
+    def _put_data_file(self, data_file: KgeDataFile):
+        self.data_files[data_file.object_key] = data_file
+        for file_type in self._indexed_file_types(data_file.object_key):
+            self._data_file_keys_by_type[file_type].add(data_file.object_key)
+
+    def _pop_data_file(self, object_key: str) -> KgeDataFile:
+        data_file = self.data_files.pop(object_key)
+        for file_type in self._indexed_file_types(object_key):
+            self._data_file_keys_by_type[file_type].discard(object_key)
+        return data_file
 
     def get_nodes(self):
         """
-        :return:
+        :return: S3 object keys of the node data files
         """
-        node_files_keys = list(
-            filter(
-                lambda x: 'nodes/' in x or KgxNodeFFP.search(x),
-                self.get_data_file_object_keys()
-            )
-        )
-        return node_files_keys
+        with catalog_lock.read():
+            return list(self._data_file_keys_by_type[KgeFileType.KGE_NODES])
 
     def get_edges(self):
         """
 
-        :return:
+        :return: S3 object keys of the edge data files
         """
-        edge_files_keys = list(
-            filter(
-                lambda x: 'edges/' in x or KgxEdgeFFP.search(x),
-                self.get_data_file_object_keys()
-            )
-        )
-        return edge_files_keys
+        with catalog_lock.read():
+            return list(self._data_file_keys_by_type[KgeFileType.KGE_EDGES])
 
     def get_archive_file_keys(self):
         """
         :return: S3 object keys
         """
-        archive_files_keys = list(filter(
-            lambda x: '.tar.gz' in x, self.get_data_file_object_keys()
-        ))
-        return archive_files_keys
+        with catalog_lock.read():
+            return list(self._data_file_keys_by_type[KgeFileType.KGE_ARCHIVE])
     
     def get_property_of_data_file_key(self, object_key: str, attribute: str):
         """
@@ -437,8 +948,8 @@ class KgeFileSet:
         
         :return: the value of the property of the file identified by the object key; empty string otherwise
         """
-        if object_key in self.data_files and attribute in self.data_files[object_key]:
-            return self.data_files[object_key][attribute]
+        if object_key in self.data_files and attribute in KgeDataFile.__slots__:
+            return getattr(self.data_files[object_key], attribute)
         else:
             return ''
 
@@ -449,12 +960,8 @@ class KgeFileSet:
         :param filetype:
         :return:
         """
-        if filetype is KgeFileType.KGE_ARCHIVE:
-            return len(self.get_archive_file_keys()) > 0
-        elif filetype is KgeFileType.KGE_NODES:
-            return len(self.get_nodes()) > 0
-        elif filetype is KgeFileType.KGE_EDGES:
-            return len(self.get_edges()) > 0
+        if filetype in self._data_file_keys_by_type:
+            return len(self._data_file_keys_by_type[filetype]) > 0
         else:
             return False
 
@@ -472,17 +979,6 @@ class KgeFileSet:
         :param object_key:
         :return: None
         """
-        self.content_metadata = {
-            "file_name": file_name,
-            "file_size": file_size,
-            "object_key": object_key,
-            "kgx_compliant": False,  # until proven True...
-            "errors": []
-        }
-
-        # Add size of the metadata file to file set aggregate size
-        self.add_file_size(file_size)
-
         content_metadata_file_text = load_s3_text_file(
             bucket_name=default_s3_bucket,
             object_name=object_key
@@ -494,10 +990,19 @@ class KgeFileSet:
         # since it is much simpler and quicker than general KGX data validation
         errors = validate_content_metadata(metadata_json)
 
-        if not errors:
-            self.content_metadata["kgx_compliant"] = True
-        else:
-            self.content_metadata["errors"] = errors
+        with catalog_lock.write():
+            self.content_metadata = {
+                "file_name": file_name,
+                "file_size": file_size,
+                "object_key": object_key,
+                "kgx_compliant": not errors,
+                "errors": errors
+            }
+
+            # Add size of the metadata file to file set aggregate size
+            self.add_file_size(file_size)
+
+            catalog_changed(self.kg_id)
 
     def add_data_file(
             self,
@@ -524,45 +1029,53 @@ class KgeFileSet:
         #       from initial file registration are more extensive than
         #       a file record later loaded from the Archive. We may need
         #       to review this and somehow record more details in the archive?
-        self.data_files[object_key] = {
-            "object_key": object_key,
-            "file_type": file_type,
-            "file_name": file_name,
-            "file_size": file_size,
-            "input_format": input_format,
-            "input_compression": input_compression,
-            "kgx_compliant": False,  # until proven True...
-            "errors": []
-        }
+        data_file = KgeDataFile(
+            object_key=object_key,
+            file_type=file_type,
+            file_name=file_name,
+            file_size=file_size,
+            input_format=input_format,
+            input_compression=input_compression,
+            kgx_compliant=False  # until proven True...
+        )
+        with catalog_lock.write():
+            self._put_data_file(data_file)
 
-        # Add size of this file to file set aggregate size
-        self.add_file_size(file_size)
+            # Add size of this file to file set aggregate size
+            self.add_file_size(file_size)
+
+            catalog_changed(self.kg_id)
 
         # We now defer general node/edge graph data validation
         # to the file set self.post_process_file_set() stage
 
-    def add_data_files(self, data_files: Dict[str, Dict[str, Any]]):
+    def add_data_files(self, data_files: Dict[str, KgeDataFile]):
         """
         Bulk addition of data files to the KGE File Set may only
-        receive an AWS S3 object_key indexed dictionary of file names.
+        receive an AWS S3 object_key indexed dictionary of file records.
         The files are not further validated for KGX format compliance.
         """
-        self.data_files.update(data_files)
+        with catalog_lock.write():
+            for data_file in data_files.values():
+                self._put_data_file(data_file)
+            catalog_changed(self.kg_id)
 
-    def remove_data_file(self, object_key: str) -> Optional[Dict[str, Any]]:
+    def remove_data_file(self, object_key: str) -> Optional[KgeDataFile]:
         """
         Remove a specified data file from the Archive S3 repository.
         :param object_key: of the file to be removed
         :return: details of the removed file
         """
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[KgeDataFile] = None
         try:
             # TODO: need to be careful here with data file removal in case
             #       the file in question is still being actively validated?
-            entry = self.data_files.pop(object_key)
-            print(entry)
-            # Remove size of this file from file set aggregate size
-            self.size = self.size - int(entry['file_size'])
+            with catalog_lock.write():
+                details = self._pop_data_file(object_key)
+                # Remove size of this file from file set aggregate size
+                self.size = self.size - int(details.file_size)
+                catalog_changed(self.kg_id)
+            logger.debug(f"remove_data_file(): {details}")
 
         except KeyError:
             logger.warning(
@@ -571,30 +1084,69 @@ class KgeFileSet:
             )
         return details
 
-    def load_data_files(self, file_object_keys: List[str]):
+    def load_data_files(
+            self,
+            file_object_keys: List[str],
+            file_entries: Optional[Dict[str, Dict[str, Union[int, str]]]] = None
+    ):
         """
         Uploads data files using file object keys.
         :param file_object_keys: a list of object keys of the files to be uploaded.
+        :param file_entries: (optional) 'size' and 'last_modified' details of the files,
+                             indexed by object key, as obtained from the S3 listing
         :return:
         """
-        # TODO: see if there any other information here to be captured or inferred,
-        #       e.g. file compression (from file extension), file type, size, etc.
+        if file_entries is None:
+            file_entries = dict()
+
+        data_files: List[KgeDataFile] = list()
         for object_key in file_object_keys:
             part = object_key.split('/')
             file_name = part[-1]
-            self.data_files[object_key] = {
-                "file_name": file_name,
-                "object_key": object_key,
-                # "file_type": file_type,
-                # "input_format": input_format,
-                # "input_compression": input_compression,
-                # "size": -1,  # how can I measure this here?
-                # TODO: this could be hazardous to assume True here?
-                #       It would be better to track KGX compliance
-                #       status somewhere in persisted Archive metadata.
-                "kgx_compliant": True,
-                # "errors": []
-            }
+            input_format, input_compression = format_and_compression(file_name)
+            details = file_entries.get(object_key, {})
+            data_files.append(
+                KgeDataFile(
+                    object_key=object_key,
+                    file_name=file_name,
+                    file_type=infer_file_type(object_key),
+                    input_format=input_format,
+                    input_compression=input_compression,
+                    file_size=details.get('size', -1),  # unknown if not given
+                    last_modified=details.get('last_modified', None),
+                    # TODO: this could be hazardous to assume True here?
+                    #       It would be better to track KGX compliance
+                    #       status somewhere in persisted Archive metadata.
+                    kgx_compliant=True
+                )
+            )
+
+        with catalog_lock.write():
+            for data_file in data_files:
+                self._put_data_file(data_file)
+            catalog_changed(self.kg_id)
+
+    def get_size_by_type(self) -> Dict[str, int]:
+        """
+        :return: aggregate size (in bytes) of the (known size) data files of the
+                 KGE File Set, indexed by KgeFileType label (e.g. 'nodes', 'edges')
+        """
+        sizes: Dict[str, int] = dict()
+        with catalog_lock.read():
+            data_files = list(self.data_files.values())
+        for entry in data_files:
+            file_size = entry.file_size
+            if file_size is None or int(file_size) < 0:
+                continue
+            file_type: KgeFileType = entry.file_type
+            sizes[file_type.label] = sizes.get(file_type.label, 0) + int(file_size)
+        return sizes
+
+    def get_total_file_size(self) -> int:
+        """
+        :return: aggregate size (in bytes) of the (known size) data files of the KGE File Set
+        """
+        return sum(self.get_size_by_type().values())
 
     ##########################################
     # KGE FileSet Publication to the Archive #
@@ -610,7 +1162,7 @@ class KgeFileSet:
         :return: True if successful; False otherwise
         """
         # Signal that the KGE File Set is in a post-processing state
-        self.status = KgeFileSetStatusCode.PROCESSING
+        self.set_fileset_status(KgeFileSetStatusCode.PROCESSING)
 
         # Publication of the file_set.yaml is deferred to the KgeArchiver.worker() task
 
@@ -638,17 +1190,13 @@ class KgeFileSet:
         """
         # check if any errors were returned by KGX Validation
         errors: List = []
-        for data_file in self.data_files.values():
-            lock = threading.Lock()
-            with lock:
-                if not data_file["kgx_compliant"]:
-                    msg = data_file["errors"]
-                    if isinstance(msg, str):
-                        msg = [msg]
-                    errors.extend(msg)
-
-        if not self.content_metadata["kgx_compliant"]:
-            errors.append(self.content_metadata["errors"])
+        with catalog_lock.read():
+            for data_file in self.data_files.values():
+                if not data_file.kgx_compliant:
+                    errors.extend(data_file.get_errors())
+
+            if not self.content_metadata["kgx_compliant"]:
+                errors.append(self.content_metadata["errors"])
 
         if errors:
             self.report_error(errors)
@@ -662,8 +1210,9 @@ class KgeFileSet:
         """
         self.revisions = 'Creation'
         files = ""
-        for entry in self.data_files.values():
-            files += "- " + entry["file_name"]+"\n"
+        with catalog_lock.read():
+            for entry in self.data_files.values():
+                files += "- " + entry.file_name+"\n"
         try:
             fileset_metadata_yaml = _populate_template(
                 host=site_hostname,
@@ -701,18 +1250,23 @@ class KgeFileSet:
                 size=self.size/1024**2  # aggregated file size in megabytes
             )
 
-        file_set: List[KgeFile] = [
-            KgeFile(
-                original_name=name,
-                # TODO: how can we populate this with more complete file_set information here?
-                # assigned_name="nodes.tsv",
-                # file_type="Nodes",  # can use KgeFileType(3) indexed enum
-                # file_size=100,  # megabytes
-                # kgx_compliance_status="Validated",
-                # errors=list()
+        file_set: List[KgeFile] = list()
+        with catalog_lock.read():
+            data_files = list(self.data_files.values())
+        for entry in data_files:
+            file_type: KgeFileType = entry.file_type
+            file_size = entry.file_size
+            file_set.append(
+                KgeFile(
+                    original_name=entry.file_name,
+                    # TODO: how can we populate this with more complete file_set information here?
+                    # assigned_name="nodes.tsv",
+                    file_type=file_type.label,
+                    file_size=int(file_size)/1024**2 if file_size is not None and int(file_size) >= 0 else -1,  # MB
+                    # kgx_compliance_status="Validated",
+                    # errors=list()
+                )
             )
-            for name in self.get_data_file_names()
-        ]
         fileset_metadata.files = file_set
 
         # load the content_metadata JSON file contents here
@@ -726,7 +1280,78 @@ class KgeFileSet:
         :param file_size:
         :return:
         """
-        self.size += file_size
+        with catalog_lock.write():
+            self.size += file_size
+
+    def to_index_entry(self) -> Dict[str, Any]:
+        """
+        :return: JSON serializable dictionary of the KGE File Set, for the catalog index
+        """
+        with catalog_lock.read():
+            entry: Dict[str, Any] = {
+                'biolink_model_release': self.biolink_model_release,
+                'fileset_version': self.fileset_version,
+                'submitter_name': self.submitter_name,
+                'submitter_email': self.submitter_email,
+                'size': self.size,
+                'revisions': self.revisions,
+                'date_stamp': self.date_stamp,
+                'status': self.status,
+                'errors': list(self.errors),
+                'content_metadata': dict(self.content_metadata)
+            }
+
+            # the data files of a KGE File Set which is not hydrated are
+            # left out of its entry (thus, to be hydrated upon first access)
+            if self._hydrated:
+                entry['data_files'] = {
+                    object_key: data_file.to_index_entry()
+                    for object_key, data_file in self.data_files.items()
+                }
+
+            return entry
+
+    @classmethod
+    def from_index_entry(cls, kg_id: str, entry: Dict[str, Any], live: bool = False):
+        """
+        Rebuild a KgeFileSet from its catalog index entry.
+
+        :param kg_id: identifier of the Knowledge Graph owning the KGE File Set
+        :param entry: dictionary generated by KgeFileSet.to_index_entry()
+        :param live: True if the entry is the current state of a KGE File Set
+                     (e.g. shared by another process), rather than a persisted one
+        :return: KgeFileSet
+        """
+        file_set = cls(
+            kg_id,
+            biolink_model_release=entry.get('biolink_model_release', 'latest'),
+            fileset_version=entry['fileset_version'],
+            submitter_name=entry.get('submitter_name', ''),
+            submitter_email=entry.get('submitter_email', ''),
+            size=entry.get('size', -1),
+            revisions=entry.get('revisions', ''),
+            date_stamp=entry.get('date_stamp', get_default_date_stamp()),
+            archive_record=True
+        )
+
+        # File Sets which were still being uploaded or post-processed when the index
+        # was written cannot be resumed, so they are only flagged as loaded from the Archive
+        status = entry.get('status', KgeFileSetStatusCode.VALIDATED)
+        if not live and status in [KgeFileSetStatusCode.CREATED, KgeFileSetStatusCode.PROCESSING]:
+            status = KgeFileSetStatusCode.LOADED
+        file_set.status = status
+
+        file_set.errors = list(entry.get('errors', []))
+        file_set.content_metadata = dict(entry.get('content_metadata', {}))
+
+        if 'data_files' not in entry or (Catalog_Lazy_Loading and not file_set.is_pending()):
+            # data file records are loaded upon first access of the KGE File Set
+            file_set._hydrated = False
+        else:
+            for object_key, details in entry['data_files'].items():
+                file_set._put_data_file(KgeDataFile.from_index_entry(object_key, details))
+
+        return file_set
 
 
 class KgeKnowledgeGraph:
@@ -883,7 +1508,8 @@ class KgeKnowledgeGraph:
         object_key = add_to_s3_repository(
             kg_id=self.kg_id,
             text=provider_metadata_file,
-            file_name=PROVIDER_METADATA_FILE
+            file_name=PROVIDER_METADATA_FILE,
+            parameters=KnowledgeGraphCatalog.parse_provider_metadata(self.kg_id, provider_metadata_file)
         )
         if object_key:
             self.set_provider_metadata_object_key(object_key)
@@ -896,6 +1522,79 @@ class KgeKnowledgeGraph:
             )
         return self.get_provider_metadata_object_key()
 
+    def to_index_entry(self) -> Dict[str, Any]:
+        """
+        :return: JSON serializable dictionary of the Knowledge Graph, for the catalog index
+        """
+        with catalog_lock.read():
+            return {
+                'parameter': dict(self.parameter),
+                'provider_metadata_object_key': self._provider_metadata_object_key,
+                'versions': {
+                    fileset_version: file_set.to_index_entry()
+                    for fileset_version, file_set in self._file_set_versions.items()
+                }
+            }
+
+    @classmethod
+    def from_index_entry(cls, kg_id: str, entry: Dict[str, Any], live: bool = False):
+        """
+        Rebuild a KgeKnowledgeGraph, with all its KGE File Sets, from its catalog index entry.
+
+        :param kg_id: identifier of the Knowledge Graph
+        :param entry: dictionary generated by KgeKnowledgeGraph.to_index_entry()
+        :param live: True if the entry is the current state of a Knowledge Graph
+                     (e.g. shared by another process), rather than a persisted one
+        :return: KgeKnowledgeGraph
+        """
+        knowledge_graph = cls(kg_id=kg_id)
+
+        # parameters were already sanitized before being indexed, thus are not passed
+        # through the constructor (kg_description would otherwise be indented again)
+        knowledge_graph.parameter = dict(entry.get('parameter', {}))
+        knowledge_graph.set_provider_metadata_object_key(entry.get('provider_metadata_object_key', None))
+
+        for fileset_version, file_set_entry in entry.get('versions', {}).items():
+            knowledge_graph.add_file_set(
+                fileset_version,
+                KgeFileSet.from_index_entry(kg_id, file_set_entry, live=live)
+            )
+
+        return knowledge_graph
+
+    def has_pending_file_sets(self) -> bool:
+        """
+        :return: True if any KGE File Set of the Knowledge Graph is still being uploaded or processed (by this instance)
+        """
+        with catalog_lock.read():
+            return any(file_set.is_pending() for file_set in self._file_set_versions.values())
+
+    def adopt_pending_file_sets(self, previous):
+        """
+        Carry over the KGE File Sets of a previous instance of this Knowledge Graph
+        which are still being uploaded or processed (thus, not yet completely indexed).
+
+        :param previous: KgeKnowledgeGraph replaced by this instance
+        """
+        with catalog_lock.write():
+            for fileset_version, file_set in previous._file_set_versions.items():
+                if file_set.is_pending():
+                    self._file_set_versions[fileset_version] = file_set
+
+    def update_parameters(self, **kwargs):
+        """
+        Update the provider metadata of the Knowledge Graph (e.g. when its provider metadata file changed).
+
+        :param kwargs: provider metadata parameters (other than kg_id)
+        """
+        with catalog_lock.write():
+            for key, value in kwargs.items():
+                if key not in self._expected_provider_metadata:
+                    logger.warning("Unexpected KgeKnowledgeGraph parameter '"+str(key)+"'... ignored!")
+                    continue
+                self.parameter[key] = self.sanitize(key, value)
+            catalog_changed(self.kg_id)
+
     def get_name(self) -> str:
         """
 
@@ -903,16 +1602,23 @@ class KgeKnowledgeGraph:
         """
         return self.parameter.setdefault("kg_name", self.kg_id)
 
-    def get_file_set(self, fileset_version: str) -> Optional[KgeFileSet]:
+    def get_file_set(self, fileset_version: str, hydrate: bool = True) -> Optional[KgeFileSet]:
         """
+        :param fileset_version: version of the KGE File Set
+        :param hydrate: if False, the data file records of the KGE File Set are not loaded
+                        (when only its summary, e.g. its status, is needed; see KgeFileSet.hydrate())
         :return: KgeFileSet entry tracking for data files in the KGE File Set
         """
-        if fileset_version not in self._file_set_versions:
+        file_set: Optional[KgeFileSet] = self._file_set_versions.get(fileset_version, None)
+        if not file_set:
             # logger.warning("KgeKnowledgeGraph.get_file_set(): KGE File Set version '"
             #                + fileset_version + "' unknown for Knowledge Graph '" + self.kg_id + "'?")
             return None
 
-        return self._file_set_versions[fileset_version]
+        if hydrate:
+            file_set.hydrate()
+
+        return file_set
 
     # KGE File Set Translator SmartAPI parameters (March 2021 release):
     # - kg_id: KGE Archive generated identifier assigned to a given knowledge graph submission (and used as S3 folder)
@@ -950,14 +1656,15 @@ class KgeKnowledgeGraph:
 
         :return:
         """
-        return list(self._file_set_versions.keys())
+        with catalog_lock.read():
+            return list(self._file_set_versions.keys())
 
     def load_file_set_versions(
             self,
             versions: Dict[
                 str,  # fileset_version's of versioned KGE File Sets for a kg
                 Dict[
-                    str,  # tags 'metadata' and 'file_object_keys'
+                    str,  # tags 'metadata', 'file_object_keys' and 'file_entries'
                     Union[
                         str,  # 'metadata' field value: 'file set' specific text file blob from S3
                         List[str]  # list of 'file_object_keys' in a given KGE File Set
@@ -984,7 +1691,11 @@ class KgeKnowledgeGraph:
                                 submitter_email=self.parameter.setdefault('submitter_email', ''),
                                 archive_record=True
                             )
-            file_set.load_data_files(entry['file_object_keys'])
+            if Catalog_Lazy_Loading:
+                # data file records are loaded upon first access of the KGE File Set
+                file_set._hydrated = False
+            else:
+                file_set.load_data_files(entry['file_object_keys'], entry.get('file_entries', None))
 
     def add_file_set(self, fileset_version: str, file_set: KgeFileSet):
         """
@@ -993,149 +1704,1038 @@ class KgeKnowledgeGraph:
         :param file_set:
         :return:
         """
-        self._file_set_versions[fileset_version] = file_set
+        with catalog_lock.write():
+            self._file_set_versions[fileset_version] = file_set
+            catalog_changed(self.kg_id)
 
-    def load_fileset_metadata(self, metadata_text: str) -> KgeFileSet:
+    def fold_file_set_changes(
+            self,
+            fileset_version: str,
+            entry: Dict[
+                str,  # tags 'metadata', 'file_object_keys' and 'file_entries'
+                Union[
+                    str,  # 'metadata' field value: (changed) 'file set' specific text file blob from S3
+                    List[str],  # list of new or changed data files in the KGE File Set
+                    Dict[str, Dict[str, Union[int, str]]]  # 'size' and 'last_modified' of those data files
+                ]
+            ]
+    ) -> bool:
         """
+        Fold the changes to an existing KGE File Set (as found in the KGE Archive) into the catalog.
 
-        :param metadata_text:
+        :param fileset_version: version of the KGE File Set
+        :param entry: changes to the KGE File Set, as reported by get_archive_contents()
+        :return: True if the changes were folded into the KGE File Set;
+                 False if the KGE File Set is unknown, or still being uploaded or processed
+        """
+        with catalog_lock.write():
+            current: Optional[KgeFileSet] = self._file_set_versions.get(fileset_version, None)
+            if not current or current.is_pending():
+                return False
+
+            if 'metadata' in entry:
+                # the file set metadata changed: update the current file set (thus retaining
+                # its known data files and content metadata) with the newly parsed metadata
+                updated: KgeFileSet = self.load_fileset_metadata(entry['metadata'])
+                for attribute in [
+                    'biolink_model_release', 'date_stamp', 'submitter_name', 'submitter_email', 'revisions'
+                ]:
+                    setattr(current, attribute, getattr(updated, attribute))
+                self.add_file_set(fileset_version, current)
+
+            # (the data files of a KGE File Set which is not hydrated are all listed upon its hydration)
+            if current.is_hydrated():
+                current.load_data_files(entry['file_object_keys'], entry.get('file_entries', None))
+
+        return True
+
+    def load_fileset_metadata(self, metadata: Union[str, Dict[str, Any]]) -> KgeFileSet:
+        """
+
+        :param metadata: YAML text of the file set metadata file, or the parameters pre-parsed from it
         :return:
         """
+        parameters: Dict[str, Any] = self.parse_fileset_metadata(self.kg_id, metadata)
+
+        # Capture the file set metadata...
+        file_set = KgeFileSet(self.kg_id, archive_record=True, **parameters)
+
+        # ...add it to the knowledge graph...
+        self.add_file_set(file_set.fileset_version, file_set)
+
+        # then return it for further processing
+        return file_set
+
+    @staticmethod
+    def parse_fileset_metadata(kg_id: str, metadata: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        :param kg_id: knowledge graph identifier
+        :param metadata: YAML text of the file set metadata file, or the parameters pre-parsed from it
+        :return: KgeFileSet parameters
+        """
+        if isinstance(metadata, dict):
+            # fast path: parameters pre-parsed from the YAML text, as found in its sidecar file
+            if metadata.get('kg_id', '') != kg_id:
+                raise RuntimeError(
+                    "load_archive_entry(): archive folder kg_id '" + kg_id +
+                    " != kg_id in " + FILE_SET_METADATA_FILE + " sidecar?"
+                )
+            parameters = dict(metadata)
+            parameters.pop('kg_id')
+            return parameters
 
         # Assumed to be a YAML string to be parsed into a Python dictionary
-        mf = StringIO(metadata_text)
-        md_raw = yaml.load(mf, Loader=Loader)
-        md = dict(md_raw)
+        md = parse_metadata_yaml(metadata)
+        if md is None:
+            raise RuntimeError("load_archive_entry(): improperly formed " + FILE_SET_METADATA_FILE + "?")
 
         # id: "disney_small_world_graph" ## == kg_id
-        if self.kg_id != md.setdefault('id', ''):
+        if kg_id != md.setdefault('id', ''):
             raise RuntimeError(
-                "load_archive_entry(): archive folder kg_id '" + self.kg_id +
+                "load_archive_entry(): archive folder kg_id '" + kg_id +
                 " != id in " + FILE_SET_METADATA_FILE + "?"
             )
 
-        # biolink_model_release: "2.0.2"
-        biolink_model_release = md.setdefault('biolink_model_release', 'latest')
+        # biolink_model_release: "2.0.2"
+        biolink_model_release = md.setdefault('biolink_model_release', 'latest')
+
+        # fileset_version: "1.0"
+        fileset_version = md.setdefault('fileset_version', 'latest')
+
+        # date_stamp: "1964-04-22"
+        date_stamp = md.setdefault('date_stamp', get_default_date_stamp())
+
+        # revisions: >-
+        #   ${revisions}
+        revisions = md.setdefault('revisions', '')
+
+        submitter: Dict = md.setdefault('submitter', {})
+        if submitter:
+            # submitter_name:
+            #   name: "${submitter_name}"
+            submitter_name = submitter.setdefault('name', '')
+
+            #   email: "${submitter_email}"
+            submitter_email = submitter.setdefault('email', '')
+        else:
+            submitter_name = submitter_email = ""
+
+        # size: "10000" # megabytes
+        size = md.setdefault('size', -1)
+
+        # Probably don't need this field value
+        # access: "https://kge.starinformatics.ca/disney_small_world_graph/1964-04-22"
+        # access = md.setdefault('access', '')
+
+        return {
+            'biolink_model_release': biolink_model_release,
+            'fileset_version': fileset_version,
+            'date_stamp': date_stamp,
+            'submitter_name': submitter_name,
+            'submitter_email': submitter_email,
+            'size': size,
+            'revisions': revisions
+        }
+
+    # # Listings Approach for getting KGE File Metadata  - DEPRECATED FROM THE GENERAL CATALOG?
+    # # - Introspect on Bucket
+    # # - Create URL per Item Listing
+    # # - Send Back URL with Dictionary
+    # # OK in case with multiple files (alternative would be, archives?). A bit redundant with just one file.
+    # # TODO: convert into redirect approach with cross-origin scripting?
+    # file_set_location, _ = with_version(func=get_object_location, version=self.fileset_version)(self.kg_id)
+    # kg_files = object_keys_in_location(
+    #     bucket_name=default_s3_bucket,
+    #     object_location=file_set_location
+    # )
+    # pattern = Template('($FILES_LOCATION[0-9]+\/)').substitute(FILES_LOCATION=file_set_location)
+    # kg_listing = [content_location for content_location in kg_files if re.match(pattern, content_location)]
+    # kg_urls = dict(
+    #     map(
+    #         lambda kg_file: [
+    #             Path(kg_file).stem,
+    #             create_presigned_url(default_s3_bucket, kg_file)
+    #         ],
+    #         kg_listing))
+    # # logger.info('access urls %s, KGs: %s', kg_urls, kg_listing)
+    def get_metadata(self, fileset_version: str) -> KgeMetadata:
+        """
+
+        :param fileset_version:
+        :return:
+        """
+        provider_metadata: KgeProviderMetadata = \
+            KgeProviderMetadata(
+                kg_id=self.kg_id,
+                kg_name=self.get_name(),
+                kg_description=self.parameter["kg_description"],
+                translator_component=self.parameter["translator_component"],
+                translator_team=self.parameter["translator_team"],
+                submitter_name=self.parameter["submitter_name"],
+                submitter_email=self.parameter["submitter_email"],
+                license_name=self.parameter["license_name"],
+                license_url=self.parameter["license_url"],
+                terms_of_service=self.parameter["terms_of_service"]
+            )
+
+        fileset_metadata: Optional[KgeFileSetMetadata] = None
+
+        fileset: Optional[KgeFileSet] = self.get_file_set(fileset_version)
+        if fileset:
+            fileset_metadata = fileset.get_metadata()
+        else:
+            logger.warning("KGE File Set version '"+fileset_version+"' does not exist for graph '"+self.kg_id+"'")
+
+        metadata = KgeMetadata(provider=provider_metadata, fileset=fileset_metadata)
+
+        return metadata
+
+
+class CatalogSearchIndex:
+    """
+    In memory inverted index of the knowledge graphs of the catalog, for text search over their
+    name and description, and for the filtering on the metadata of the graphs and their KGE File Sets.
+    Knowledge graphs are (re-)indexed one at a time, as they change (see catalog_changed()).
+    """
+    # Metadata facets on which knowledge graphs may be filtered
+    FACETS = ['translator_component', 'translator_team', 'biolink_model_release', 'submitter', 'status']
+
+    _token_pattern = re.compile(r"\w+")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # identifiers of knowledge graphs indexed by (lower case) text token...
+        self._tokens: Dict[str, Set[str]] = dict()
+
+        # ... and by facet, then by (lower case) facet value
+        self._facets: Dict[str, Dict[str, Set[str]]] = {facet: dict() for facet in self.FACETS}
+
+        # tokens and (facet, value) pairs under which each knowledge graph is currently indexed
+        self._keys: Dict[str, Tuple[Set[str], Set[Tuple[str, str]]]] = dict()
+
+    @classmethod
+    def tokenize(cls, text) -> Set[str]:
+        """
+        :param text: text to tokenize
+        :return: set of (lower case) word tokens of the text
+        """
+        return set(cls._token_pattern.findall(str(text).lower())) if text else set()
+
+    @staticmethod
+    def _facet_values(value) -> List[str]:
+        """
+        :param value: metadata value (a string or list of strings)
+        :return: list of normalized (stripped, lower case) values
+        """
+        if not value:
+            return []
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        return [str(v).strip().lower() for v in values if v]
+
+    def _index_keys(self, knowledge_graph) -> Tuple[Set[str], Set[Tuple[str, str]]]:
+        """
+        :param knowledge_graph: KgeKnowledgeGraph to index
+        :return: tokens and (facet, value) pairs of the knowledge graph
+        """
+        with catalog_lock.read():
+            parameter: Dict = dict(knowledge_graph.parameter)
+            file_sets: List[KgeFileSet] = [
+                knowledge_graph.get_file_set(fileset_version, hydrate=False)
+                for fileset_version in knowledge_graph.get_version_names()
+            ]
+
+        tokens: Set[str] = \
+            self.tokenize(parameter.get('kg_name', '')) | self.tokenize(parameter.get('kg_description', ''))
+
+        facets: Set[Tuple[str, str]] = set()
+        for facet in ['translator_component', 'translator_team']:
+            facets.update((facet, value) for value in self._facet_values(parameter.get(facet, None)))
+        for submitter in ['submitter_name', 'submitter_email']:
+            facets.update(('submitter', value) for value in self._facet_values(parameter.get(submitter, None)))
+
+        for file_set in file_sets:
+            if not file_set:
+                continue
+            facets.update(
+                ('biolink_model_release', value) for value in self._facet_values(file_set.biolink_model_release)
+            )
+            facets.update(('status', value) for value in self._facet_values(file_set.status))
+            for submitter in [file_set.submitter_name, file_set.submitter_email]:
+                facets.update(('submitter', value) for value in self._facet_values(submitter))
+
+        return tokens, facets
+
+    def _unindex(self, kg_id: str):
+        tokens, facets = self._keys.pop(kg_id, (set(), set()))
+        for token in tokens:
+            postings = self._tokens.get(token, set())
+            postings.discard(kg_id)
+            if not postings:
+                self._tokens.pop(token, None)
+        for facet, value in facets:
+            postings = self._facets[facet].get(value, set())
+            postings.discard(kg_id)
+            if not postings:
+                self._facets[facet].pop(value, None)
+
+    def index(self, knowledge_graph):
+        """
+        (Re-)index a knowledge graph.
+
+        :param knowledge_graph: KgeKnowledgeGraph to index
+        """
+        tokens, facets = self._index_keys(knowledge_graph)
+        with self._lock:
+            self._unindex(knowledge_graph.kg_id)
+            for token in tokens:
+                self._tokens.setdefault(token, set()).add(knowledge_graph.kg_id)
+            for facet, value in facets:
+                self._facets[facet].setdefault(value, set()).add(knowledge_graph.kg_id)
+            self._keys[knowledge_graph.kg_id] = (tokens, facets)
+
+    def remove(self, kg_id: str):
+        """
+        :param kg_id: identifier of the knowledge graph to remove from the index
+        """
+        with self._lock:
+            self._unindex(kg_id)
+
+    def get_indexed_kg_ids(self) -> Set[str]:
+        """
+        :return: identifiers of the knowledge graphs currently indexed
+        """
+        with self._lock:
+            return set(self._keys.keys())
+
+    def search(self, q: Optional[str] = None, **filters) -> List[str]:
+        """
+        :param q: (optional) text query; all of its word tokens must match the knowledge graph name or description
+        :param filters: (optional) facet values (see FACETS) which the knowledge graphs must (case insensitively) match
+        :return: sorted list of the identifiers of the matching knowledge graphs
+        """
+        postings_lists: List[Set[str]] = list()
+        with self._lock:
+            for token in self.tokenize(q):
+                postings_lists.append(self._tokens.get(token, set()))
+            for facet, value in filters.items():
+                if facet not in self._facets:
+                    raise RuntimeError("CatalogSearchIndex.search(): unknown facet '" + str(facet) + "'")
+                if value:
+                    postings_lists.append(self._facets[facet].get(str(value).strip().lower(), set()))
+
+            if not postings_lists:
+                return sorted(self._keys.keys())
+
+            # intersect the postings, smallest first
+            postings_lists.sort(key=len)
+            matches: Set[str] = set(postings_lists[0])
+            for postings in postings_lists[1:]:
+                matches &= postings
+
+        return sorted(matches)
+
+
+async def start_catalog_reconciler(app):
+    """
+    Web application startup hook, launching the background catalog reconciler task.
+
+    :param app: aiohttp web application
+    """
+    if Catalog_Reconcile_Interval > 0:
+        app['catalog_reconciler'] = create_task(KnowledgeGraphCatalog.catalog().reconciler())
+
+
+async def stop_catalog_reconciler(app):
+    """
+    Web application cleanup hook, cancelling the background catalog reconciler task.
+
+    :param app: aiohttp web application
+    """
+    reconciler: Optional[Task] = app.get('catalog_reconciler', None)
+    if reconciler:
+        reconciler.cancel()
+        try:
+            await reconciler
+        except CancelledError:
+            pass
+
+
+async def start_catalog_store_syncer(app):
+    """
+    Web application startup hook, launching the background synchronization
+    of the catalog with the catalog store shared with other processes (if any).
+
+    :param app: aiohttp web application
+    """
+    catalog = KnowledgeGraphCatalog.catalog()
+    if catalog.has_store():
+        app['catalog_store_syncer'] = create_task(catalog.store_syncer())
+
+
+async def stop_catalog_store_syncer(app):
+    """
+    Web application cleanup hook, cancelling the background synchronization of the catalog with the catalog store.
+
+    :param app: aiohttp web application
+    """
+    syncer: Optional[Task] = app.get('catalog_store_syncer', None)
+    if syncer:
+        syncer.cancel()
+        try:
+            await syncer
+        except CancelledError:
+            pass
+
+
+async def start_catalog_index_writer(app):
+    """
+    Web application startup hook, launching the background writer of the catalog index.
+
+    :param app: aiohttp web application
+    """
+    app['catalog_index_writer'] = create_task(KnowledgeGraphCatalog.catalog().index_writer())
+
+
+async def stop_catalog_index_writer(app):
+    """
+    Web application cleanup hook, cancelling the background writer of
+    the catalog index, once the pending changes of the catalog are written.
+
+    :param app: aiohttp web application
+    """
+    writer: Optional[Task] = app.get('catalog_index_writer', None)
+    if writer:
+        writer.cancel()
+        try:
+            await writer
+        except CancelledError:
+            pass
+    await run_in_s3_executor(KnowledgeGraphCatalog.catalog().flush_index)
+
+
+def load_catalog_cache(path: str) -> Optional[Dict]:
+    """
+    Load the local (warm-start) catalog cache.
+
+    :param path: local file path of the catalog cache
+    :return: catalog cache dictionary (with 'etag', 'index' and 'metadata' entries); None if missing or unreadable
+    """
+    if not isfile(path):
+        return None
+    try:
+        with open(path, 'r') as cache_file:
+            return json.load(cache_file)
+    except Exception as exc:
+        logger.warning("load_catalog_cache(): catalog cache '" + path + "' not loaded: " + str(exc))
+        return None
+
+
+def save_catalog_cache(path: str, cache: Dict):
+    """
+    Write the local (warm-start) catalog cache. The file is replaced atomically,
+    such that a crash in mid-write does not leave a truncated cache behind.
+
+    :param path: local file path of the catalog cache
+    :param cache: catalog cache dictionary (must be JSON serializable)
+    """
+    try:
+        cache_directory = dirname(abspath(path))
+        makedirs(cache_directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=cache_directory, delete=False) as cache_file:
+            json.dump(cache, cache_file)
+        replace_file(cache_file.name, path)
+    except Exception as exc:
+        logger.warning("save_catalog_cache(): catalog cache '" + path + "' not saved: " + str(exc))
+
+
+class KnowledgeGraphCatalog:
+    """
+    Knowledge Graph Exchange (KGE) In Memory Catalog to manage compilation,
+     validation and user access of releases of KGX File Sets of Knowledge Graphs
+    """
+    _the_catalog = None
+
+    def __init__(self):
+        # Catalog keys are kg_id's, entries are a Python dictionary of kg_id metadata including
+        # name, KGE File Set metadata and a list of versions with associated file sets
+        self._kge_knowledge_graph_catalog: Dict[str, KgeKnowledgeGraph] = dict()
+
+        # serializes writes of the persisted catalog index
+        self._index_lock = threading.Lock()
+
+        # inverted index for the search of the catalog
+        self._search_index = CatalogSearchIndex()
+
+        # (optional) store of the catalog shared with other processes, for which the catalog in
+        # memory is a read-through cache (see sync_store()), with the last store revision read
+        # and the digests of the knowledge graph entries last written to (or read from) the store
+        self._store: Optional[CatalogStore] = get_catalog_store()
+        self._store_revision: int = 0
+        self._store_digests: Dict[str, bytes] = dict()
+        self._store_lock = threading.RLock()
+
+        # S3 'LastModified' watermark of the last sync of the catalog with the KGE Archive, and
+        # ETags of the objects (indexed by object key) seen during that sync (see reconcile())
+        self._sync_watermark: datetime = datetime.now(timezone.utc)
+        self._sync_seen: Dict[str, str] = dict()
+
+        # ETag of the catalog index last seen in the KGE Archive, and
+        # [ETag, text] of the KGE Archive metadata files, indexed by object key
+        self._index_etag: Optional[str] = None
+
+        # identifiers of the knowledge graphs changed by this instance since the catalog index was last
+        # written (see save_index()), and whether the catalog index is due to be written (see index_writer())
+        self._index_changes: Set[Optional[str]] = set()
+        self._index_dirty: bool = False
+        self._metadata_cache: Dict[str, List[str]] = dict()
+
+        cache: Optional[Dict] = None
+        revalidate: bool = False
+        if Catalog_Cache_Path and not Rebuild_Catalog_Index:
+            cache = load_catalog_cache(Catalog_Cache_Path)
+            if cache:
+                self._metadata_cache = cache.get('metadata', {})
+
+        if self._store and self.load_store():
+            # The catalog was already loaded by another process sharing the catalog store
+            pass
+
+        elif cache and self.load_index(cache.get('index', None)):
+            # Serve the catalog from the local cache right away,
+            # while it is revalidated against the KGE Archive
+            self._index_etag = cache.get('etag', None)
+            revalidate = True
+
+        # Otherwise, initialize catalog from its persisted index, if available (single S3 GET)...
+        elif Rebuild_Catalog_Index or not self.load_index():
+
+            # ... otherwise, with the metadata of all the existing KGE Archive (AWS S3 stored) KGE File Sets
+            # archive_contents keys are the kg_id's, entries are the rest of the KGE File Set metadata
+            # (only the metadata files which changed since last cached locally are actually loaded)
+            archive_contents: Dict = get_archive_contents(
+                bucket_name=default_s3_bucket,
+                metadata_cache=self._metadata_cache
+            )
+            for kg_id, entry in archive_contents.items():
+                if self.is_complete_kg(kg_id, entry):
+                    self.load_archive_entry(kg_id=kg_id, entry=entry)
+
+            # then persist the index, for the benefit of the next startup
+            self.save_index()
+
+        else:
+            self.save_cache()
+
+        # the knowledge graphs just loaded are not changes made by this instance
+        take_changed_kg_ids('index')
+
+        if revalidate:
+            threading.Thread(target=self.revalidate, name="kgea-catalog-revalidation", daemon=True).start()
+
+        # share the catalog with the other processes
+        self.sync_store()
+
+    def load_store(self) -> bool:
+        """
+        Load the catalog from the catalog store shared with other processes.
+
+        :return: True if the catalog store was not empty, thus the catalog loaded
+        """
+        with self._store_lock:
+            try:
+                entries, revision = self._store.get_changes(since=0)
+            except Exception as exc:
+                logger.error("load_store(): catalog store not loaded: " + str(exc))
+                return False
+
+            if not entries:
+                return False
+
+            with catalog_lock.write():
+                for kg_id, (_, entry) in entries.items():
+                    self._kge_knowledge_graph_catalog[kg_id] = \
+                        KgeKnowledgeGraph.from_index_entry(kg_id, entry, live=True)
+                    self._store_digests[kg_id] = self._entry_digest(entry)
+            self._store_revision = revision
+
+            catalog_changed()
+
+            # the knowledge graphs just loaded need not be written back to the store
+            take_changed_kg_ids('store')
+
+        return True
+
+    def has_store(self) -> bool:
+        """
+        :return: True if the catalog is shared with other processes through a catalog store
+        """
+        return self._store is not None
+
+    @staticmethod
+    def _entry_digest(entry: Dict[str, Any]) -> bytes:
+        return sha1(json.dumps(entry, sort_keys=True).encode('utf-8')).digest()
+
+    def sync_store(self, write: bool = True):
+        """
+        Synchronize the catalog with the catalog store shared with other processes (if any):
+        the knowledge graphs changed in this process are written through to the store, then
+        the knowledge graphs written to the store by the other processes are read back.
+
+        :param write: if False, only read the changes made by the other processes
+        """
+        if not self._store:
+            return
+
+        with self._store_lock:
+            try:
+                if write:
+                    changed: Set[Optional[str]] = take_changed_kg_ids('store')
+                    if None in changed:
+                        with catalog_lock.read():
+                            changed = set(self._kge_knowledge_graph_catalog.keys())
+                    for kg_id in changed:
+                        knowledge_graph: Optional[KgeKnowledgeGraph] = \
+                            self._kge_knowledge_graph_catalog.get(kg_id, None)
+                        if not knowledge_graph:
+                            continue
+                        entry: Dict[str, Any] = knowledge_graph.to_index_entry()
+                        digest: bytes = self._entry_digest(entry)
+                        if self._store_digests.get(kg_id, None) != digest:
+                            self._store.put_entry(kg_id, entry)
+                            self._store_digests[kg_id] = digest
+
+                changes, revision = self._store.get_changes(since=self._store_revision)
+                for kg_id, (_, entry) in changes.items():
+                    digest: bytes = self._entry_digest(entry)
+                    if self._store_digests.get(kg_id, None) == digest:
+                        # already known (e.g. written by this process)
+                        continue
+                    knowledge_graph = KgeKnowledgeGraph.from_index_entry(kg_id, entry, live=True)
+                    with catalog_lock.write():
+                        current: Optional[KgeKnowledgeGraph] = self._kge_knowledge_graph_catalog.get(kg_id, None)
+                        if current:
+                            knowledge_graph.adopt_pending_file_sets(current)
+                        self._kge_knowledge_graph_catalog[kg_id] = knowledge_graph
+                        catalog_changed(kg_id)
+                    self._store_digests[kg_id] = digest
+                self._store_revision = revision
+
+            except Exception as exc:
+                logger.error("sync_store(): catalog not synchronized with the catalog store: " + str(exc))
+
+    def get_index(self) -> Dict[str, Any]:
+        """
+        :return: JSON serializable catalog index of all knowledge graphs and their KGE File Sets
+        """
+        with catalog_lock.read():
+            return {
+                'version': CATALOG_INDEX_VERSION,
+                'synced': self._sync_watermark.isoformat(),
+                'knowledge_graphs': {
+                    kg_id: knowledge_graph.to_index_entry()
+                    for kg_id, knowledge_graph in self._kge_knowledge_graph_catalog.items()
+                }
+            }
+
+    @staticmethod
+    def is_current_index(index: Optional[Dict]) -> bool:
+        """
+        :param index: catalog index
+        :return: True if the catalog index is present and of the current format version
+        """
+        if not index:
+            return False
+
+        if index.get('version', None) != CATALOG_INDEX_VERSION:
+            logger.warning(
+                "Catalog index version '" + str(index.get('version', None)) +
+                "' is not the expected version '" + str(CATALOG_INDEX_VERSION) + "'... ignored!"
+            )
+            return False
+
+        return True
+
+    def load_index(self, index: Optional[Dict] = None) -> bool:
+        """
+        Load the catalog from its persisted index in the KGE Archive.
+
+        :param index: (optional) catalog index already at hand (e.g. from the local catalog cache)
+        :return: True if the catalog index was found and loaded
+        """
+        if index is None:
+            index, self._index_etag = load_catalog_index(bucket_name=default_s3_bucket)
+
+        if not self.is_current_index(index):
+            return False
+
+        if 'synced' in index:
+            # changes made to the KGE Archive since the index was
+            # written are later picked up by the catalog reconciler
+            self._sync_watermark = min(self._sync_watermark, datetime.fromisoformat(index['synced']))
+
+        with catalog_lock.write():
+            try:
+                for kg_id, entry in index.get('knowledge_graphs', {}).items():
+                    self._kge_knowledge_graph_catalog[kg_id] = KgeKnowledgeGraph.from_index_entry(kg_id, entry)
+            except Exception as exc:
+                logger.error("load_index(): catalog index is corrupted... rebuilding catalog: " + str(exc))
+                self._kge_knowledge_graph_catalog.clear()
+                return False
+
+        catalog_changed()
+
+        return True
+
+    def save_index(self) -> bool:
+        """
+        Persist the current catalog index in the KGE Archive, with a conditional write: if the
+        catalog index was since rewritten by another instance of the application, its changes are
+        merged into the catalog (see merge_index()), then the write is retried.
+
+        Should be called after each change to the catalog, rather through schedule_index_save()
+        if the change is one of many (e.g. the upload of one of the files of a KGE File Set).
+
+        :return: True if successfully saved
+        """
+        self.sync_store()
+
+        with self._index_lock:
+            self._index_changes |= take_changed_kg_ids('index')
+            for _ in range(CATALOG_INDEX_SAVE_ATTEMPTS):
+                # the changes made from now on are written by the next save
+                self._index_dirty = False
+
+                index = self.get_index()
+                etag, conflict = save_catalog_index(index, bucket_name=default_s3_bucket, etag=self._index_etag)
+                if etag:
+                    self._index_etag = etag
+                    self._index_changes.clear()
+                    self.save_cache(index)
+                    return True
+
+                if not conflict:
+                    break
+
+                current, etag = load_catalog_index(bucket_name=default_s3_bucket)
+                if self.is_current_index(current):
+                    self.merge_index(current, self._index_changes)
+                self._index_etag = etag
+
+            self._index_dirty = True
+            return False
+
+    def schedule_index_save(self):
+        """
+        Schedule the write of the catalog index by the index writer (see index_writer()),
+        coalescing the changes made to the catalog in the meantime into a single write.
+        """
+        self._index_dirty = True
+
+    async def index_writer(self, interval: float = Catalog_Index_Save_Interval):
+        """
+        Background task writing the catalog index, at most once per interval, when scheduled (see schedule_index_save()).
+
+        :param interval: number of seconds between the writes of the catalog index
+        """
+        while True:
+            await sleep(interval)
+            if not self._index_dirty:
+                continue
+            try:
+                await run_in_s3_executor(self.save_index)
+            except Exception as exc:
+                logger.error("index_writer(): " + str(exc))
+
+    def flush_index(self):
+        """
+        Write the catalog index, if scheduled (e.g. upon shutdown).
+        """
+        if self._index_dirty:
+            self.save_index()
+
+    def merge_index(self, index: Dict, changed: Optional[Set[Optional[str]]] = None) -> int:
+        """
+        Merge the knowledge graphs of a catalog index (e.g. as written by another instance of the application)
+        into the catalog. KGE File Sets being uploaded or processed by this instance are preserved.
+
+        :param index: catalog index
+        :param changed: (optional) identifiers of the knowledge graphs changed by this instance (including
+                        None if any may have changed), which take precedence over their index entries,
+                        except for the KGE File Set versions only found in the latter
+        :return: number of knowledge graphs changed
+        """
+        changed = changed if changed else set()
+        merged = 0
+        for kg_id, entry in index.get('knowledge_graphs', {}).items():
+            current: Optional[KgeKnowledgeGraph] = self._kge_knowledge_graph_catalog.get(kg_id, None)
+            if current and current.to_index_entry() == entry:
+                continue
+            try:
+                knowledge_graph = KgeKnowledgeGraph.from_index_entry(kg_id, entry)
+            except Exception as exc:
+                logger.error("merge_index(): catalog index entry for '" + kg_id + "' is corrupted: " + str(exc))
+                continue
+            with catalog_lock.write():
+                # the knowledge graph may since have been replaced (e.g. by sync_store())
+                current = self._kge_knowledge_graph_catalog.get(kg_id, None)
+                if current and (None in changed or kg_id in changed):
+                    versions: List[str] = current.get_version_names()
+                    new_versions: List[str] = [
+                        fileset_version for fileset_version in knowledge_graph.get_version_names()
+                        if fileset_version not in versions
+                    ]
+                    if not new_versions:
+                        continue
+                    for fileset_version in new_versions:
+                        current.add_file_set(
+                            fileset_version,
+                            knowledge_graph.get_file_set(fileset_version, hydrate=False)
+                        )
+                else:
+                    if current:
+                        knowledge_graph.adopt_pending_file_sets(current)
+                    self._kge_knowledge_graph_catalog[kg_id] = knowledge_graph
+                    catalog_changed(kg_id)
+            merged += 1
+
+        return merged
+
+    def save_cache(self, index: Optional[Dict] = None):
+        """
+        Write the catalog to the local catalog cache, if configured.
+
+        :param index: (optional) catalog index, if already at hand
+        """
+        if not Catalog_Cache_Path:
+            return
+        save_catalog_cache(
+            Catalog_Cache_Path,
+            {
+                'etag': self._index_etag,
+                'index': index if index else self.get_index(),
+                'metadata': self._metadata_cache
+            }
+        )
+
+    def revalidate(self):
+        """
+        Revalidate the (locally cached) catalog against the catalog index of the KGE Archive,
+        with a conditional request. Only the knowledge graphs whose index entry changed are
+        reloaded; KGE File Sets being uploaded or processed by this instance are preserved.
 
-        # fileset_version: "1.0"
-        fileset_version = md.setdefault('fileset_version', 'latest')
+        The knowledge graphs missing from the catalog index are removed from the catalog,
+        unless added (or being uploaded) by this instance since the catalog was loaded.
+        """
+        index, etag = load_catalog_index(bucket_name=default_s3_bucket, etag=self._index_etag)
 
-        # date_stamp: "1964-04-22"
-        date_stamp = md.setdefault('date_stamp', get_default_date_stamp())
+        if index is None:
+            if etag:
+                logger.info("revalidate(): locally cached catalog is up to date")
+            else:
+                # the KGE Archive has no (readable) catalog index: publish the cached one
+                logger.warning("revalidate(): catalog index missing in KGE Archive... republished from local cache")
+                self._index_etag = None
+                self.save_index()
+            return
 
-        # revisions: >-
-        #   ${revisions}
-        revisions = md.setdefault('revisions', '')
+        if not self.is_current_index(index):
+            self._index_etag = etag
+            self.save_index()
+            return
 
-        submitter: Dict = md.setdefault('submitter', {})
-        if submitter:
-            # submitter_name:
-            #   name: "${submitter_name}"
-            submitter_name = submitter.setdefault('name', '')
+        with self._index_lock:
+            # the knowledge graphs changed by this instance are yet to be written to the catalog index
+            self._index_changes |= take_changed_kg_ids('index')
+            local_changes: Set[Optional[str]] = set(self._index_changes)
 
-            #   email: "${submitter_email}"
-            submitter_email = submitter.setdefault('email', '')
-        else:
-            submitter_name = submitter_email = ""
+            changed: int = self.merge_index(index)
 
-        # size: "10000" # megabytes
-        size = md.setdefault('size', -1)
+            removed: int = 0
+            with catalog_lock.write():
+                for kg_id in list(self._kge_knowledge_graph_catalog.keys()):
+                    if kg_id in index.get('knowledge_graphs', {}) or kg_id in local_changes or \
+                            self._kge_knowledge_graph_catalog[kg_id].has_pending_file_sets():
+                        continue
+                    del self._kge_knowledge_graph_catalog[kg_id]
+                    catalog_changed(kg_id)
+                    removed += 1
 
-        # Probably don't need this field value
-        # access: "https://kge.starinformatics.ca/disney_small_world_graph/1964-04-22"
-        # access = md.setdefault('access', '')
+            self._index_etag = etag
 
-        # Capture the file set metadata...
-        file_set = KgeFileSet(
-            self.kg_id,
-            biolink_model_release=biolink_model_release,
-            fileset_version=fileset_version,
-            date_stamp=date_stamp,
-            submitter_name=submitter_name,
-            submitter_email=submitter_email,
-            size=size,
-            revisions=revisions,
-            archive_record=True
+        logger.info(
+            f"revalidate(): {changed} knowledge graphs reloaded from the KGE Archive catalog index, {removed} removed"
         )
 
-        # ...add it to the knowledge graph...
-        self.add_file_set(fileset_version, file_set)
+        self.save_cache()
 
-        # then return it for further processing
-        return file_set
+    def poll_index(self) -> Tuple[Optional[Set[str]], Optional[str]]:
+        """
+        Poll the catalog index of the KGE Archive for the changes made by other instances of the
+        application (which rewrite the index after changes to the catalog, see save_index()),
+        with a conditional request: the index is only downloaded if it has since changed.
 
-    # # Listings Approach for getting KGE File Metadata  - DEPRECATED FROM THE GENERAL CATALOG?
-    # # - Introspect on Bucket
-    # # - Create URL per Item Listing
-    # # - Send Back URL with Dictionary
-    # # OK in case with multiple files (alternative would be, archives?). A bit redundant with just one file.
-    # # TODO: convert into redirect approach with cross-origin scripting?
-    # file_set_location, _ = with_version(func=get_object_location, version=self.fileset_version)(self.kg_id)
-    # kg_files = object_keys_in_location(
-    #     bucket_name=default_s3_bucket,
-    #     object_location=file_set_location
-    # )
-    # pattern = Template('($FILES_LOCATION[0-9]+\/)').substitute(FILES_LOCATION=file_set_location)
-    # kg_listing = [content_location for content_location in kg_files if re.match(pattern, content_location)]
-    # kg_urls = dict(
-    #     map(
-    #         lambda kg_file: [
-    #             Path(kg_file).stem,
-    #             create_presigned_url(default_s3_bucket, kg_file)
-    #         ],
-    #         kg_listing))
-    # # logger.info('access urls %s, KGs: %s', kg_urls, kg_listing)
-    def get_metadata(self, fileset_version: str) -> KgeMetadata:
+        :return: 2-tuple of the identifiers of the knowledge graphs whose index entry differs from
+                 the catalog (None if the index is unchanged, missing or unreadable) and the ETag of the index
         """
+        index, etag = load_catalog_index(bucket_name=default_s3_bucket, etag=self._index_etag)
+        if index is None or not self.is_current_index(index):
+            return None, etag
 
-        :param fileset_version:
-        :return:
+        changed: Set[str] = set()
+        for kg_id, entry in index.get('knowledge_graphs', {}).items():
+            current: Optional[KgeKnowledgeGraph] = self._kge_knowledge_graph_catalog.get(kg_id, None)
+            if not (current and current.to_index_entry() == entry):
+                changed.add(kg_id)
+
+        return changed, etag
+
+    def reconcile(self, full: bool = False) -> int:
         """
-        provider_metadata: KgeProviderMetadata = \
-            KgeProviderMetadata(
-                kg_id=self.kg_id,
-                kg_name=self.get_name(),
-                kg_description=self.parameter["kg_description"],
-                translator_component=self.parameter["translator_component"],
-                translator_team=self.parameter["translator_team"],
-                submitter_name=self.parameter["submitter_name"],
-                submitter_email=self.parameter["submitter_email"],
-                license_name=self.parameter["license_name"],
-                license_url=self.parameter["license_url"],
-                terms_of_service=self.parameter["terms_of_service"]
-            )
+        Fold the changes made to the KGE Archive (e.g. by other instances of the application)
+        into the catalog. By default, the catalog index is polled (see poll_index()), then only the
+        knowledge graphs whose index entry changed are listed, and only their changed metadata files loaded.
 
-        fileset_metadata: Optional[KgeFileSetMetadata] = None
+        The changes made by external scripts (which do not rewrite the catalog index) are only found
+        by a full reconciliation, which considers the objects of the whole KGE Archive modified since
+        the last full reconciliation. Note that the deletion of objects from the KGE Archive is not detected.
 
-        fileset: Optional[KgeFileSet] = self.get_file_set(fileset_version)
-        if fileset:
-            fileset_metadata = fileset.get_metadata()
+        :param full: if True, list the whole KGE Archive rather than polling the catalog index
+        :return: number of knowledge graphs changed
+        """
+        since: datetime = self._sync_watermark - timedelta(seconds=CATALOG_SYNC_OVERLAP)
+        newest: datetime = self._sync_watermark
+        seen: Dict[str, str] = dict()
+
+        def modified_since_last_sync(entry: Dict) -> bool:
+            nonlocal newest
+            last_modified: datetime = entry['LastModified']
+            if last_modified < since:
+                return False
+            seen[entry['Key']] = entry['ETag']
+            newest = max(newest, last_modified)
+            return self._sync_seen.get(entry['Key'], None) != entry['ETag']
+
+        etag: Optional[str] = None
+        if full:
+            changes: Dict = get_archive_contents(bucket_name=default_s3_bucket, entry_filter=modified_since_last_sync)
         else:
-            logger.warning("KGE File Set version '"+fileset_version+"' does not exist for graph '"+self.kg_id+"'")
+            changed_kg_ids, etag = self.poll_index()
+            if not changed_kg_ids:
+                return 0
+            changes: Dict = dict()
+            for kg_id in changed_kg_ids:
+                changes.update(
+                    get_archive_contents(
+                        bucket_name=default_s3_bucket,
+                        metadata_cache=self._metadata_cache,
+                        kg_id=kg_id
+                    )
+                )
 
-        metadata = KgeMetadata(provider=provider_metadata, fileset=fileset_metadata)
+        changed = 0
+        try:
+            for kg_id, entry in changes.items():
+
+                knowledge_graph: Optional[KgeKnowledgeGraph] = self.get_knowledge_graph(kg_id)
+
+                if not knowledge_graph:
+                    # New knowledge graphs are fully loaded, once their provider metadata is available
+                    if 'metadata' in entry:
+                        contents: Dict = changes if not full else \
+                            get_archive_contents(bucket_name=default_s3_bucket, kg_id=kg_id)
+                        if kg_id in contents:
+                            self.load_archive_entry(kg_id=kg_id, entry=contents[kg_id])
+                            changed += 1
+                    continue
+
+                if 'metadata' in entry:
+                    provider_metadata: Optional[Dict[str, str]] = \
+                        self.parse_provider_metadata(kg_id, entry['metadata'])
+                    if provider_metadata:
+                        provider_metadata.pop('kg_id')
+                        knowledge_graph.update_parameters(**provider_metadata)
+
+                # New file set versions are fully loaded, once their file set metadata is available
+                new_versions: List[str] = list()
+                for fileset_version, version in entry['versions'].items():
+                    if fileset_version in knowledge_graph.get_version_names():
+                        knowledge_graph.fold_file_set_changes(fileset_version, version)
+                    elif 'metadata' in version:
+                        new_versions.append(fileset_version)
+
+                if new_versions:
+                    contents: Dict = changes if not full else \
+                        get_archive_contents(bucket_name=default_s3_bucket, kg_id=kg_id)
+                    versions: Dict = contents[kg_id]['versions'] if kg_id in contents else dict()
+                    knowledge_graph.load_file_set_versions(
+                        versions={
+                            fileset_version: versions[fileset_version]
+                            for fileset_version in new_versions if fileset_version in versions
+                        }
+                    )
 
-        return metadata
+                changed += 1
 
+        except Exception as exc:
+            # neither the sync watermark nor the ETag of the catalog index are
+            # advanced, thus the changes are revisited by the next reconciliation
+            logger.error("reconcile(): changes to the KGE Archive not reconciled: " + str(exc))
+            return changed
+
+        if changed:
+            logger.info(f"reconcile(): {changed} knowledge graphs changed in the KGE Archive")
+
+        if full:
+            self._sync_watermark = newest
+            self._sync_seen = seen
+            if changed:
+                self.save_index()
+        else:
+            # the catalog index already holds the changes (thus, is not rewritten,
+            # lest the instances endlessly take turns in rewriting their view of it)
+            self._index_etag = etag
+            self.sync_store()
+            self.save_cache()
 
-class KnowledgeGraphCatalog:
-    """
-    Knowledge Graph Exchange (KGE) In Memory Catalog to manage compilation,
-     validation and user access of releases of KGX File Sets of Knowledge Graphs
-    """
-    _the_catalog = None
+        return changed
 
-    def __init__(self):
-        # Catalog keys are kg_id's, entries are a Python dictionary of kg_id metadata including
-        # name, KGE File Set metadata and a list of versions with associated file sets
-        self._kge_knowledge_graph_catalog: Dict[str, KgeKnowledgeGraph] = dict()
+    async def store_syncer(self, interval: float = Catalog_Store_Sync_Interval):
+        """
+        Background task periodically synchronizing the catalog with the catalog store
+        shared with other processes (see sync_store()), off the event loop, such that
+        the catalog is read (e.g. by get_knowledge_graph()) without blocking on the store.
+
+        :param interval: number of seconds between synchronizations
+        """
+        while True:
+            await sleep(interval)
+            try:
+                await run_in_s3_executor(self.sync_store)
+            except Exception as exc:
+                logger.error("store_syncer(): " + str(exc))
+
+    async def reconciler(
+            self,
+            interval: int = Catalog_Reconcile_Interval,
+            full_interval: int = Catalog_Full_Reconcile_Interval
+    ):
+        """
+        Background task periodically reconciling the catalog with the KGE Archive (see reconcile()).
 
-        # Initialize catalog with the metadata of all the existing KGE Archive (AWS S3 stored) KGE File Sets
-        # archive_contents keys are the kg_id's, entries are the rest of the KGE File Set metadata
-        archive_contents: Dict = get_archive_contents(bucket_name=default_s3_bucket)
-        for kg_id, entry in archive_contents.items():
-            if self.is_complete_kg(kg_id, entry):
-                self.load_archive_entry(kg_id=kg_id, entry=entry)
+        :param interval: number of seconds between polls of the catalog index
+        :param full_interval: number of seconds between full reconciliations; 0 to disable
+        """
+        last_full: float = monotonic()
+        while True:
+            await sleep(interval)
+            full: bool = full_interval > 0 and monotonic() - last_full >= full_interval
+            try:
+                await run_in_s3_executor(self.reconcile, full)
+            except Exception as exc:
+                logger.error("reconciler(): " + str(exc))
+            if full:
+                last_full = monotonic()
 
     @staticmethod
     def is_complete_kg(kg_id, entry) -> bool:
@@ -1208,17 +2808,39 @@ class KnowledgeGraphCatalog:
         :param metadata_text:
         :return:
         """
-        if not metadata_text:
+        provider_metadata: Optional[Dict[str, str]] = self.parse_provider_metadata(kg_id, metadata_text)
+        if not provider_metadata:
             return False
-        
-        mf = StringIO(metadata_text)
-        try:
-            md_raw = yaml.load(mf, Loader=Loader)
-        except (ScannerError, TypeError):
+
+        self.add_knowledge_graph(**provider_metadata)
+
+        return True
+
+    @staticmethod
+    def parse_provider_metadata(kg_id, metadata_text: Union[str, Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Metadata assumed to be a YAML string to be parsed into a Python dictionary
+        :param kg_id:
+        :param metadata_text: YAML text of the provider metadata file, or the parameters pre-parsed from it
+        :return: KgeKnowledgeGraph parameters; None if the metadata is missing or invalid
+        """
+        if not metadata_text:
+            return None
+
+        if isinstance(metadata_text, dict):
+            # fast path: parameters pre-parsed from the YAML text, as found in its sidecar file
+            if metadata_text.get('kg_id', '') != kg_id:
+                logger.warning(
+                    "load_archive_entry(): archive folder kg_id '" + kg_id +
+                    " != kg_id in " + PROVIDER_METADATA_FILE + " sidecar?"
+                )
+                return None
+            return dict(metadata_text)
+
+        md = parse_metadata_yaml(metadata_text)
+        if md is None:
             logger.warning("Ignoring improperly formed provider metadata YAML file: "+metadata_text)
-            return False
-        
-        md = dict(md_raw)
+            return None
 
         # id: "disney_small_world_graph" ## == kg_id
         if kg_id != md.setdefault('id', ''):
@@ -1226,7 +2848,7 @@ class KnowledgeGraphCatalog:
                 "load_archive_entry(): archive folder kg_id '" + kg_id +
                 " != id in "+PROVIDER_METADATA_FILE+"?"
             )
-            return False
+            return None
 
         # name:  "Disneyland Small World Graph"
         kg_name = md.setdefault('name', 'Unknown')
@@ -1275,21 +2897,19 @@ class KnowledgeGraphCatalog:
         # termsOfService: "https://disneyland.disney.go.com/en-ca/terms-conditions/"
         terms_of_service = md.setdefault('termsOfService', 'unknown')
 
-        self.add_knowledge_graph(
-            kg_id=kg_id,
-            kg_name=kg_name,
-            kg_description=kg_description,
-            kg_size=kg_size,
-            translator_component=translator_component,
-            translator_team=translator_team,
-            submitter_name=submitter_name,
-            submitter_email=submitter_email,
-            license_name=license_name,
-            license_url=license_url,
-            terms_of_service=terms_of_service
-        )
-
-        return True
+        return {
+            'kg_id': kg_id,
+            'kg_name': kg_name,
+            'kg_description': kg_description,
+            'kg_size': kg_size,
+            'translator_component': translator_component,
+            'translator_team': translator_team,
+            'submitter_name': submitter_name,
+            'submitter_email': submitter_email,
+            'license_name': license_name,
+            'license_url': license_url,
+            'terms_of_service': terms_of_service
+        }
 
     # TODO: what is the required idempotency of this KG addition
     #       relative to submitters (can submitters change?)
@@ -1302,9 +2922,11 @@ class KnowledgeGraphCatalog:
         :return: KgeKnowledgeGraph instance of the knowledge graph (existing or added)
         """
         kg_id = kwargs['kg_id']
-        if kg_id not in self._kge_knowledge_graph_catalog:
-            self._kge_knowledge_graph_catalog[kg_id] = KgeKnowledgeGraph(**kwargs)
-        return self._kge_knowledge_graph_catalog[kg_id]
+        with catalog_lock.write():
+            if kg_id not in self._kge_knowledge_graph_catalog:
+                self._kge_knowledge_graph_catalog[kg_id] = KgeKnowledgeGraph(**kwargs)
+                catalog_changed(kg_id)
+            return self._kge_knowledge_graph_catalog[kg_id]
 
     def get_knowledge_graph(self, kg_id: str) -> Union[KgeKnowledgeGraph, None]:
         """
@@ -1314,10 +2936,8 @@ class KnowledgeGraphCatalog:
         :param kg_id: input knowledge graph file set identifier
         :return: KgeaFileSet; None, if unknown
         """
-        if kg_id in self._kge_knowledge_graph_catalog:
-            return self._kge_knowledge_graph_catalog[kg_id]
-        else:
-            return None
+        # (the changes made by other processes sharing the catalog store are read by the store syncer)
+        return self._kge_knowledge_graph_catalog.get(kg_id, None)
 
     def add_to_kge_file_set(
             self,
@@ -1371,6 +2991,82 @@ class KnowledgeGraphCatalog:
             else:
                 raise RuntimeError("Unknown KGE File Set type?")
 
+            # the index is written once for all the files uploaded in the meantime
+            self.schedule_index_save()
+
+    def refresh_search_index(self):
+        """
+        (Re-)index the knowledge graphs which changed since the last refresh of the search index.
+        """
+        changed: Set[Optional[str]] = take_changed_kg_ids('search')
+        if None in changed:
+            with catalog_lock.read():
+                changed = set(self._kge_knowledge_graph_catalog.keys())
+            changed |= self._search_index.get_indexed_kg_ids()
+
+        for kg_id in changed:
+            knowledge_graph: Optional[KgeKnowledgeGraph] = self.get_knowledge_graph(kg_id)
+            if knowledge_graph:
+                self._search_index.index(knowledge_graph)
+            else:
+                self._search_index.remove(kg_id)
+
+    def search_kg_entries(
+            self,
+            q: Optional[str] = None,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            **filters
+    ) -> Tuple[Dict[str, Dict[str, Union[str, List[str]]]], Optional[str]]:
+        """
+        Search KGE Knowledge Graph Entries, one page at a time.
+
+        :param q: (optional) text searched in the name and description of the knowledge graphs
+        :param limit: (optional) maximum number of entries returned
+        :param cursor: (optional) identifier of the last knowledge graph of the previous page of entries
+        :param filters: (optional) values of CatalogSearchIndex.FACETS that the knowledge graphs must match
+        :return: 2-tuple of the dictionary catalog of the matching knowledge graphs (ordered
+                 by kg_id) and the cursor of the next page of entries (None if no more entries)
+        """
+        self.refresh_search_index()
+
+        kg_ids: List[str] = self._search_index.search(q, **filters)
+
+        if cursor:
+            kg_ids = kg_ids[bisect_right(kg_ids, cursor):]
+
+        next_cursor: Optional[str] = None
+        if limit and len(kg_ids) > limit:
+            kg_ids = kg_ids[:limit]
+            next_cursor = kg_ids[-1]
+
+        catalog: Dict[str, Dict[str, Union[str, List[str]]]] = dict()
+        for kg_id in kg_ids:
+            knowledge_graph: Optional[KgeKnowledgeGraph] = self.get_knowledge_graph(kg_id)
+            if knowledge_graph:
+                catalog[kg_id] = self.get_kg_entry(knowledge_graph)
+
+        return catalog, next_cursor
+
+    @staticmethod
+    def get_kg_entry(knowledge_graph: KgeKnowledgeGraph) -> Dict[str, Union[str, List[str]]]:
+        """
+        :param knowledge_graph: KgeKnowledgeGraph
+        :return: catalog entry of the knowledge graph, with its name and validated file set versions
+        """
+        # We only want to show graphs that either satisfy the existence of a filetype,
+        # or a certain completion code. We do this now.
+        with catalog_lock.read():
+            versions = knowledge_graph.get_version_names()
+            filtered_versions = [
+                version for version in versions
+                if knowledge_graph.get_file_set(version, hydrate=False).is_validated()
+            ]
+            return {
+                'name': knowledge_graph.get_name(),
+                'versions': filtered_versions
+            }
+
     def get_kg_entries(self) -> Dict[str,  Dict[str, Union[str, List[str]]]]:
         """
         Get KGE Knowledge Graph Entries.
@@ -1393,17 +3089,9 @@ class KnowledgeGraphCatalog:
         else:
             # The real content of the catalog
             catalog: Dict[str,  Dict[str, Union[str, List[str]]]] = dict()
-            for kg_id, knowledge_graph in self._kge_knowledge_graph_catalog.items():
-
-                # We only want to show graphs that either satisfy the existence of a filetype,
-                # or a certain completion code. We do this now.
-                versions = knowledge_graph.get_version_names()
-                filtered_versions = [
-                    version for version in versions if knowledge_graph.get_file_set(version).is_validated()
-                ]
-                catalog[kg_id] = dict()
-                catalog[kg_id]['name'] = knowledge_graph.get_name()
-                catalog[kg_id]['versions'] = filtered_versions
+            with catalog_lock.read():
+                for kg_id, knowledge_graph in self._kge_knowledge_graph_catalog.items():
+                    catalog[kg_id] = self.get_kg_entry(knowledge_graph)
 
         return catalog
 
@@ -1577,6 +3265,304 @@ def test_create_fileset_metadata_file():
     return True
 
 
+@prepare_test
+def test_load_data_files_with_sizes():
+    print("\ntest_load_data_files_with_sizes() test output:\n", file=stderr)
+
+    fs = KgeFileSet(
+        kg_id="test_kg",
+        biolink_model_release="2.0.2",
+        fileset_version="1.0",
+        submitter_name="Kenneth Bruskiewicz",
+        submitter_email="kenneth@starinformatics.com",
+        archive_record=True
+    )
+    location = "kge-data/test_kg/1.0/"
+    entries = {
+        location+"nodes/nodes.tsv": {'size': 100, 'last_modified': '2021-11-01T00:00:00+00:00'},
+        location+"edges/edges.tsv": {'size': 200, 'last_modified': '2021-11-01T00:00:00+00:00'},
+        location+"archive/test_kg_1.0.tar.gz": {'size': 50, 'last_modified': '2021-11-01T00:00:00+00:00'},
+        location+"manifest/test_kg_1.0.sha1.txt": {'size': 40, 'last_modified': '2021-11-01T00:00:00+00:00'}
+    }
+    fs.load_data_files(list(entries.keys()), entries)
+
+    assert fs.get_size_by_type() == {'nodes': 100, 'edges': 200, 'archive': 50, 'manifest': 40}
+    assert fs.get_total_file_size() == 390
+    return True
+
+
+@prepare_test
+def test_data_file_type_indexes():
+    print("\ntest_data_file_type_indexes() test output:\n", file=stderr)
+
+    fs = KgeFileSet(
+        kg_id="test_kg",
+        biolink_model_release="2.0.2",
+        fileset_version="1.0",
+        submitter_name="Kenneth Bruskiewicz",
+        submitter_email="kenneth@starinformatics.com"
+    )
+    location = "kge-data/test_kg/1.0/"
+    fs.add_data_file(KgeFileType.KGX_DATA_FILE, "nodes.tsv", 100, location+"nodes/nodes.tsv")
+    fs.add_data_file(KgeFileType.KGX_DATA_FILE, "edges.tsv", 200, location+"edges/edges.tsv")
+    fs.add_data_file(KgeFileType.KGE_ARCHIVE, "test_kg.tar.gz", 50, location+"archive/test_kg.tar.gz")
+
+    assert fs.get_nodes() == [location+"nodes/nodes.tsv"]
+    assert fs.get_edges() == [location+"edges/edges.tsv"]
+    assert fs.get_archive_file_keys() == [location+"archive/test_kg.tar.gz"]
+    assert fs.get_property_of_data_file_key(location+"archive/test_kg.tar.gz", 'file_name') == "test_kg.tar.gz"
+
+    removed = fs.remove_data_file(location+"archive/test_kg.tar.gz")
+    assert removed.file_size == 50
+    assert not fs.contains_file_of_type(KgeFileType.KGE_ARCHIVE)
+    assert fs.contains_file_of_type(KgeFileType.KGE_NODES)
+
+    # secondary indexes are rebuilt with the data files from the catalog index
+    copy = KgeFileSet.from_index_entry("test_kg", fs.to_index_entry())
+    assert copy.get_edges() == [location+"edges/edges.tsv"]
+    assert copy.data_files[location+"nodes/nodes.tsv"].file_type == KgeFileType.KGX_DATA_FILE
+    return True
+
+
+@prepare_test
+def test_lazy_file_set_hydration():
+    global Catalog_Lazy_Loading, Catalog_Hydration_Budget
+    print("\ntest_lazy_file_set_hydration() test output:\n", file=stderr)
+
+    lazy_loading, hydration_budget = Catalog_Lazy_Loading, Catalog_Hydration_Budget
+    Catalog_Lazy_Loading, Catalog_Hydration_Budget = True, 2
+    try:
+        file_sets: List[KgeFileSet] = list()
+        for version in ["1.0", "1.1", "1.2"]:
+            fs = KgeFileSet(
+                kg_id="lazy_kg",
+                biolink_model_release="2.0.2",
+                fileset_version=version,
+                submitter_name="Kenneth Bruskiewicz",
+                submitter_email="kenneth@starinformatics.com",
+                archive_record=True
+            )
+            fs.load_data_files([f"kge-data/lazy_kg/{version}/nodes/nodes.tsv"])
+            file_sets.append(fs)
+
+        # File Sets are loaded from the catalog index without their data files...
+        copy = KgeFileSet.from_index_entry("lazy_kg", file_sets[0].to_index_entry())
+        assert not copy.is_hydrated()
+        assert copy.is_validated()
+        assert not copy.get_nodes()
+        assert 'data_files' not in copy.to_index_entry()
+
+        # ... and the least recently used ones are evicted beyond the hydration budget
+        for fs in file_sets:
+            touch_file_set(fs)
+        assert not file_sets[0].is_hydrated()
+        assert not file_sets[0].data_files
+        assert file_sets[1].is_hydrated() and file_sets[2].is_hydrated()
+
+        # File Sets being uploaded or processed are never evicted
+        pending = KgeFileSet(
+            kg_id="lazy_kg",
+            biolink_model_release="2.0.2",
+            fileset_version="2.0",
+            submitter_name="Kenneth Bruskiewicz",
+            submitter_email="kenneth@starinformatics.com"
+        )
+        pending.add_data_file(KgeFileType.KGX_DATA_FILE, "nodes.tsv", 100, "kge-data/lazy_kg/2.0/nodes/nodes.tsv")
+        touch_file_set(pending)
+        assert not file_sets[1].is_hydrated()
+        assert pending.is_hydrated() and pending.get_nodes()
+        assert get_hydration_statistics() == {'hydrated': 2, 'budget': 2}
+    finally:
+        Catalog_Lazy_Loading, Catalog_Hydration_Budget = lazy_loading, hydration_budget
+        _hydrated_file_sets.clear()
+    return True
+
+
+@prepare_test
+def test_catalog_cache_round_trip():
+    print("\ntest_catalog_cache_round_trip() test output:\n", file=stderr)
+
+    fs = KgeFileSet(
+        kg_id="test_kg",
+        biolink_model_release="2.0.2",
+        fileset_version="1.0",
+        submitter_name="Kenneth Bruskiewicz",
+        submitter_email="kenneth@starinformatics.com",
+        archive_record=True
+    )
+    kg = KgeKnowledgeGraph(kg_id="test_kg")
+    kg.add_file_set("1.0", fs)
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        path = cache_directory + "/catalog.json"
+        assert load_catalog_cache(path) is None
+
+        save_catalog_cache(path, {'etag': '"abc"', 'index': {'test_kg': kg.to_index_entry()}, 'metadata': {}})
+        cache = load_catalog_cache(path)
+
+    assert cache['etag'] == '"abc"'
+    cached_kg = KgeKnowledgeGraph.from_index_entry("test_kg", cache['index']['test_kg'])
+    assert cached_kg.to_index_entry() == kg.to_index_entry()
+    return True
+
+
+@prepare_test
+def test_catalog_revision():
+    print("\ntest_catalog_revision() test output:\n", file=stderr)
+
+    kg = KgeKnowledgeGraph(kg_id="test_kg")
+    revision = get_catalog_revision()
+
+    fs = KgeFileSet(
+        kg_id="test_kg",
+        biolink_model_release="2.0.2",
+        fileset_version="1.0",
+        submitter_name="Kenneth Bruskiewicz",
+        submitter_email="kenneth@starinformatics.com",
+        archive_record=True
+    )
+    kg.add_file_set("1.0", fs)
+    assert get_catalog_revision() > revision
+    revision = get_catalog_revision()
+
+    # changes to the file set are folded in, other than the (unchanged) status
+    assert kg.fold_file_set_changes(
+        "1.0",
+        {
+            'file_object_keys': ["kge-data/test_kg/1.0/nodes/nodes.tsv"],
+            'file_entries': {
+                "kge-data/test_kg/1.0/nodes/nodes.tsv": {'size': 100, 'last_modified': '2021-11-01T00:00:00+00:00'}
+            }
+        }
+    )
+    assert get_catalog_revision() > revision
+    assert fs.get_total_file_size() == 100
+    assert fs.is_validated()
+
+    # KGE File Sets still being processed by this instance are left alone
+    fs.set_fileset_status(KgeFileSetStatusCode.PROCESSING)
+    assert not kg.fold_file_set_changes("1.0", {'file_object_keys': []})
+    return True
+
+
+@prepare_test
+def test_catalog_search_index():
+    print("\ntest_catalog_search_index() test output:\n", file=stderr)
+
+    index = CatalogSearchIndex()
+
+    kg1 = KgeKnowledgeGraph(
+        kg_id="disney_small_world_graph",
+        kg_name="Disneyland Small World Graph",
+        kg_description="Voyage along the Seven Seaways canal",
+        translator_component="KP",
+        translator_team="Disney Knowledge Provider",
+        submitter_name="Mickey Mouse",
+        submitter_email="mickey.mouse@disneyland.disney.go.com"
+    )
+    kg1.add_file_set(
+        "1.0",
+        KgeFileSet(
+            "disney_small_world_graph",
+            biolink_model_release="2.0.2",
+            fileset_version="1.0",
+            submitter_name="Mickey Mouse",
+            submitter_email="mickey.mouse@disneyland.disney.go.com",
+            archive_record=True
+        )
+    )
+    kg2 = KgeKnowledgeGraph(
+        kg_id="semantic_medline_database",
+        kg_name="Semantic Medline Database",
+        translator_component="KP",
+        submitter_name="Kenneth Bruskiewicz"
+    )
+    index.index(kg1)
+    index.index(kg2)
+
+    assert index.search() == ["disney_small_world_graph", "semantic_medline_database"]
+    assert index.search(q="small world") == ["disney_small_world_graph"]
+    assert index.search(q="Seaways") == ["disney_small_world_graph"]
+    assert index.search(translator_component="kp") == ["disney_small_world_graph", "semantic_medline_database"]
+    assert index.search(biolink_model_release="2.0.2", status="Validated") == ["disney_small_world_graph"]
+    assert index.search(q="medline", submitter="Mickey Mouse") == []
+
+    # re-indexing replaces previous entries
+    kg2.update_parameters(kg_name="Renamed Database")
+    index.index(kg2)
+    assert index.search(q="medline") == []
+    assert index.search(q="renamed") == ["semantic_medline_database"]
+
+    index.remove("disney_small_world_graph")
+    assert index.search(status="validated") == []
+    return True
+
+
+@prepare_test
+def test_fileset_version_ordering():
+    print("\ntest_fileset_version_ordering() test output:\n", file=stderr)
+
+    versions = ["1.9", "1.10", "0.2", "2.0", "1.2"]
+    assert sorted(versions, key=fileset_version_key) == ["0.2", "1.2", "1.9", "1.10", "2.0"]
+
+    assert next_fileset_version([]) == "1.0"
+    assert next_fileset_version(["1.0", "1.9", "1.10"]) == "1.11"
+    assert next_fileset_version(["2.0", "1.10"]) == "2.1"
+    return True
+
+
+@prepare_test
+def test_metadata_sidecar_fast_path():
+    print("\ntest_metadata_sidecar_fast_path() test output:\n", file=stderr)
+
+    kg_id = "disney_small_world_graph"
+    kg = KgeKnowledgeGraph(
+        kg_id=kg_id,
+        kg_name="Disneyland Small World Graph",
+        kg_description="Voyage along the Seven Seaways canal",
+        translator_component="KP",
+        translator_team="Disney Knowledge Provider",
+        submitter_name="Mickey Mouse",
+        submitter_email="mickey.mouse@disneyland.disney.go.com",
+        license_name="Artistic 2.0",
+        license_url="https://opensource.org/licenses/Artistic-2.0",
+        terms_of_service="https://disneyland.disney.go.com/en-ca/terms-conditions/"
+    )
+    provider_text = kg.generate_provider_metadata_file()
+    provider_parameters = KnowledgeGraphCatalog.parse_provider_metadata(kg_id, provider_text)
+    sidecar = decode_metadata_sidecar(
+        encode_metadata_sidecar(provider_text, provider_parameters),
+        f'"{get_metadata_etag(provider_text)}"'
+    )
+    assert KnowledgeGraphCatalog.parse_provider_metadata(kg_id, sidecar) == provider_parameters
+    assert KnowledgeGraphCatalog.parse_provider_metadata("other_graph", sidecar) is None
+
+    file_set = KgeFileSet(
+        kg_id,
+        biolink_model_release="2.0.2",
+        fileset_version="1.0",
+        date_stamp="1964-04-22",
+        submitter_name="Mickey Mouse",
+        submitter_email="mickey.mouse@disneyland.disney.go.com",
+        size=0
+    )
+    fileset_text = file_set.generate_fileset_metadata_file()
+    fileset_parameters = KgeKnowledgeGraph.parse_fileset_metadata(kg_id, fileset_text)
+    sidecar = decode_metadata_sidecar(
+        encode_metadata_sidecar(fileset_text, {'kg_id': kg_id, **fileset_parameters}),
+        get_metadata_etag(fileset_text)
+    )
+    assert KgeKnowledgeGraph.parse_fileset_metadata(kg_id, sidecar) == fileset_parameters
+    assert kg.load_fileset_metadata(sidecar).fileset_version == "1.0"
+
+    # a sidecar is stale once its metadata file is rewritten
+    assert decode_metadata_sidecar(
+        encode_metadata_sidecar(fileset_text, {'kg_id': kg_id, **fileset_parameters}),
+        get_metadata_etag(fileset_text + "\n")
+    ) is None
+    return True
+
+
 @prepare_test
 def test_create_translator_registry_entry():
     global _TEST_TRE
@@ -1593,7 +3579,8 @@ def add_to_s3_repository(
         kg_id: str,
         text: str,
         file_name: str,
-        fileset_version: str = ''
+        fileset_version: str = '',
+        parameters: Optional[Dict[str, Any]] = None
 ) -> str:
     """
     Add a file of specified text content and name,
@@ -1602,6 +3589,8 @@ def add_to_s3_repository(
     :param text: string blob contents of the file.
     :param file_name: of the file.
     :param fileset_version: version (optional)
+    :param parameters: (optional) catalog parameters parsed from a metadata file,
+                       also written next to it, as its sidecar file (see kgea_metadata_codec)
     :return: str object key of the uploaded file
     """
 
@@ -1617,6 +3606,18 @@ def add_to_s3_repository(
             object_key=object_key,
             source=BytesIO(data_bytes)
         )
+        if parameters:
+            # a missing sidecar file only means that the metadata file is parsed when the catalog is rebuilt
+            try:
+                sidecar = encode_metadata_sidecar(text, parameters)
+            except (TypeError, ValueError) as exc:
+                logger.warning(f"add_to_s3_repository(): no sidecar written for '{object_key}': {str(exc)}")
+            else:
+                upload_file(
+                    bucket=default_s3_bucket,
+                    object_key=get_sidecar_object_key(object_key),
+                    source=BytesIO(sidecar.encode('utf-8'))
+                )
         return object_key
     else:
         logger.warning("add_to_s3_repository(): Empty text string argument? Can't archive a vacuum!")
@@ -2093,11 +4094,16 @@ class KgeArchiver:
                 # versioned archive subdirectory containing the KGE File Set
 
                 fileset_metadata_file = file_set.generate_fileset_metadata_file()
-                fileset_metadata_object_key = add_to_s3_repository(
+                fileset_metadata_object_key = await run_in_s3_executor(
+                    add_to_s3_repository,
                     kg_id=file_set.kg_id,
                     text=fileset_metadata_file,
                     file_name=FILE_SET_METADATA_FILE,
-                    fileset_version=file_set.fileset_version
+                    fileset_version=file_set.fileset_version,
+                    parameters={
+                        'kg_id': file_set.kg_id,
+                        **KgeKnowledgeGraph.parse_fileset_metadata(file_set.kg_id, fileset_metadata_file)
+                    }
                 )
                 if fileset_metadata_object_key:
                     logger.info(f"KgeFileSet.publish(): successfully created object key {fileset_metadata_object_key}")
@@ -2122,21 +4128,23 @@ class KgeArchiver:
             
             # 2. Aggregate each of all nodes and edges each
             #    into their respective files in the archive folder
-            self.aggregate_to_archive(
+            await run_in_s3_executor(
+                self.aggregate_to_archive,
                 file_set=file_set,
                 kgx_file_type="nodes",
                 file_object_keys=file_set.get_nodes()
             )
-            self.aggregate_to_archive(
+            await run_in_s3_executor(
+                self.aggregate_to_archive,
                 file_set=file_set,
                 kgx_file_type="edges",
                 file_object_keys=file_set.get_edges()
             )
 
             # 3. Copy over metadata files into the archive folder
-            self.copy_to_kge_archive(file_set, PROVIDER_METADATA_FILE)
-            self.copy_to_kge_archive(file_set, FILE_SET_METADATA_FILE)
-            self.copy_to_kge_archive(file_set, CONTENT_METADATA_FILE)
+            await run_in_s3_executor(self.copy_to_kge_archive, file_set, PROVIDER_METADATA_FILE)
+            await run_in_s3_executor(self.copy_to_kge_archive, file_set, FILE_SET_METADATA_FILE)
+            await run_in_s3_executor(self.copy_to_kge_archive, file_set, CONTENT_METADATA_FILE)
 
             # take a quick rest, to give other co-routines a chance?
             await sleep(0.001)
@@ -2206,8 +4214,11 @@ class KgeArchiver:
             
             # Assume that the TAR.GZ archive of the
             # KGE File Set is validated by this point
-            file_set.status = KgeFileSetStatusCode.VALIDATED
-            
+            file_set.set_fileset_status(KgeFileSetStatusCode.VALIDATED)
+
+            # record the newly validated KGE File Set in the persisted catalog index
+            await run_in_s3_executor(KnowledgeGraphCatalog.catalog().save_index)
+
             logger.debug(f"KgeArchiver worker {task_id} finished archiving of {file_set.id()}")
 
             self._archiver_queue.task_done()
@@ -2399,31 +4410,32 @@ class KgxValidator:
             input_format: Optional[str] = None
             input_compression: Optional[str] = None
 
-            for entry in file_set.data_files.values():
-                #
-                # ... where each entry is a dictionary contains the following keys:
-                #
-                # "file_name": str
+            with catalog_lock.read():
+                data_files: List[KgeDataFile] = list(file_set.data_files.values())
 
-                # "file_type": KgeFileType (from Catalog)
-                # "input_format": str
-                # "input_compression": str
-                # "kgx_compliant": bool
+            for entry in data_files:
+                #
+                # ... where each entry is a KgeDataFile record, with (among others) the following attributes:
                 #
-                # "object_key": str
+                # file_name: str
+                # file_type: KgeFileType
+                # input_format: str
+                # input_compression: str
+                # kgx_compliant: bool
+                # object_key: str
                 #
                 # TODO: we just take the first values encountered, but
                 #       we should probably guard against inconsistent
                 #       input format and compression somewhere upstream
                 if not file_type_opt:
-                    file_type_opt = entry["file_type"]  # this should be a KgeFileType enum value?
+                    file_type_opt = entry.file_type
                 if not input_format:
-                    input_format = entry["input_format"]
+                    input_format = entry.input_format
                 if not input_compression:
-                    input_compression = entry["input_compression"]
+                    input_compression = entry.input_compression
 
-                file_name = entry["file_name"]
-                object_key = entry["object_key"]
+                file_name = entry.file_name
+                object_key = entry.object_key
 
                 logger.debug(
                     f"KgxValidator() processing file '{file_name}' '{object_key}' " +
@@ -2665,6 +4677,14 @@ if __name__ == '__main__':
         # assert (test_add_to_github())
 
         # assert (test_get_catalog_entries())
+        assert (test_load_data_files_with_sizes())
+        assert (test_data_file_type_indexes())
+        assert (test_lazy_file_set_hydration())
+        assert (test_catalog_cache_round_trip())
+        assert (test_catalog_revision())
+        assert (test_catalog_search_index())
+        assert (test_fileset_version_ordering())
+        assert (test_metadata_sidecar_fast_path())
         #
         # print("all KGE Archive Catalog tests passed")
         #
@@ -2,19 +2,67 @@ from aiohttp import web
 
 from ..kgea_handlers import (
     get_kge_knowledge_graph_catalog,
+    get_kge_fileset_versions,
     register_kge_knowledge_graph,
     register_kge_file_set,
     publish_kge_file_set
 )
 
 
-async def get_knowledge_graph_catalog(request: web.Request) -> web.Response:
+async def get_knowledge_graph_catalog(
+        request: web.Request,
+        q=None,
+        translator_component=None,
+        translator_team=None,
+        biolink_model_release=None,
+        submitter=None,
+        status=None,
+        limit=None,
+        cursor=None
+) -> web.Response:
     """Returns the catalog of available KGE File Sets
 
     :param request:
     :type request: web.Request
+    :param q: Text searched in the name and description of the knowledge graphs.
+    :type q: str
+    :param translator_component: Translator component of the knowledge graphs.
+    :type translator_component: str
+    :param translator_team: Translator team of the knowledge graphs.
+    :type translator_team: str
+    :param biolink_model_release: Biolink Model release of (a file set of) the knowledge graphs.
+    :type biolink_model_release: str
+    :param submitter: Name or email of the submitter of (a file set of) the knowledge graphs.
+    :type submitter: str
+    :param status: Status of (a file set of) the knowledge graphs.
+    :type status: str
+    :param limit: Maximum number of knowledge graphs returned.
+    :type limit: int
+    :param cursor: Cursor of the page of knowledge graphs returned.
+    :type cursor: str
     """
-    return await get_kge_knowledge_graph_catalog(request)
+    return await get_kge_knowledge_graph_catalog(
+        request,
+        q=q,
+        translator_component=translator_component,
+        translator_team=translator_team,
+        biolink_model_release=biolink_model_release,
+        submitter=submitter,
+        status=status,
+        limit=limit,
+        cursor=cursor
+    )
+
+
+async def get_fileset_versions(request: web.Request, kg_id: str) -> web.Response:
+    """Returns the versions of the KGE File Sets of a knowledge graph
+
+    :param request:
+    :type request: web.Request
+    :param kg_id: KGE Knowledge Graph identifier.
+    :type kg_id: str
+    """
+    return await get_kge_fileset_versions(request, kg_id)
 
 
 async def register_knowledge_graph(request: web.Request):
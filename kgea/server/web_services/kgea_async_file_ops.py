@@ -0,0 +1,317 @@
+"""
+Asynchronous (asyncio) facade over the (synchronous, boto3 based) S3 operations of kgea_file_ops.
+
+The aiohttp request handlers and the KgeArchiver tasks await these wrappers, which run the blocking
+S3 calls on a dedicated, bounded thread pool, rather than directly on the event loop, such that
+one slow S3 response does not stall every other request being served by the application.
+"""
+from typing import List, Dict, Set, Optional, Tuple, Callable, Any, AsyncIterator
+from asyncio import get_event_loop, ensure_future, gather, sleep, create_task, Semaphore, Task, CancelledError
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+
+from kgea.config import get_app_config
+
+from kgea.server.web_services.kgea_file_ops import (
+    default_s3_bucket,
+    object_key_exists,
+    object_keys_in_location,
+    object_keys_for_fileset_version,
+    create_presigned_url,
+    load_s3_text_file,
+    copy_file,
+    aggregate_files,
+    get_url_file_size,
+    create_multipart_upload,
+    upload_part,
+    complete_multipart_upload,
+    abort_multipart_upload,
+    reap_upload_sessions,
+    S3_MIN_PART_SIZE,
+    S3_MAX_PARTS
+)
+
+import logging
+logger = logging.getLogger(__name__)
+
+_KGEA_APP_CONFIG = get_app_config()
+
+# Maximum number of S3 operations concurrently run by the asynchronous S3 facade.
+# The threads of the pool each hold their own pooled S3 client (see AssumeRole.get_client())
+Number_of_S3_Threads = \
+    _KGEA_APP_CONFIG['Number_of_S3_Threads'] if 'Number_of_S3_Threads' in _KGEA_APP_CONFIG else 16
+
+# Size (in megabytes) of the parts of the S3 multipart uploads streamed
+# by the web service handlers, and maximum number of parts of each such
+# upload concurrently in flight to S3 (thus, held in memory)
+Upload_Part_Size = \
+    _KGEA_APP_CONFIG['Upload_Part_Size'] if 'Upload_Part_Size' in _KGEA_APP_CONFIG else 16
+Upload_Parts_In_Flight = \
+    _KGEA_APP_CONFIG['Upload_Parts_In_Flight'] if 'Upload_Parts_In_Flight' in _KGEA_APP_CONFIG else 4
+
+# Maximum size (in megabytes) of the parts (each read in memory) of the resumable upload sessions,
+# and interval (in seconds) between the sweeps of the abandoned upload sessions (0 to disable)
+Upload_Session_Max_Part_Size = \
+    _KGEA_APP_CONFIG['Upload_Session_Max_Part_Size'] if 'Upload_Session_Max_Part_Size' in _KGEA_APP_CONFIG \
+    else 64
+Upload_Session_Reap_Interval = \
+    _KGEA_APP_CONFIG['Upload_Session_Reap_Interval'] if 'Upload_Session_Reap_Interval' in _KGEA_APP_CONFIG \
+    else 3600
+
+_s3_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_s3_executor() -> ThreadPoolExecutor:
+    """
+    :return: (singleton) bounded thread pool executor dedicated to S3 operations
+    """
+    global _s3_executor
+    if not _s3_executor:
+        _s3_executor = ThreadPoolExecutor(max_workers=Number_of_S3_Threads, thread_name_prefix="kgea-s3")
+    return _s3_executor
+
+
+def shutdown_s3_executor():
+    """
+    Shut down the S3 thread pool executor, waiting for pending S3 operations to complete.
+    """
+    global _s3_executor
+    if _s3_executor:
+        _s3_executor.shutdown(wait=True)
+        _s3_executor = None
+
+
+async def run_in_s3_executor(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking (S3) function on the dedicated S3 thread pool.
+
+    :param func: function to run
+    :param args: positional arguments of the function
+    :param kwargs: keyword arguments of the function
+    :return: result of the function
+    """
+    return await get_event_loop().run_in_executor(get_s3_executor(), partial(func, *args, **kwargs))
+
+
+async def async_object_key_exists(object_key, bucket_name=default_s3_bucket, assumed_role=None) -> bool:
+    """
+    Asynchronous object_key_exists().
+    """
+    return await run_in_s3_executor(
+        object_key_exists, object_key, bucket_name=bucket_name, assumed_role=assumed_role
+    )
+
+
+async def async_object_keys_in_location(bucket, object_location='') -> List[str]:
+    """
+    Asynchronous object_keys_in_location().
+    """
+    return await run_in_s3_executor(object_keys_in_location, bucket, object_location=object_location)
+
+
+async def async_object_keys_for_fileset_version(
+        kg_id: str,
+        fileset_version: str,
+        bucket=default_s3_bucket,
+        match_function=lambda x: True
+) -> Tuple[List[str], str]:
+    """
+    Asynchronous object_keys_for_fileset_version().
+    """
+    return await run_in_s3_executor(
+        object_keys_for_fileset_version,
+        kg_id=kg_id,
+        fileset_version=fileset_version,
+        bucket=bucket,
+        match_function=match_function
+    )
+
+
+async def async_create_presigned_url(
+        object_key,
+        bucket=default_s3_bucket,
+        expiration=86400,
+        disposition='attachment'
+) -> Optional[str]:
+    """
+    Asynchronous create_presigned_url().
+    """
+    return await run_in_s3_executor(
+        create_presigned_url, object_key, bucket=bucket, expiration=expiration, disposition=disposition
+    )
+
+
+async def async_load_s3_text_file(bucket_name: str, object_name: str, mode: str = 'text'):
+    """
+    Asynchronous load_s3_text_file().
+    """
+    return await run_in_s3_executor(load_s3_text_file, bucket_name, object_name, mode=mode)
+
+
+async def async_copy_file(source_key, target_dir, bucket=default_s3_bucket):
+    """
+    Asynchronous copy_file().
+    """
+    return await run_in_s3_executor(copy_file, source_key, target_dir, bucket=bucket)
+
+
+async def async_aggregate_files(
+        target_folder,
+        target_name,
+        file_object_keys,
+        bucket=default_s3_bucket,
+        match_function=lambda x: True
+) -> str:
+    """
+    Asynchronous aggregate_files().
+    """
+    return await run_in_s3_executor(
+        aggregate_files,
+        target_folder=target_folder,
+        target_name=target_name,
+        file_object_keys=file_object_keys,
+        bucket=bucket,
+        match_function=match_function
+    )
+
+
+async def async_get_url_file_size(url: str) -> int:
+    """
+    Asynchronous get_url_file_size() (a blocking HTTP HEAD request).
+    """
+    return await run_in_s3_executor(get_url_file_size, url)
+
+
+async def async_stream_to_s3(
+        chunks: AsyncIterator[bytes],
+        object_key: str,
+        bucket: str = default_s3_bucket,
+        expected_size: int = 0,
+        part_size: int = Upload_Part_Size * 1024**2,
+        max_in_flight: int = Upload_Parts_In_Flight,
+        callback: Optional[Callable[[int], None]] = None,
+        executor: Optional[Executor] = None
+) -> int:
+    """
+    Stream a sequence of data chunks (e.g. the body of an HTTP request, as received)
+    into an S3 object, by an S3 multipart upload of fixed size parts. At most 'max_in_flight'
+    parts are concurrently uploaded: the reading of the chunks otherwise waits for the upload
+    of a part to complete, thus at most (max_in_flight + 1) parts are held in memory.
+    The multipart upload is aborted if the stream is not successfully uploaded in full.
+
+    :param chunks: asynchronous iterator of the data chunks to upload
+    :param object_key: target S3 object key of the file
+    :param bucket: Bucket to upload to
+    :param expected_size: (optional) expected number of bytes of the stream; the
+                          parts are made larger than 'part_size' if need be, such that
+                          the stream fits within the maximum number of parts of an S3 object
+    :param part_size: size of the parts of the multipart upload, in bytes
+    :param max_in_flight: maximum number of parts concurrently uploaded
+    :param callback: (optional) function called with the number of bytes of each part uploaded;
+                     any exception it raises (e.g. upon cancellation) aborts the upload
+    :param executor: (optional) executor of the part uploads (default: the S3 thread pool)
+    :return: number of bytes uploaded
+    """
+    if expected_size:
+        part_size = max(part_size, -(-expected_size // S3_MAX_PARTS))
+    part_size = max(part_size, S3_MIN_PART_SIZE)
+
+    upload_id: str = await run_in_s3_executor(create_multipart_upload, bucket, object_key)
+
+    etags: Dict[int, str] = dict()
+    errors: List[Exception] = list()
+    in_flight: Set[Task] = set()
+    slots = Semaphore(max_in_flight)
+    part_number = 0
+    size = 0
+
+    async def send(number: int, data: bytes):
+        try:
+            etags[number] = await get_event_loop().run_in_executor(
+                executor or get_s3_executor(), partial(upload_part, bucket, object_key, upload_id, number, data)
+            )
+            if callback:
+                callback(len(data))
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            slots.release()
+
+    async def flush(data: bytes):
+        nonlocal part_number
+        await slots.acquire()
+        if errors:
+            slots.release()
+            raise errors[0]
+        part_number += 1
+        task = ensure_future(send(part_number, data))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    try:
+        buffer = bytearray()
+        async for chunk in chunks:
+            size += len(chunk)
+            buffer.extend(chunk)
+            while len(buffer) >= part_size:
+                data = bytes(buffer[:part_size])
+                del buffer[:part_size]
+                await flush(data)
+
+        # the last (possibly empty, if the only) part may be smaller than the part size
+        if buffer or not part_number:
+            await flush(bytes(buffer))
+
+        await gather(*in_flight)
+        if errors:
+            raise errors[0]
+
+        await run_in_s3_executor(complete_multipart_upload, bucket, object_key, upload_id, etags)
+
+    except BaseException:
+        # including the cancellation of the calling task (e.g. upon a dropped client connection):
+        # the parts still in flight are waited for, lest they be stored after the abort
+        await gather(*in_flight, return_exceptions=True)
+        await run_in_s3_executor(abort_multipart_upload, bucket, object_key, upload_id)
+        raise
+
+    return size
+
+
+async def upload_session_reaper(interval: int = Upload_Session_Reap_Interval):
+    """
+    Background task periodically aborting the abandoned resumable upload sessions (see reap_upload_sessions()).
+
+    :param interval: number of seconds between the sweeps of the upload sessions
+    """
+    while True:
+        await sleep(interval)
+        try:
+            await run_in_s3_executor(reap_upload_sessions)
+        except Exception as exc:
+            logger.error("upload_session_reaper(): " + str(exc))
+
+
+async def start_upload_session_reaper(app):
+    """
+    Web application startup hook, launching the background upload session reaper task.
+
+    :param app: aiohttp web application
+    """
+    if Upload_Session_Reap_Interval > 0:
+        app['upload_session_reaper'] = create_task(upload_session_reaper())
+
+
+async def stop_upload_session_reaper(app):
+    """
+    Web application cleanup hook, cancelling the background upload session reaper task.
+
+    :param app: aiohttp web application
+    """
+    reaper: Optional[Task] = app.get('upload_session_reaper', None)
+    if reaper:
+        reaper.cancel()
+        try:
+            await reaper
+        except CancelledError:
+            pass
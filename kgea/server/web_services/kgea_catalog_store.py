@@ -0,0 +1,187 @@
+"""
+Pluggable storage backends of the KGE Archive catalog.
+
+The KnowledgeGraphCatalog is held in memory by each web service worker process. A catalog
+store lets several such processes (e.g. aiohttp workers running behind nginx on the same host)
+share one catalog: each worker writes its changes through to the store, and reads the changes
+of the other workers from it. AWS S3 (i.e. the KGE Archive and its catalog index) remains the
+durable source of truth of the catalog; the store is only a shared cache of it.
+
+Catalog entries are JSON serializable dictionaries, as generated by KgeKnowledgeGraph.to_index_entry().
+"""
+from typing import Dict, Optional, Tuple, Any
+from abc import ABC, abstractmethod
+from os import makedirs
+from os.path import dirname, abspath
+from tempfile import gettempdir
+
+import json
+import sqlite3
+import threading
+
+from kgea.config import get_app_config
+
+import logging
+logger = logging.getLogger(__name__)
+
+_KGEA_APP_CONFIG = get_app_config()
+
+# Catalog storage backend: 'memory' (catalog private to each process) or 'sqlite'
+Catalog_Store = \
+    _KGEA_APP_CONFIG['Catalog_Store'] if 'Catalog_Store' in _KGEA_APP_CONFIG else 'memory'
+
+# Local file path of the SQLite catalog store (shared by all the worker processes of the host)
+Catalog_Store_Path = \
+    _KGEA_APP_CONFIG['Catalog_Store_Path'] if 'Catalog_Store_Path' in _KGEA_APP_CONFIG \
+    else f"{gettempdir()}/kgea_catalog.sqlite"
+
+# Number of seconds between the reads of the changes made to the catalog store by the other processes
+Catalog_Store_Sync_Interval = \
+    _KGEA_APP_CONFIG['Catalog_Store_Sync_Interval'] if 'Catalog_Store_Sync_Interval' in _KGEA_APP_CONFIG \
+    else 1.0
+
+
+class CatalogStore(ABC):
+    """
+    Catalog storage backend interface. Each write of a knowledge graph entry
+    is tagged with a new, monotonically increasing, store revision number.
+    """
+    @abstractmethod
+    def get_entry(self, kg_id: str) -> Optional[Dict[str, Any]]:
+        """
+        :param kg_id: knowledge graph identifier
+        :return: catalog entry of the knowledge graph; None if unknown
+        """
+
+    @abstractmethod
+    def put_entry(self, kg_id: str, entry: Dict[str, Any]) -> int:
+        """
+        :param kg_id: knowledge graph identifier
+        :param entry: catalog entry of the knowledge graph
+        :return: store revision of the write
+        """
+
+    @abstractmethod
+    def get_changes(self, since: int = 0) -> Tuple[Dict[str, Tuple[int, Dict[str, Any]]], int]:
+        """
+        :param since: store revision (0 for all entries)
+        :return: 2-tuple of the (store revision, catalog entry) of the knowledge graphs
+                 written after the given store revision (indexed by kg_id), and the current store revision
+        """
+
+    def close(self):
+        """
+        Release the resources of the store.
+        """
+        pass
+
+
+class SqliteCatalogStore(CatalogStore):
+    """
+    Catalog store shared by the processes of a host, as a SQLite database in WAL mode
+    (thus, with concurrent readers not blocked by the (single) writer).
+    """
+    def __init__(self, path: str = Catalog_Store_Path, timeout: float = 30.0):
+        """
+        :param path: local file path of the SQLite database
+        :param timeout: number of seconds to wait for the database lock of another writer
+        """
+        self.path = path
+        self.timeout = timeout
+
+        # SQLite connections may not be shared between threads
+        self._connections = threading.local()
+
+        makedirs(dirname(abspath(path)), exist_ok=True)
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS knowledge_graphs (" +
+                "kg_id TEXT PRIMARY KEY, revision INTEGER NOT NULL, entry TEXT NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS knowledge_graphs_revision ON knowledge_graphs (revision)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._connections, 'connection', None)
+        if not connection:
+            # autocommit mode: transactions are explicitly started below
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connections.connection = connection
+        return connection
+
+    def get_entry(self, kg_id: str) -> Optional[Dict[str, Any]]:
+        """
+        :param kg_id: knowledge graph identifier
+        :return: catalog entry of the knowledge graph; None if unknown
+        """
+        row = self._connection().execute(
+            "SELECT entry FROM knowledge_graphs WHERE kg_id = ?", (kg_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_entry(self, kg_id: str, entry: Dict[str, Any]) -> int:
+        """
+        :param kg_id: knowledge graph identifier
+        :param entry: catalog entry of the knowledge graph
+        :return: store revision of the write
+        """
+        text = json.dumps(entry)
+        connection = self._connection()
+        # BEGIN IMMEDIATE takes the write lock up front, thus
+        # store revisions are unique across all the processes
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            revision: int = connection.execute(
+                "SELECT COALESCE(MAX(revision), 0) + 1 FROM knowledge_graphs"
+            ).fetchone()[0]
+            connection.execute(
+                "INSERT OR REPLACE INTO knowledge_graphs (kg_id, revision, entry) VALUES (?, ?, ?)",
+                (kg_id, revision, text)
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return revision
+
+    def get_changes(self, since: int = 0) -> Tuple[Dict[str, Tuple[int, Dict[str, Any]]], int]:
+        """
+        :param since: store revision (0 for all entries)
+        :return: 2-tuple of the (store revision, catalog entry) of the knowledge graphs
+                 written after the given store revision (indexed by kg_id), and the current store revision
+        """
+        changes: Dict[str, Tuple[int, Dict[str, Any]]] = dict()
+        current: int = since
+        rows = self._connection().execute(
+            "SELECT kg_id, revision, entry FROM knowledge_graphs WHERE revision > ? ORDER BY revision", (since,)
+        ).fetchall()
+        for kg_id, revision, text in rows:
+            changes[kg_id] = (revision, json.loads(text))
+            current = max(current, revision)
+        return changes, current
+
+    def close(self):
+        """
+        Close the SQLite connection of the calling thread.
+        """
+        connection: Optional[sqlite3.Connection] = getattr(self._connections, 'connection', None)
+        if connection:
+            connection.close()
+            self._connections.connection = None
+
+
+def get_catalog_store() -> Optional[CatalogStore]:
+    """
+    :return: the catalog store configured by 'Catalog_Store'; None if the catalog is only held in memory
+    """
+    if Catalog_Store == 'sqlite':
+        logger.info(f"Catalog shared through the SQLite catalog store '{Catalog_Store_Path}'")
+        return SqliteCatalogStore(Catalog_Store_Path)
+    elif Catalog_Store != 'memory':
+        logger.warning(f"Unknown Catalog_Store '{Catalog_Store}'... catalog only held in memory!")
+    return None
@@ -8,25 +8,29 @@ o  Test the system (both manually, by visual inspection of uploads)
 Stress test using SRI SemMedDb: https://github.com/NCATSTranslator/semmeddb-biolink-kg
 """
 from sys import stderr, exc_info
-from typing import Union, List, Tuple, Dict, Optional
+from typing import Union, List, Tuple, Dict, Optional, Iterator, Callable, Any
 from subprocess import Popen, PIPE, STDOUT
 from os import getenv
 from os.path import sep, splitext, basename, dirname, abspath
 import io
+import json
 
 from pprint import PrettyPrinter
 
 import random
 
 import re
-import itertools
 
 import traceback
 import logging
 
 import requests
 import smart_open
-from datetime import datetime
+from datetime import datetime, timezone
+from time import sleep, time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import threading
 
 from pathlib import Path
 import tarfile
@@ -39,14 +43,22 @@ except ImportError:
     from yaml import Loader, Dumper
 
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from boto3.s3.transfer import TransferConfig
 
 from kgea.aws.assume_role import AssumeRole, aws_config
 
 from kgea.config import (
+    get_app_config,
     PROVIDER_METADATA_FILE,
     FILE_SET_METADATA_FILE
 )
+from kgea.server.web_services.kgea_metadata_codec import (
+    METADATA_SIDECAR_SUFFIX,
+    get_sidecar_object_key,
+    is_sidecar_object_key,
+    decode_metadata_sidecar
+)
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +72,49 @@ default_s3_region = s3_config['region']
 default_s3_bucket = s3_config['bucket']
 default_s3_root_key = s3_config['archive-directory']
 
+# Archive subfolders whose names start with this prefix hold internal
+# KGE Archive system data (e.g. the catalog index), not knowledge graphs
+SYSTEM_FOLDER_PREFIX = '_'
+
+# Persisted (JSON) index of the KnowledgeGraphCatalog, allowing for catalog
+# startup with a single S3 GET, rather than a full scan of the bucket contents
+CATALOG_INDEX_KEY = f"{default_s3_root_key}/{SYSTEM_FOLDER_PREFIX}catalog/index.json"
+
+# Persisted (JSON) records of the resumable upload sessions, indexed by upload token,
+# such that the sessions survive restarts of the application (see save_upload_session())
+UPLOAD_SESSIONS_PREFIX = f"{default_s3_root_key}/{SYSTEM_FOLDER_PREFIX}uploads/"
+
+_KGEA_APP_CONFIG = get_app_config()
+
+# Maximum number of concurrent S3 requests (and retries per object)
+# used to load the KGE Archive metadata files during catalog loading
+Catalog_Fetch_Concurrency = \
+    _KGEA_APP_CONFIG['Catalog_Fetch_Concurrency'] if 'Catalog_Fetch_Concurrency' in _KGEA_APP_CONFIG else 16
+
+Catalog_Fetch_Retries = \
+    _KGEA_APP_CONFIG['Catalog_Fetch_Retries'] if 'Catalog_Fetch_Retries' in _KGEA_APP_CONFIG else 2
+
+# Time-to-live (seconds) and maximum number of cached S3 object listings (a zero TTL disables the cache)
+Listing_Cache_TTL = \
+    _KGEA_APP_CONFIG['Listing_Cache_TTL'] if 'Listing_Cache_TTL' in _KGEA_APP_CONFIG else 60
+
+Listing_Cache_Size = \
+    _KGEA_APP_CONFIG['Listing_Cache_Size'] if 'Listing_Cache_Size' in _KGEA_APP_CONFIG else 1024
+
+# Presigned URLs are cached until this number of seconds before their expiry
+Presigned_URL_Margin = \
+    _KGEA_APP_CONFIG['Presigned_URL_Margin'] if 'Presigned_URL_Margin' in _KGEA_APP_CONFIG else 300
+
+Presigned_URL_Cache_Size = \
+    _KGEA_APP_CONFIG['Presigned_URL_Cache_Size'] if 'Presigned_URL_Cache_Size' in _KGEA_APP_CONFIG else 4096
+
+# Number of seconds without any uploaded part after which a resumable upload session is aborted
+Upload_Session_Timeout = \
+    _KGEA_APP_CONFIG['Upload_Session_Timeout'] if 'Upload_Session_Timeout' in _KGEA_APP_CONFIG else 86400
+
+# Assumed lifetime (seconds) of signing credentials of unknown expiration, e.g. EC2 instance profile credentials
+_UNKNOWN_CREDENTIALS_LIFETIME = 3600
+
 # TODO: may need to fix script paths below - may not resolve under Microsoft Windows
 # if sys.platform is 'win32':
 #     archive_script = archive_script.replace('\\', '/').replace('C:', '/mnt/c/')
@@ -260,7 +315,7 @@ def s3_client(
     """
     :param assumed_role:
     :param config:
-    :return: S3 client
+    :return: S3 client, pooled per thread (see AssumeRole.get_client())
     """
     
     if not assumed_role:
@@ -291,6 +346,7 @@ def create_location(bucket, kg_id):
     :param kg_id:
     :return:
     """
+    invalidate_listing_cache(bucket, get_object_location(kg_id))
     return s3_client().put_object(Bucket=bucket, Key=get_object_location(kg_id))
 
 
@@ -387,13 +443,14 @@ def object_key_exists(
     """
     if not object_key:
         return False
-    return any(
-        match_objects_from_bucket(
-            bucket_name=bucket_name,
-            object_key=object_key,
-            assumed_role=assumed_role
-        )
-    )
+    try:
+        # a single HEAD request, rather than a listing of all the objects matching the key as a prefix
+        s3_client(assumed_role=assumed_role).head_object(Bucket=bucket_name, Key=object_key)
+    except ClientError as ce:
+        if ce.response['Error']['Code'] not in ['404', 'NoSuchKey']:
+            logger.warning(f"object_key_exists('{object_key}'): {str(ce)}")
+        return False
+    return True
 
 
 def location_available(bucket_name, object_key) -> bool:
@@ -415,27 +472,164 @@ def location_available(bucket_name, object_key) -> bool:
         return True
 
 
+class ListingCache:
+    """
+    Bounded (least recently used) in-process cache, with time-to-live
+    expiration, of S3 object listings, keyed by (bucket, prefix).
+    Writes to S3 made through this module invalidate the affected prefixes.
+    """
+    def __init__(self, ttl: float = Listing_Cache_TTL, max_size: int = Listing_Cache_Size):
+        """
+        :param ttl: time-to-live of a cached listing (in seconds); caching is disabled if zero
+        :param max_size: maximum number of cached listings
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._listings: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, bucket: str, prefix: str) -> Optional[Dict[str, int]]:
+        """
+        :param bucket:
+        :param prefix:
+        :return: cached listing of object entries with their size; None if not cached or expired
+        """
+        key = (bucket, prefix)
+        with self._lock:
+            if key in self._listings:
+                timestamp, listing = self._listings[key]
+                if time() - timestamp < self.ttl:
+                    self._listings.move_to_end(key)
+                    self.hits += 1
+                    return listing
+                del self._listings[key]
+            self.misses += 1
+        return None
+
+    def put(self, bucket: str, prefix: str, listing: Dict[str, int]):
+        """
+        :param bucket:
+        :param prefix:
+        :param listing: object entries with their size
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._listings[(bucket, prefix)] = (time(), listing)
+            self._listings.move_to_end((bucket, prefix))
+            while len(self._listings) > self.max_size:
+                self._listings.popitem(last=False)
+
+    def invalidate(self, bucket: str, location: str = ''):
+        """
+        Discard all cached listings which may include a given object key or 'folder' location.
+
+        :param bucket:
+        :param location: object key or 'folder' location written to (whole bucket if empty)
+        """
+        with self._lock:
+            for key in list(self._listings.keys()):
+                cached_bucket, prefix = key
+                if cached_bucket == bucket and (location.startswith(prefix) or prefix.startswith(location)):
+                    del self._listings[key]
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        :return: dictionary of listing cache hit and miss counts, and current number of cached listings
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._listings)
+            }
+
+
+_listing_cache = ListingCache()
+
+
+def invalidate_listing_cache(bucket: str, location: str = ''):
+    """
+    Signal a write to S3 of an object key (or to a 'folder' location),
+    such that cached S3 object listings including it are discarded.
+
+    :param bucket:
+    :param location: object key or 'folder' location written to (whole bucket if empty)
+    """
+    _listing_cache.invalidate(bucket, location)
+
+
+def get_listing_cache_statistics() -> Dict[str, int]:
+    """
+    :return: S3 object listing cache hit and miss counts
+    """
+    return _listing_cache.statistics()
+
+
+def iter_object_entries(bucket, prefix='', client=None) -> Iterator[Dict]:
+    """
+    Streams the S3 object entries whose object keys start with a given prefix,
+    one page of the listing at a time (thus, never holding the full listing in memory).
+
+    :param bucket: The bucket
+    :param prefix: object key prefix (the whole bucket is listed if empty)
+    :param client: (optional) S3 client to use
+    :return: iterator over S3 object entries (dictionaries with 'Key', 'Size', 'LastModified', etc.)
+    """
+    paginator = (client if client else s3_client()).get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for entry in page.get('Contents', []):
+            yield entry
+
+
+def iter_common_prefixes(bucket, prefix='', delimiter='/', client=None) -> Iterator[str]:
+    """
+    Streams the S3 'folders' immediately below a given prefix. Only the
+    folder prefixes are listed, not the objects contained in the folders.
+
+    :param bucket: The bucket
+    :param prefix: object key prefix of the parent 'folder' (should end with the delimiter)
+    :param delimiter: S3 'folder' path delimiter
+    :param client: (optional) S3 client to use
+    :return: iterator over 'folder' prefixes, e.g. 'kge-data/kg_id/' for prefix 'kge-data/'
+    """
+    paginator = (client if client else s3_client()).get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter=delimiter):
+        for common_prefix in page.get('CommonPrefixes', []):
+            yield common_prefix['Prefix']
+
+
+def iter_folder_names(bucket, prefix='', delimiter='/', client=None) -> Iterator[str]:
+    """
+    :param bucket: The bucket
+    :param prefix: object key prefix of the parent 'folder' (should end with the delimiter)
+    :param delimiter: S3 'folder' path delimiter
+    :param client: (optional) S3 client to use
+    :return: iterator over the names of the 'folders' immediately below the prefix, e.g. 'kg_id'
+    """
+    for folder_prefix in iter_common_prefixes(bucket, prefix=prefix, delimiter=delimiter, client=client):
+        yield folder_prefix[len(prefix):].rstrip(delimiter)
+
+
 def object_entries_in_location(bucket, object_location='') -> Dict[str, int]:
     """
     :param bucket:
-    :param object_location:
+    :param object_location: object key prefix; 'folder' locations should end with '/'
     :return: dictionary of object entries with their size in specified
              object location in a bucket (all bucket entries if object_location is empty)
     """
-    bucket_listings: Dict = dict()
-    # logger.debug(s3_client().get_paginator("list_objects_v2").paginate(Bucket=bucket_name))
-    for p in s3_client().get_paginator("list_objects_v2").paginate(Bucket=bucket):
-        if 'Contents' in p:
-            for entry in p['Contents']:
-                bucket_listings[entry['Key']] = entry['Size']
-        else:
-            return {}  # empty bucket?
+    listing: Optional[Dict[str, int]] = _listing_cache.get(bucket, object_location)
+    if listing is None:
+        listing = {
+            entry['Key']: entry['Size']
+            for entry in iter_object_entries(bucket, prefix=object_location)
+        }
+        _listing_cache.put(bucket, object_location, listing)
 
-    # If object_location is the empty string, then each object
-    # listed passes (since the empty string is part of every string)
-    object_matches = {key: bucket_listings[key] for key in bucket_listings if object_location in key}
-    
-    return object_matches
+    # callers get their own copy of the (possibly cached) listing
+    return dict(listing)
 
 
 def object_keys_in_location(bucket, object_location='') -> List[str]:
@@ -512,71 +706,148 @@ def object_folder_contents_size(
     return total_size
 
 
-# for an s3 key, match on kg_id
-kg_ids_pattern = re.compile(rf"{default_s3_root_key}/([a-zA-Z\d \-]+)/.+")
-
-# for an s3 key, match on kg_id and fileset version
-kg_ids_with_versions_pattern = re.compile(rf"{default_s3_root_key}/([\S]+)/(\d+.\d+)/")
+# for a version folder name, match on fileset version
+fileset_version_pattern = re.compile(r"\d+\.\d+")
 
 
-def get_fileset_versions_available(bucket_name):
+def get_fileset_versions_available(bucket_name, kg_id: Optional[str] = None) -> Dict[str, List[str]]:
     """
     A roster of all the versions that all knowledge graphs have been updated to.
 
-    Input:
-        - A list of object keys in S3 encoding knowledge graph objects
-    Output:
-        - A map of knowledge graph names to a list of their versions
-    Tasks:
-        - Extract the version from the knowledge graph path
-        - Reduce the versions by knowledge graph name (a grouping)
-        - Filter out crud data (like NoneTypes) to guarantee portability between server and client
+    Only the S3 'folder' prefixes of the knowledge graphs and
+    their versions are listed, not the files that they contain.
 
     :param bucket_name:
-    :return versions_per_kg: dict
+    :param kg_id: (optional) only list the versions of this knowledge graph
+    :return versions_per_kg: dict of knowledge graph identifiers, each with its list of file set versions
     """
+    if kg_id:
+        kg_ids = [kg_id]
+    else:
+        kg_ids = [
+            folder for folder in iter_folder_names(bucket_name, prefix=f"{default_s3_root_key}/")
+            if not folder.startswith(SYSTEM_FOLDER_PREFIX)
+        ]
 
-    all_kge_archive_files = \
-        object_entries_in_location(
-            bucket=bucket_name,
-            object_location=default_s3_root_key
-        )
+    versions_per_kg: Dict[str, List[str]] = dict()
+    for kg in kg_ids:
+        versions = [
+            folder for folder in iter_folder_names(bucket_name, prefix=get_object_location(kg))
+            if fileset_version_pattern.fullmatch(folder)
+        ]
+        versions_per_kg[kg] = versions
 
-    # create a map of kg_ids and their versions
-    kg_ids = set(kg_ids_pattern.match(kg_file).group(1) for kg_file in all_kge_archive_files if
-                 kg_ids_pattern.match(kg_file) is not None)  # some kg_ids don't have versions
-    
-    versions_per_kg = {}
-    version_kg_pairs = set(
-        (
-            kg_ids_with_versions_pattern.match(kg_file).group(1),
-            kg_ids_with_versions_pattern.match(kg_file).group(2)
-        ) for kg_file in all_kge_archive_files if kg_ids_with_versions_pattern.match(kg_file) is not None)
+    logger.debug(f"get_fileset_versions_available(): {versions_per_kg}")
 
-    pp.pprint({"Knowledge Graphs": kg_ids, "File Set Versions": version_kg_pairs})
+    return versions_per_kg
 
-    for key, group in itertools.groupby(version_kg_pairs, lambda x: x[0]):
-        versions_per_kg[key] = []
-        for thing in group:
-            versions_per_kg[key].append(thing[1])
 
-    # add kg_ids that became filtered
-    for kg_id in kg_ids:
-        if kg_id not in versions_per_kg:
-            versions_per_kg[kg_id] = []
+class PresignedUrlCache:
+    """
+    Bounded (least recently used) cache of presigned URLs, keyed by
+    (bucket, object key, content disposition, expiration). A cached URL is discarded
+    a safety margin before its expiry or as soon as the signing credentials are renewed.
+    """
+    def __init__(self, margin: float = Presigned_URL_Margin, max_size: int = Presigned_URL_Cache_Size):
+        """
+        :param margin: number of seconds before the expiry of a URL that it is no longer served from the cache
+        :param max_size: maximum number of cached URLs
+        """
+        self.margin = margin
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._urls: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, credentials_token, now: float) -> Optional[str]:
+        """
+        :param key: (bucket, object key, content disposition, expiration) of the URL
+        :param credentials_token: token identifying the current signing credentials
+        :param now: current timestamp
+        :return: cached presigned URL; None if not cached, expired or signed with previous credentials
+        """
+        with self._lock:
+            if key in self._urls:
+                url, token, valid_until = self._urls[key]
+                if token == credentials_token and now < valid_until:
+                    self._urls.move_to_end(key)
+                    self.hits += 1
+                    return url
+                del self._urls[key]
+            self.misses += 1
+        return None
+
+    def put(self, key: Tuple, url: str, credentials_token, expiry: float, now: float):
+        """
+        :param key: (bucket, object key, content disposition, expiration) of the URL
+        :param url: presigned URL
+        :param credentials_token: token identifying the signing credentials
+        :param expiry: timestamp of the expiry of the URL
+        :param now: current timestamp
+        """
+        valid_until = expiry - self.margin
+        if valid_until <= now:
+            return
+        with self._lock:
+            self._urls[key] = (url, credentials_token, valid_until)
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.max_size:
+                self._urls.popitem(last=False)
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        :return: dictionary of presigned URL cache hit and miss counts, and current number of cached URLs
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._urls)
+            }
 
-    return versions_per_kg
+
+_presigned_url_cache = PresignedUrlCache()
+
+
+def get_presigned_url_cache_statistics() -> Dict[str, int]:
+    """
+    :return: presigned URL cache hit and miss counts
+    """
+    return _presigned_url_cache.statistics()
 
 
 # TODO: clarify expiration time - default to 1 day (in seconds)
-def create_presigned_url(object_key, bucket=default_s3_bucket, expiration=86400) -> Optional[str]:
+def create_presigned_url(
+        object_key,
+        bucket=default_s3_bucket,
+        expiration=86400,
+        disposition='attachment'
+) -> Optional[str]:
     """Generate a pre-signed URL to share an S3 object
 
+    The URL is signed locally, with the pooled S3 client, then cached until a safety margin before
+    its expiry, which is the earlier of the requested expiration and the expiration of the (temporary)
+    signing credentials. Thus, a returned URL remains valid at least Presigned_URL_Margin seconds.
+
     :param object_key: string
     :param bucket: string
     :param expiration: Time in seconds for the pre-signed URL to remain valid
+    :param disposition: ResponseContentDisposition of the S3 object download
     :return: Presigned URL as string. If error, returns None.
     """
+    now = time()
+    key = (bucket, object_key, disposition, expiration)
+
+    try:
+        credentials_token, credentials_expiry = the_role.get_credentials_state()
+    except Exception as e:
+        logger.error("create_presigned_url() credentials error: " + str(e))
+        return None
+
+    endpoint = _presigned_url_cache.get(key, credentials_token, now)
+    if endpoint:
+        return endpoint
 
     # Generate a pre-signed URL for the S3 object
     # https://stackoverflow.com/a/52642792
@@ -589,7 +860,7 @@ def create_presigned_url(object_key, bucket=default_s3_bucket, expiration=86400)
             Params={
                 'Bucket': bucket,
                 'Key': object_key,
-                'ResponseContentDisposition': 'attachment',
+                'ResponseContentDisposition': disposition,
             },
             ExpiresIn=expiration
         )
@@ -597,6 +868,15 @@ def create_presigned_url(object_key, bucket=default_s3_bucket, expiration=86400)
         logger.error("create_presigned_url() error: " + str(e))
         return None
 
+    # A URL stops working when the credentials which signed it expire
+    expiry = now + expiration
+    if credentials_expiry:
+        expiry = min(expiry, credentials_expiry)
+    else:
+        expiry = min(expiry, now + _UNKNOWN_CREDENTIALS_LIFETIME)
+
+    _presigned_url_cache.put(key, endpoint, credentials_token, expiry, now)
+
     # The endpoint contains the pre-signed URL
     return endpoint
 
@@ -648,7 +928,7 @@ def get_object_key(object_location, filename):
     return f"{object_location}{Path(filename).stem}{splitext(filename)[1]}"
 
 
-def upload_file(bucket, object_key, source, client=s3_client(), config=None, callback=None):
+def upload_file(bucket, object_key, source, client=None, config=None, callback=None):
     """
     Upload a file to an S3 bucket. Note that this method is
     totally agnostic as to specific (KGX) file format and content.
@@ -656,12 +936,14 @@ def upload_file(bucket, object_key, source, client=s3_client(), config=None, cal
     :param bucket: Bucket to upload to
     :param object_key: target S3 object key of the file.
     :param source: file to be uploaded (can be read in binary mode)
-    :param client: The s3 client to use. Useful if needing to make a new client for the sake of thread safety.
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
     :param config: a means of configuring the network call
     :param callback: an object that implements __call__, that runs on each file block uploaded (receiving byte data.)
 
     :raises RuntimeError if the S3 file object upload call fails
     """
+    if not client:
+        client = s3_client()
 
     # Upload the file
     try:
@@ -674,6 +956,8 @@ def upload_file(bucket, object_key, source, client=s3_client(), config=None, cal
     except Exception as exc:
         logger.warning("kgea_file_ops.upload_file(): " + str(exc))
         # TODO: what sort of post-cancellation processing is needed here?
+    finally:
+        invalidate_listing_cache(bucket, object_key)
 
 
 def upload_file_multipart(
@@ -683,7 +967,7 @@ def upload_file_multipart(
         object_location,
         metadata=None,
         callback=None,
-        client=s3_client()
+        client=None
 ):
     """Upload a file to an S3 bucket. Use multipart protocols.
     Multipart transfers occur when the file size exceeds the value of the multipart_threshold attribute
@@ -694,7 +978,7 @@ def upload_file_multipart(
     :param object_location: S3 object name
     :param metadata: metadata associated with the file
     :param callback: Callable to track number of bytes being uploaded
-    :param client: The s3 client to use. Useful if needing to make a new client for the sake of thread safety.
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
     """
 
     """
@@ -734,6 +1018,212 @@ def upload_file_multipart(
     return object_key
 
 
+# Limits of the S3 multipart upload protocol
+S3_MIN_PART_SIZE = 5 * 1024**2  # of all the parts, except the last one
+S3_MAX_PARTS = 10000
+
+
+def create_multipart_upload(bucket: str, object_key: str, client=None) -> str:
+    """
+    Initiate an S3 multipart upload, whose parts are then uploaded by upload_part().
+
+    :param bucket: Bucket to upload to
+    :param object_key: target S3 object key of the file
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
+    :return: identifier of the multipart upload
+    """
+    if not client:
+        client = s3_client()
+    return client.create_multipart_upload(Bucket=bucket, Key=object_key)['UploadId']
+
+
+def upload_part(bucket: str, object_key: str, upload_id: str, part_number: int, data: bytes, client=None) -> str:
+    """
+    Upload a part of an S3 multipart upload.
+
+    :param bucket: Bucket to upload to
+    :param object_key: target S3 object key of the file
+    :param upload_id: identifier of the multipart upload
+    :param part_number: number of the part, from 1 to S3_MAX_PARTS
+    :param data: contents of the part
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
+    :return: ETag of the part
+    """
+    if not client:
+        client = s3_client()
+    response = client.upload_part(
+        Bucket=bucket,
+        Key=object_key,
+        UploadId=upload_id,
+        PartNumber=part_number,
+        Body=data
+    )
+    return response['ETag']
+
+
+def complete_multipart_upload(bucket: str, object_key: str, upload_id: str, etags: Dict[int, str], client=None):
+    """
+    Complete an S3 multipart upload, thus creating the S3 object from its parts.
+
+    :param bucket: Bucket to upload to
+    :param object_key: target S3 object key of the file
+    :param upload_id: identifier of the multipart upload
+    :param etags: ETags of the uploaded parts, indexed by part number
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
+    """
+    if not client:
+        client = s3_client()
+    try:
+        client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=object_key,
+            UploadId=upload_id,
+            MultipartUpload={
+                'Parts': [
+                    {'PartNumber': part_number, 'ETag': etags[part_number]}
+                    for part_number in sorted(etags.keys())
+                ]
+            }
+        )
+    finally:
+        invalidate_listing_cache(bucket, object_key)
+
+
+def abort_multipart_upload(bucket: str, object_key: str, upload_id: str, client=None):
+    """
+    Abort an S3 multipart upload, thus discarding its uploaded parts.
+
+    :param bucket: Bucket to upload to
+    :param object_key: target S3 object key of the file
+    :param upload_id: identifier of the multipart upload
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
+    """
+    if not client:
+        client = s3_client()
+    try:
+        client.abort_multipart_upload(Bucket=bucket, Key=object_key, UploadId=upload_id)
+    except ClientError as ce:
+        # the parts of an unknown (e.g. already aborted) multipart upload are already gone
+        logger.warning(f"abort_multipart_upload('{object_key}'): {str(ce)}")
+
+
+def list_multipart_parts(bucket: str, object_key: str, upload_id: str, client=None) -> Dict[int, Dict]:
+    """
+    List the parts already stored by S3 for a multipart upload.
+
+    :param bucket: Bucket uploaded to
+    :param object_key: target S3 object key of the file
+    :param upload_id: identifier of the multipart upload
+    :param client: The s3 client to use (default: the pooled s3_client() of the current thread)
+    :return: S3 part entries (dictionaries with 'ETag', 'Size' and 'LastModified'), indexed by part number
+
+    :raises ClientError if the multipart upload is unknown (e.g. already completed or aborted)
+    """
+    if not client:
+        client = s3_client()
+    parts: Dict[int, Dict] = dict()
+    paginator = client.get_paginator("list_parts")
+    for page in paginator.paginate(Bucket=bucket, Key=object_key, UploadId=upload_id):
+        for part in page.get('Parts', []):
+            parts[part['PartNumber']] = part
+    return parts
+
+
+def get_upload_session_key(upload_token: str) -> str:
+    """
+    :param upload_token: upload token of a resumable upload session
+    :return: S3 object key of the record of the upload session
+    """
+    return f"{UPLOAD_SESSIONS_PREFIX}{upload_token}.json"
+
+
+def save_upload_session(upload_token: str, session: Dict, bucket_name: str = default_s3_bucket):
+    """
+    Persist the record of a resumable upload session.
+
+    :param upload_token: upload token of the upload session
+    :param session: record of the upload session (must be JSON serializable)
+    :param bucket_name: The bucket
+    """
+    object_key = get_upload_session_key(upload_token)
+    try:
+        s3_client().put_object(
+            Bucket=bucket_name,
+            Key=object_key,
+            Body=json.dumps(session).encode('utf-8'),
+            ContentType='application/json'
+        )
+    finally:
+        invalidate_listing_cache(bucket_name, object_key)
+
+
+def load_upload_session(upload_token: str, bucket_name: str = default_s3_bucket) -> Optional[Dict]:
+    """
+    :param upload_token: upload token of a resumable upload session
+    :param bucket_name: The bucket
+    :return: record of the upload session; None if unknown (e.g. completed, aborted or reaped)
+    """
+    object_key = get_upload_session_key(upload_token)
+    try:
+        response = s3_client().get_object(Bucket=bucket_name, Key=object_key)
+        return json.loads(response['Body'].read().decode('utf-8'))
+    except ClientError as ce:
+        if ce.response['Error']['Code'] not in ['404', 'NoSuchKey']:
+            logger.warning(f"load_upload_session(): '{object_key}' not loaded: {str(ce)}")
+    return None
+
+
+def delete_upload_session(upload_token: str, bucket_name: str = default_s3_bucket):
+    """
+    Delete the record of a (completed or aborted) resumable upload session.
+
+    :param upload_token: upload token of the upload session
+    :param bucket_name: The bucket
+    """
+    object_key = get_upload_session_key(upload_token)
+    try:
+        s3_client().delete_object(Bucket=bucket_name, Key=object_key)
+    finally:
+        invalidate_listing_cache(bucket_name, object_key)
+
+
+def reap_upload_sessions(timeout: int = Upload_Session_Timeout, bucket_name: str = default_s3_bucket) -> int:
+    """
+    Abort the abandoned resumable upload sessions, i.e. those without any part uploaded
+    (nor the session opened) during the given number of seconds, thus discarding their parts.
+
+    :param timeout: number of seconds of inactivity after which an upload session is abandoned
+    :param bucket_name: The bucket
+    :return: number of upload sessions aborted
+    """
+    now = datetime.now(timezone.utc)
+    reaped = 0
+    for entry in iter_object_entries(bucket_name, prefix=UPLOAD_SESSIONS_PREFIX):
+        last_activity: datetime = entry['LastModified']
+        if (now - last_activity).total_seconds() < timeout:
+            continue
+
+        upload_token = entry['Key'][len(UPLOAD_SESSIONS_PREFIX):-len('.json')]
+        session: Optional[Dict] = load_upload_session(upload_token, bucket_name=bucket_name)
+        if session:
+            try:
+                parts = list_multipart_parts(bucket_name, session['object_key'], session['upload_id'])
+                for part in parts.values():
+                    last_activity = max(last_activity, part['LastModified'])
+                if (now - last_activity).total_seconds() < timeout:
+                    continue
+                abort_multipart_upload(bucket_name, session['object_key'], session['upload_id'])
+            except ClientError as ce:
+                # the multipart upload is already gone: only its record remains
+                logger.warning(f"reap_upload_sessions(): upload session '{upload_token}': {str(ce)}")
+
+        delete_upload_session(upload_token, bucket_name=bucket_name)
+        logger.info(f"reap_upload_sessions(): abandoned upload session '{upload_token}' aborted")
+        reaped += 1
+
+    return reaped
+
+
 async def compress_fileset(
         kg_id,
         version,
@@ -761,6 +1251,9 @@ async def compress_fileset(
     except Exception as e:
         logger.error(f"compress_fileset({s3_archive_key}) exception: {str(e)}")
 
+    # the archiver script writes the aggregated files, archive and its SHA1 hash into the file set folder
+    invalidate_listing_cache(bucket, f"{root}/{kg_id}/{version}/")
+
     logger.info(f"Exiting compress_fileset({s3_archive_key})")
     
     return s3_archive_key
@@ -834,6 +1327,9 @@ async def extract_data_archive(
         
     except Exception as e:
         logger.error(f"decompress_in_place({archive_filename}.tar.gz): exception {str(e)}")
+
+    # the extracted files are written into the file set folder
+    invalidate_listing_cache(bucket, f"{root_directory}/{kg_id}/{file_set_version}/")
     
     logger.debug(f"Exiting decompress_in_place({archive_filename}.tar.gz)")
 
@@ -1075,6 +1571,8 @@ def aggregate_files(
                 if index < (len(file_object_keys) - 1):  # only add newline if it isn't the last file. -1 for zero index
                     aggregated_file.write("\n")
 
+    invalidate_listing_cache(bucket, f"{target_folder}/{target_name}")
+
     return agg_path
 
 
@@ -1105,48 +1603,136 @@ def copy_file(
     }
     s3_client().copy(copy_source, bucket, target_key)
 
+    invalidate_listing_cache(bucket, target_key)
+
     logger.debug(f"...copy completed!")
 
 
-def load_s3_text_file(bucket_name: str, object_name: str, mode: str = 'text') -> Union[None, bytes, str]:
+def _download_s3_object(client, bucket_name: str, object_name: str) -> bytes:
+    """
+    Download the bytes of a (small) S3 object into memory. Exceptions are propagated to the caller.
+    """
+    mf = io.BytesIO()
+    client.download_fileobj(
+        bucket_name,
+        object_name,
+        mf
+    )
+    data_bytes = mf.getvalue()
+    mf.close()
+    return data_bytes
+
+
+def load_s3_text_file(
+        bucket_name: str,
+        object_name: str,
+        mode: str = 'text',
+        client=None
+) -> Union[None, bytes, str]:
     """
     Given an S3 object key name, load the specific file.
     The return value defaults to being decoded from utf-8 to a text string.
     Return None the object is inaccessible.
+
+    :param bucket_name: The bucket
+    :param object_name: The object key of the file
+    :param mode: 'text' for a utf-8 decoded string; otherwise, the raw bytes are returned
+    :param client: (optional) S3 client to use; a default client is created if not given
     """
     data_string: Union[None, bytes, str] = None
 
     try:
-        mf = io.BytesIO()
-        s3_client().download_fileobj(
-            bucket_name,
-            object_name,
-            mf
-        )
-        data_bytes = mf.getvalue()
-        mf.close()
+        data_bytes = _download_s3_object(client if client else s3_client(), bucket_name, object_name)
         if mode == 'text':
             data_string = data_bytes.decode('utf-8')
+        else:
+            data_string = data_bytes
     except Exception as e:
         logger.error(f"ERROR: _load_s3_text_file('{str(e)}')")
 
     return data_string
 
 
-def get_archive_contents(bucket_name: str) -> \
+def load_s3_text_files(
+        bucket_name: str,
+        object_names: List[str],
+        max_workers: int = Catalog_Fetch_Concurrency,
+        retries: int = Catalog_Fetch_Retries
+) -> Dict[str, Optional[str]]:
+    """
+    Concurrently load a collection of (small) utf-8 text files from S3, with a bounded
+    number of parallel requests shared over a single S3 client connection pool.
+    Each object fetch is retried, with exponential backoff, upon failure.
+
+    :param bucket_name: The bucket
+    :param object_names: list of object keys of the files to load
+    :param max_workers: maximum number of concurrent S3 GET requests
+    :param retries: number of retries of each failed S3 GET request
+    :return: dictionary of file text contents (None if inaccessible) indexed by object key
+    """
+    if not object_names:
+        return dict()
+
+    max_workers = max(1, min(max_workers, len(object_names)))
+
+    # boto3 clients are thread safe, thus can be shared by all the fetch threads,
+    # provided that the client connection pool is large enough for the fan-out
+    client = s3_client(
+        config=Config(
+            signature_version='s3v4',
+            region_name=default_s3_region,
+            max_pool_connections=max_workers
+        )
+    )
+
+    def fetch(object_name: str) -> Optional[str]:
+        attempt = 0
+        while True:
+            try:
+                return _download_s3_object(client, bucket_name, object_name).decode('utf-8')
+            except Exception as e:
+                if attempt >= retries:
+                    logger.error(f"load_s3_text_files(): '{object_name}' not loaded: {str(e)}")
+                    return None
+                # backoff: 0.1, 0.2, 0.4... seconds
+                sleep(0.1 * 2**attempt)
+                attempt += 1
+
+    start = time()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = dict(zip(object_names, executor.map(fetch, object_names)))
+
+    logger.info(
+        f"load_s3_text_files(): loaded {len(object_names)} files with {max_workers} " +
+        f"concurrent requests in {time() - start:.3f} seconds"
+    )
+
+    return contents
+
+
+def get_archive_contents(
+        bucket_name: str,
+        metadata_cache: Optional[Dict[str, List[str]]] = None,
+        kg_id: Optional[str] = None,
+        entry_filter: Optional[Callable[[Dict], bool]] = None
+) -> \
         Dict[
             str,  # kg_id's of every KGE archived knowledge graph
             Dict[
                 str,  # tags 'metadata' and 'versions'
                 Union[
                     str,  # 'metadata' field value: kg specific 'provider' text file blob from S3
+                    Dict[str, Any],  # or, the parameters pre-parsed from it (as found in its sidecar file)
                     Dict[
                         str,  # fileset_version's of versioned KGE File Sets for a kg
                         Dict[
-                            str,  # tags 'metadata' and 'file_object_keys'
+                            str,  # tags 'metadata', 'file_object_keys' and 'file_entries'
                             Union[
                                 str,  # 'metadata' field value: 'file set' specific text file blob from S3
-                                List[str]  # list of data files in a given KGE File Set
+                                Dict[str, Any],  # or, the parameters pre-parsed from it
+                                List[str],  # list of data files in a given KGE File Set
+                                # 'size' and 'last_modified' of data files, indexed by object key
+                                Dict[str, Dict[str, Union[int, str]]]
                             ]
                         ]
                     ]
@@ -1157,10 +1743,32 @@ def get_archive_contents(bucket_name: str) -> \
     Get contents of KGE Archive from the
     AWS S3 bucket folder names and metadata file contents.
 
+    The metadata files with a fresh sidecar file (see kgea_metadata_codec) are reported as
+    the (dictionary of) parameters pre-parsed from them, rather than as their YAML text.
+
     :param bucket_name: The bucket
+    :param metadata_cache: (optional) [ETag, text] of previously loaded metadata (or sidecar) files, indexed by
+                           object key; only the files whose ETag changed are (re-)loaded, then the cache is updated
+                           (for the files listed, i.e. the files of other knowledge graphs remain cached)
+    :param kg_id: (optional) only list the contents of this knowledge graph
+    :param entry_filter: (optional) predicate on S3 object entries (e.g. on their 'LastModified'
+                         timestamp); the objects for which it is False are ignored
     :return: multi-level catalog of KGE knowledge graphs and associated versioned file sets from S3 storage
     """
-    all_object_keys = object_keys_in_location(bucket=bucket_name)
+    start = time()
+
+    # ETags of the metadata files, as listed
+    metadata_etags: Dict[str, str] = dict()
+
+    # ETags of the sidecar files, as listed, indexed by the object key of their metadata file
+    sidecar_etags: Dict[str, str] = dict()
+
+    # number of objects listed in the Archive folder
+    object_count = 0
+
+    # The provider and file set metadata files are only
+    # identified during the scan below, then fetched concurrently
+    metadata_object_keys: List[str] = list()
 
     contents: Dict[
         str,  # kg_id's of every KGE archived knowledge graph
@@ -1182,8 +1790,16 @@ def get_archive_contents(bucket_name: str) -> \
         ]
     ] = dict()
 
-    for file_path in all_object_keys:
+    prefix = get_object_location(kg_id) if kg_id else f"{default_s3_root_key}/"
+    partial_listing = bool(kg_id or entry_filter)
+    for entry in iter_object_entries(bucket_name, prefix=prefix):
+
+        object_count += 1
 
+        if entry_filter and not entry_filter(entry):
+            continue
+
+        file_path = entry['Key']
         file_part = file_path.split('/')
 
         if not file_part:
@@ -1197,7 +1813,21 @@ def get_archive_contents(bucket_name: str) -> \
         if len(file_part) == 1 or not file_part[1]:
             continue
 
+        # ignore internal KGE Archive system folders (e.g. the catalog index)
+        if file_part[1].startswith(SYSTEM_FOLDER_PREFIX):
+            continue
+
         kg_id = file_part[1]
+
+        # ignore objects (other than folders) directly under the knowledge graph folder
+        if len(file_part) < 3:
+            continue
+
+        # the sidecar files of the metadata files are not data files
+        if is_sidecar_object_key(file_path):
+            sidecar_etags[file_path[:-len(METADATA_SIDECAR_SUFFIX)]] = entry['ETag']
+            continue
+
         if kg_id not in contents:
             # each Knowledge Graph may have high level 'metadata'
             # obtained from a kg_id specific PROVIDER_METADATA_FILE
@@ -1209,11 +1839,9 @@ def get_archive_contents(bucket_name: str) -> \
             # Get the provider 'kg_id' associated metadata file just stored
             # as a blob of text, for content parsing by the function caller
             # Unlike the kg_id versions, there should only be one such file?
-            contents[kg_id]['metadata'] = \
-                load_s3_text_file(
-                    bucket_name=bucket_name,
-                    object_name=file_path
-                )
+            contents[kg_id]['metadata'] = file_path
+            metadata_object_keys.append(file_path)
+            metadata_etags[file_path] = entry['ETag']
             # we ignore this file in the main versioned file list
             # since it is global to the knowledge graph.  In fact,
             # sometimes, the fileset_version may not yet be properly set!
@@ -1225,6 +1853,7 @@ def get_archive_contents(bucket_name: str) -> \
             if fileset_version not in contents[kg_id]['versions']:
                 contents[kg_id]['versions'][fileset_version] = dict()
                 contents[kg_id]['versions'][fileset_version]['file_object_keys'] = list()
+                contents[kg_id]['versions'][fileset_version]['file_entries'] = dict()
 
             # if the fileset versioned object key is not empty?
             if len(file_part) >= 4:
@@ -1232,20 +1861,173 @@ def get_archive_contents(bucket_name: str) -> \
                     # Get the provider 'kg_id' associated metadata file just stored
                     # as a blob of text, for content parsing by the function caller
                     # Unlike the kg_id versions, there should only be one such file?
-                    contents[kg_id]['versions'][fileset_version]['metadata'] = \
-                        load_s3_text_file(
-                            bucket_name=bucket_name,
-                            object_name=file_path
-                        )
+                    contents[kg_id]['versions'][fileset_version]['metadata'] = file_path
+                    metadata_object_keys.append(file_path)
+                    metadata_etags[file_path] = entry['ETag']
                     continue
 
                 # simple first iteration just records the list of data file paths
                 # (other than the PROVIDER_METADATA_FILE and FILE_SET_METADATA_FILE)
                 # TODO: how should subfolders (i.e. 'nodes' and 'edges') be handled?
                 contents[kg_id]['versions'][fileset_version]['file_object_keys'].append(file_path)
+
+                # also retain the file details already provided by the listing
+                contents[kg_id]['versions'][fileset_version]['file_entries'][file_path] = {
+                    'size': entry['Size'],
+                    'last_modified': entry['LastModified'].isoformat()
+                }
+
+    listing_time = time() - start
+
+    # ETags of the files to load, indexed by object key
+    etags: Dict[str, str] = dict()
+
+    # contents of the files loaded, indexed by object key
+    loaded: Dict[str, Optional[str]] = dict()
+
+    changed_object_keys: List[str] = list()
+
+    def load(object_keys: List[str], object_etags: Dict[str, str]):
+        # only fetching those which are not already cached with the same ETag
+        fetched_keys: List[str] = list()
+        for object_key in object_keys:
+            etags[object_key] = object_etags[object_key]
+            cached = metadata_cache.get(object_key) if metadata_cache is not None else None
+            if cached and cached[0] == etags[object_key]:
+                loaded[object_key] = cached[1]
+            else:
+                fetched_keys.append(object_key)
+        loaded.update(load_s3_text_files(bucket_name, fetched_keys))
+        changed_object_keys.extend(fetched_keys)
+
+    # Replace the metadata object keys recorded above with the parameters pre-parsed in their
+    # sidecar file, if available and fresh, otherwise, with the text contents of the metadata file
+    metadata: Dict[str, Union[None, str, Dict[str, Any]]] = dict()
+    with_sidecar: List[str] = [object_key for object_key in metadata_object_keys if object_key in sidecar_etags]
+    load(
+        [get_sidecar_object_key(object_key) for object_key in with_sidecar],
+        {get_sidecar_object_key(object_key): sidecar_etags[object_key] for object_key in with_sidecar}
+    )
+    for object_key in with_sidecar:
+        parameters = decode_metadata_sidecar(loaded[get_sidecar_object_key(object_key)], metadata_etags[object_key])
+        if parameters is not None:
+            metadata[object_key] = parameters
+
+    # metadata files without a (fresh) sidecar file are parsed by the caller
+    yaml_object_keys: List[str] = [object_key for object_key in metadata_object_keys if object_key not in metadata]
+    load(yaml_object_keys, metadata_etags)
+    for object_key in yaml_object_keys:
+        metadata[object_key] = loaded[object_key]
+
+    if metadata_cache is not None:
+        if not partial_listing:
+            # the full listing lists every metadata file still archived
+            metadata_cache.clear()
+        elif not entry_filter:
+            # the listing of a knowledge graph lists every metadata file still archived under its prefix,
+            # whereas filtered listings leave the (unchanged) files filtered out cached
+            for object_key in [object_key for object_key in metadata_cache if object_key.startswith(prefix)]:
+                del metadata_cache[object_key]
+        metadata_cache.update({
+            object_key: [etags[object_key], text]
+            for object_key, text in loaded.items() if text is not None
+        })
+
+    for kg_id, entry in contents.items():
+        if 'metadata' in entry:
+            entry['metadata'] = metadata[entry['metadata']]
+        for version in entry['versions'].values():
+            if 'metadata' in version:
+                version['metadata'] = metadata[version['metadata']]
+
+    # partial (e.g. change polling) listings are only reported in debug mode
+    (logger.debug if partial_listing else logger.info)(
+        f"get_archive_contents(): {len(contents)} knowledge graphs found in {object_count} " +
+        f"object keys, listed in {listing_time:.3f} seconds, with {len(changed_object_keys)} " +
+        f"of {len(metadata_object_keys)} metadata files ({len(yaml_object_keys)} without a fresh sidecar) " +
+        f"loaded in {time() - start - listing_time:.3f} seconds"
+    )
+
     return contents
 
 
+def load_catalog_index(
+        bucket_name: str = default_s3_bucket,
+        etag: Optional[str] = None
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Load the persisted KGE Archive catalog index, with a single S3 GET.
+
+    If the ETag of a (locally cached) copy of the index is given, the GET is
+    conditional, and the index is only downloaded if it has since changed.
+
+    :param bucket_name: The bucket
+    :param etag: (optional) ETag of a previously loaded copy of the catalog index
+    :return: 2-tuple of the catalog index (Python dictionary) and its ETag;
+             (None, etag) if the index is unchanged; (None, None) if missing or unreadable
+    """
+    try:
+        request = {'Bucket': bucket_name, 'Key': CATALOG_INDEX_KEY}
+        if etag:
+            request['IfNoneMatch'] = etag
+        response = s3_client().get_object(**request)
+        index = json.loads(response['Body'].read().decode('utf-8'))
+        return index, response['ETag']
+    except ClientError as ce:
+        if etag and ce.response['Error']['Code'] in ['304', 'NotModified']:
+            return None, etag
+        logger.warning(f"load_catalog_index(): catalog index '{CATALOG_INDEX_KEY}' not loaded: {str(ce)}")
+    except Exception as e:
+        logger.warning(f"load_catalog_index(): catalog index '{CATALOG_INDEX_KEY}' not loaded: {str(e)}")
+
+    return None, None
+
+
+def save_catalog_index(
+        index: Dict,
+        bucket_name: str = default_s3_bucket,
+        etag: Optional[str] = None
+) -> Tuple[Optional[str], bool]:
+    """
+    Persist the KGE Archive catalog index. A single S3 PUT replaces the
+    object atomically, thus readers see either the old or the new index.
+
+    If the ETag of the catalog index last read (or written) is given, the PUT is conditional,
+    and the index is only replaced if it has not since been rewritten (e.g. by another instance).
+
+    :param index: Python dictionary of the catalog index (must be JSON serializable)
+    :param bucket_name: The bucket
+    :param etag: (optional) ETag of the catalog index last read (or written)
+    :return: 2-tuple of the ETag of the catalog index if successfully written (None otherwise) and whether
+             the write was refused because the catalog index was rewritten (or deleted) since the given ETag
+    """
+    try:
+        request = {
+            'Bucket': bucket_name,
+            'Key': CATALOG_INDEX_KEY,
+            'Body': json.dumps(index).encode('utf-8'),
+            'ContentType': 'application/json'
+        }
+        if etag:
+            request['IfMatch'] = etag
+        response = s3_client().put_object(**request)
+    except ClientError as ce:
+        if etag and ce.response['Error']['Code'] in [
+            '412', 'PreconditionFailed', 'ConditionalRequestConflict', '404', 'NoSuchKey'
+        ]:
+            logger.info(f"save_catalog_index(): catalog index '{CATALOG_INDEX_KEY}' changed since last read")
+            return None, True
+        logger.error(f"save_catalog_index(): catalog index '{CATALOG_INDEX_KEY}' not saved: {str(ce)}")
+        return None, False
+    except Exception as e:
+        logger.error(f"save_catalog_index(): catalog index '{CATALOG_INDEX_KEY}' not saved: {str(e)}")
+        return None, False
+    finally:
+        invalidate_listing_cache(bucket_name, CATALOG_INDEX_KEY)
+
+    return response['ETag'], False
+
+
 # Curl Bytes Received
 _cbr_pattern = re.compile(r"^(?P<num>\d+(\.\d+)?)(?P<mag>[KMGTP])?$", flags=re.IGNORECASE)
 _cbr_magnitude = {
@@ -1321,6 +2103,9 @@ def upload_from_link(
     except RuntimeWarning:
         logger.warning("URL transfer cancelled by exception?")
 
+    finally:
+        invalidate_listing_cache(bucket, object_key)
+
 
 ###################################
 # AWS EC2 & EBS client operations #
@@ -3,11 +3,15 @@ Knowledge Graph Exchange Archive backend web service handlers.
 """
 from os import getenv, path
 from pathlib import Path
-from typing import Dict, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 import logging
 
 import uuid
 import time
+import base64
+import gzip
+import json
+from hashlib import sha1
 
 from .models import (
     KgeMetadata,
@@ -15,7 +19,6 @@ from .models import (
     UploadProgressToken, KgeFileSetStatusCode
 )
 from .models.kge_upload_progress_status_code import KgeUploadProgressStatusCode
-from ...aws.assume_role import AssumeRole
 
 try:
     from yaml import CLoader as Loader, CDumper as Dumper
@@ -25,9 +28,14 @@ except ImportError:
 from aiohttp import web
 from aiohttp_session import get_session
 
-import threading
+# Brotli compression of catalog responses is optional
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 from botocore.client import Config
+from botocore.exceptions import ClientError
 
 import asyncio
 
@@ -50,32 +58,64 @@ from .kgea_session import (
     download,
     with_session,
     report_bad_request,
-    report_not_found
+    report_not_found,
+    report_too_many_requests,
+    session_user
 )
 
 from .kgea_file_ops import (
     default_s3_bucket,
-    create_presigned_url,
-    object_keys_for_fileset_version,
     get_object_location,
     with_version,
-    object_key_exists,
     get_default_date_stamp,
     with_subfolder,
     infix_string,
     s3_client,
     get_object_key,
     get_pathless_file_size,
-    get_url_file_size,
     upload_file,
     upload_from_link,
-    object_keys_in_location
+    create_multipart_upload,
+    upload_part,
+    complete_multipart_upload,
+    abort_multipart_upload,
+    list_multipart_parts,
+    save_upload_session,
+    load_upload_session,
+    delete_upload_session,
+    S3_MIN_PART_SIZE,
+    S3_MAX_PARTS
+)
+
+from .kgea_async_file_ops import (
+    run_in_s3_executor,
+    async_stream_to_s3,
+    Upload_Part_Size,
+    Upload_Session_Max_Part_Size,
+    async_object_key_exists,
+    async_object_keys_in_location,
+    async_object_keys_for_fileset_version,
+    async_create_presigned_url,
+    async_get_url_file_size
+)
+
+from .kgea_transfer_scheduler import (
+    get_transfer_scheduler,
+    TransferSchedulerSaturated
+)
+
+from .kgea_upload_tracker import (
+    get_upload_tracker_store,
+    Upload_Progress_Event_Interval
 )
 
 from kgea.server.web_services.catalog import (
     KnowledgeGraphCatalog,
     KgeKnowledgeGraph,
-    KgeFileSet, KgeFileType
+    KgeFileSet, KgeFileType,
+    get_catalog_revision,
+    fileset_version_key,
+    next_fileset_version
 )
 
 logger = logging.getLogger(__name__)
@@ -104,26 +144,212 @@ KGX_FILE_CONTENT_TYPES = ['metadata', 'nodes', 'edges', 'archive']
 # )
 #############################################################
 
-_upload_tracker = {'upload': {}}
+class CatalogDocument:
+    """
+    Serialized (JSON) catalog of available KGE File Sets, computed once per catalog revision,
+    with a strong ETag and (lazily) compressed variants of the document.
+    """
+    def __init__(self, revision: int, catalog: Dict):
+        self.revision: int = revision
+        self.body: bytes = json.dumps(catalog).encode('utf-8')
+        self.etag: str = '"' + sha1(self.body).hexdigest() + '"'
+        self._encoded: Dict[str, bytes] = {'identity': self.body}
+
+    def encode(self, encoding: str) -> bytes:
+        """
+        :param encoding: content encoding of the document: 'identity', 'gzip' or 'br'
+        :return: document body, compressed by the given encoding
+        """
+        if encoding not in self._encoded:
+            if encoding == 'br':
+                self._encoded[encoding] = brotli.compress(self.body)
+            elif encoding == 'gzip':
+                self._encoded[encoding] = gzip.compress(self.body)
+            else:
+                raise RuntimeError("CatalogDocument.encode(): unknown content encoding '" + encoding + "'")
+        return self._encoded[encoding]
+
+
+_catalog_document: Optional[CatalogDocument] = None
+
+
+def get_catalog_document() -> CatalogDocument:
+    """
+    :return: CatalogDocument of the current catalog revision
+    """
+    global _catalog_document
+
+    # The revision is read before the catalog entries, thus a concurrent
+    # change of the catalog only triggers a (redundant) later rebuild
+    revision = get_catalog_revision()
+    if not (_catalog_document and _catalog_document.revision == revision):
+        _catalog_document = CatalogDocument(revision, KnowledgeGraphCatalog.catalog().get_kg_entries())
 
+    return _catalog_document
 
-async def get_kge_knowledge_graph_catalog(request: web.Request) -> web.Response:
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """
+    :param accept_encoding: 'Accept-Encoding' request header
+    :return: quality values ('q' parameters) of the content codings listed in the header, indexed by coding
+    """
+    accepted: Dict[str, float] = dict()
+    for item in accept_encoding.split(','):
+        coding, *parameters = [token.strip() for token in item.split(';')]
+        if not coding:
+            continue
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+def _preferred_encoding(request: web.Request) -> str:
+    """
+    :param request: client request, with its 'Accept-Encoding' header
+    :return: preferred content encoding of the response: 'br' (if available), 'gzip' or 'identity';
+             the codings of quality 'q=0' being unacceptable, and those of higher quality preferred
+    """
+    accepted: Dict[str, float] = _accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    preferred, preferred_quality = 'identity', 0.0
+    for coding in (['br'] if brotli else []) + ['gzip']:
+        # '*' stands for the codings not listed
+        quality = accepted.get(coding, accepted.get('*', 0.0))
+        if quality > preferred_quality:
+            preferred, preferred_quality = coding, quality
+    return preferred
+
+
+def _encode_cursor(kg_id: str) -> str:
+    return base64.urlsafe_b64encode(kg_id.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor: str) -> str:
+    return base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+
+
+async def get_kge_knowledge_graph_catalog(
+        request: web.Request,
+        q: Optional[str] = None,
+        translator_component: Optional[str] = None,
+        translator_team: Optional[str] = None,
+        biolink_model_release: Optional[str] = None,
+        submitter: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+) -> web.Response:
     """Returns the catalog of available KGE File Sets
 
     :param request:
     :type request: web.json_response
+    :param q: text searched in the name and description of the knowledge graphs
+    :param translator_component: Translator component of the knowledge graphs
+    :param translator_team: Translator team of the knowledge graphs
+    :param biolink_model_release: Biolink Model release of (a file set of) the knowledge graphs
+    :param submitter: name or email of the submitter of (a file set of) the knowledge graphs
+    :param status: status of (a file set of) the knowledge graphs
+    :param limit: maximum number of knowledge graphs returned
+    :param cursor: cursor of the page of knowledge graphs returned (from the 'X-Next-Cursor' of the previous page)
     """
-    catalog: Dict = dict()
-
     # Paranoia: can't see the catalog without being logged in a user session
     session = await get_session(request)
-    if not session.empty:
-        
-        catalog = KnowledgeGraphCatalog.catalog().get_kg_entries()
+    if session.empty:
+        # but don't need to propagate the user session to the output
+        return web.json_response(dict(), status=200)
+
+    filters: Dict[str, Optional[str]] = {
+        'translator_component': translator_component,
+        'translator_team': translator_team,
+        'biolink_model_release': biolink_model_release,
+        'submitter': submitter,
+        'status': status
+    }
+    if q or limit or cursor or any(filters.values()):
+
+        after: Optional[str] = None
+        if cursor:
+            try:
+                after = _decode_cursor(cursor)
+            except (ValueError, UnicodeDecodeError):
+                await report_bad_request(request, "get_kge_knowledge_graph_catalog(): invalid cursor '" + cursor + "'")
+
+        catalog, next_cursor = KnowledgeGraphCatalog.catalog().search_kg_entries(
+            q=q, limit=limit, cursor=after, **filters
+        )
+        response = web.json_response(catalog, status=200)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = _encode_cursor(next_cursor)
+        return response
+
+    document: CatalogDocument = get_catalog_document()
+
+    headers = {
+        'ETag': document.etag,
+        'Cache-Control': 'private, no-cache',
+        'Vary': 'Accept-Encoding, Cookie'
+    }
+
+    if_none_match = request.headers.get('If-None-Match', '')
+    if document.etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*':
+        return web.Response(status=304, headers=headers)
+
+    encoding = _preferred_encoding(request)
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+
+    return web.Response(
+        status=200,
+        body=document.encode(encoding),
+        content_type='application/json',
+        headers=headers
+    )
 
-    # but don't need to propagate the user session to the output
-    response = web.json_response(catalog, status=200)
-    return response
+
+async def get_kge_fileset_versions(request: web.Request, kg_id: str) -> web.Response:
+    """Returns the versions of the KGE File Sets of a knowledge graph
+
+    The versions are read from the (in memory) catalog, thus
+    without listing the KGE Archive, and are in SemVer order.
+
+    :param request:
+    :type request: web.Request
+    :param kg_id: KGE Knowledge Graph identifier
+    :type kg_id: str
+
+    :rtype: web.Response( Dict[str, Union[str, List[str]]] )
+    """
+    session = await get_session(request)
+    if session.empty:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+    knowledge_graph: Optional[KgeKnowledgeGraph] = KnowledgeGraphCatalog.catalog().get_knowledge_graph(kg_id)
+    if not knowledge_graph:
+        await report_not_found(
+            request,
+            f"get_kge_fileset_versions(): knowledge graph '{kg_id}' was not found in the catalog?",
+            active_session=True
+        )
+
+    versions: List[str] = sorted(knowledge_graph.get_version_names(), key=fileset_version_key)
+
+    return web.json_response(
+        {
+            'kg_id': kg_id,
+            'versions': versions,
+            'latest': versions[-1] if versions else None,
+            'next_version': next_fileset_version(versions)
+        },
+        status=200
+    )
 
 
 _known_licenses = {
@@ -232,7 +458,7 @@ async def register_kge_knowledge_graph(request: web.Request):
                 )
 
                 # Also publish a new 'provider.yaml' metadata file to the KGE Archive
-                provider_metadata_key = knowledge_graph.publish_provider_metadata()
+                provider_metadata_key = await run_in_s3_executor(knowledge_graph.publish_provider_metadata)
                 
                 if not provider_metadata_key:
                     await report_not_found(
@@ -241,6 +467,8 @@ async def register_kge_knowledge_graph(request: web.Request):
                         active_session=True
                     )
 
+                await run_in_s3_executor(KnowledgeGraphCatalog.catalog().save_index)
+
                 await redirect(
                     request,
                     f"{FILESET_REGISTRATION_FORM}?kg_id={kg_id}&kg_name={knowledge_graph.get_name()}",
@@ -358,7 +586,7 @@ async def register_kge_file_set(request: web.Request):
 
                 # Here we start to start to track a specific
                 # knowledge graph submission within KGE Archive
-                file_set: KgeFileSet = knowledge_graph.get_file_set(fileset_version)
+                file_set: KgeFileSet = knowledge_graph.get_file_set(fileset_version, hydrate=False)
 
                 if file_set is not None:
                     # existing file set for specified version... hmm... what do I do here?
@@ -385,6 +613,7 @@ async def register_kge_file_set(request: web.Request):
                 
                 # Add new versioned KGE File Set to the Catalog Knowledge Graph entry
                 knowledge_graph.add_file_set(fileset_version, file_set)
+                await run_in_s3_executor(KnowledgeGraphCatalog.catalog().save_index)
 
                 await redirect(
                         request,
@@ -435,18 +664,21 @@ async def publish_kge_file_set(request: web.Request, kg_id: str, fileset_version
                 active_session=True
             )
             
-        file_set: KgeFileSet = knowledge_graph.get_file_set(fileset_version)
+        # only the status of the file set is read, unless it is published below
+        file_set: KgeFileSet = knowledge_graph.get_file_set(fileset_version, hydrate=False)
 
         if not file_set:
             await report_not_found(
                 request,
                 f"publish_kge_file_set() errors: unknown '{fileset_version}' for knowledge graph '{kg_id}'?"
             )
-            
+
         if file_set.get_fileset_status() == KgeFileSetStatusCode.CREATED:
             # Assume that it still needs to be processed
             logger.debug(f"\tPublishing fileset version '{fileset_version}' of graph '{kg_id}'")
             try:
+                # listing the data files (if not yet held in memory) off the event loop
+                await run_in_s3_executor(file_set.hydrate)
                 await file_set.publish()
             except Exception as exception:
                 logger.error(str(exception))
@@ -590,46 +822,34 @@ async def _initialize_upload_token(
         f"object_key='{object_key}', file_type='{str(file_type)}')"
     )
     
-    with threading.Lock():
-        token = str(uuid.uuid4())
-        if 'upload' not in _upload_tracker:
-            # TODO: not quite sure why we wouldn't
-            #       rather store this in the 'session' context?
-            #       i.e. session[token] = dict() ?
-            _upload_tracker['upload'] = {}
-        
-        if token not in _upload_tracker['upload']:
-            _upload_tracker['upload'][token] = {
-                "kg_id": kg_id,
-                "fileset_version": fileset_version,
-                "file_set_location": file_set_location,
-                "object_key": object_key,
-                "kgx_file_content": kgx_file_content,
-                "file_type": file_type,
-                "content_name": content_name,
-                "active": True  # Upload/transfer cancelled when this value becomes 'False'?
-            }
-        
-        logger.debug(f"session upload token: '{token}' = '{_upload_tracker['upload'][token]}'")
-        
-        upload_token_object = UploadTokenObject(token)
-        
-        return upload_token_object
+    token = str(uuid.uuid4())
+    details: Dict = {
+        "kg_id": kg_id,
+        "fileset_version": fileset_version,
+        "file_set_location": file_set_location,
+        "object_key": object_key,
+        "kgx_file_content": kgx_file_content,
+        "file_type": file_type,
+        "content_name": content_name,
+        "active": True  # Upload/transfer cancelled when this value becomes 'False'?
+    }
+    await get_upload_tracker_store().save(token, details)
+    
+    logger.debug(f"session upload token: '{token}' = '{details}'")
+    
+    upload_token_object = UploadTokenObject(token)
+    
+    return upload_token_object
 
 
-def get_upload_tracker_details(upload_token: str) -> Dict:
+async def get_upload_tracker_details(upload_token: str) -> Optional[Dict]:
     """
-    Get upload tracker details.
+    Get upload tracker details (possibly, of an upload run by another worker process).
     
     :param upload_token:
-    :return:
+    :return: upload tracker details; None if the upload token is unknown (or its tracker evicted)
     """
-    global _upload_tracker
-    
-    # get details of file upload from token
-    details = _upload_tracker['upload'][upload_token]
-    
-    return details
+    return await get_upload_tracker_store().get(upload_token)
 
 
 async def setup_kge_upload_context(
@@ -690,7 +910,9 @@ async def get_kge_upload_status(request: web.Request, upload_token: str) -> web.
         The consumer of this endpoint must be willing to consistently
         poll until end_position is given a value.
         """
-        tracker: Dict = get_upload_tracker_details(upload_token)
+        tracker: Optional[Dict] = await get_upload_tracker_details(upload_token)
+        if not tracker:
+            await report_not_found(request, f"get_kge_upload_status(): unknown upload token '{upload_token}'?")
         
         progress_token = UploadProgressToken(
             upload_token=upload_token,
@@ -709,6 +931,109 @@ async def get_kge_upload_status(request: web.Request, upload_token: str) -> web.
         await redirect(request, LANDING_PAGE)
 
 
+# Number of seconds after which an idle upload progress event stream is sent a keep-alive comment
+_PROGRESS_EVENT_KEEPALIVE = 15
+
+
+def upload_progress_event(upload_token: str, tracker: Dict, rate: float) -> Dict:
+    """
+    :param upload_token:
+    :param tracker: upload tracker details
+    :param rate: throughput of the upload, in bytes per second
+    :return: upload progress event, with the throughput and (if known) estimated time to completion (in seconds)
+    """
+    current_position: int = tracker['current_position'] if 'current_position' in tracker else 0
+    end_position: Optional[int] = tracker['end_position'] if 'end_position' in tracker else None
+    eta: Optional[int] = None
+    if end_position and rate > 0:
+        eta = int(max(end_position - current_position, 0) / rate)
+    return {
+        'upload_token': upload_token,
+        'current_position': current_position,
+        'end_position': end_position,
+        'status': tracker['status'] if 'status' in tracker else KgeUploadProgressStatusCode.ONGOING,
+        'throughput': int(rate),
+        'eta': eta
+    }
+
+
+async def kge_upload_progress_events(request: web.Request) -> web.StreamResponse:
+    """Push the progress of uploading a specific file of a KGE File Set, as Server-Sent Events.
+
+    Rather than polling /upload/progress (which remains available), the client listens to one stream of
+    'progress' events, sent (at most once per Upload_Progress_Event_Interval, and only upon changes)
+    until the upload is completed, fails or is cancelled. Query parameter: the 'upload_token' given
+    by a preceding /upload GET call. The stream is directly routed by aiohttp.
+
+    :param request:
+    :type request: web.Request
+    :rtype: web.StreamResponse
+    """
+    logger.debug("Entering kge_upload_progress_events()")
+
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        store = get_upload_tracker_store()
+        tracker: Optional[Dict] = await store.get(upload_token)
+        if not tracker:
+            await report_not_found(request, f"kge_upload_progress_events(): unknown upload token '{upload_token}'?")
+
+        response = web.StreamResponse(
+            headers={
+                'Content-Type': 'text/event-stream',
+                'Cache-Control': 'no-cache',
+                # disable the buffering of the stream by an nginx reverse proxy
+                'X-Accel-Buffering': 'no'
+            }
+        )
+        await with_session(request, response)
+        await response.prepare(request)
+
+        # the throughput measured by the transfer itself (see ProgressPercentage), otherwise
+        # (e.g. for resumable upload sessions) estimated from the successive upload positions
+        rate: float = 0.0
+        observed: Tuple[float, int] = (time.time(), 0)
+        last_event: str = ''
+        last_write: float = time.time()
+        try:
+            while tracker:
+                now = time.time()
+                position: int = tracker['current_position'] if 'current_position' in tracker else 0
+                if 'rate' in tracker:
+                    rate = tracker['rate']
+                elif position > observed[1] and now > observed[0]:
+                    sample: float = (position - observed[1]) / (now - observed[0])
+                    rate = (rate + sample) / 2 if rate else sample
+                    observed = (now, position)
+
+                event: Dict = upload_progress_event(upload_token, tracker, rate)
+                data: str = json.dumps(event)
+                if data != last_event:
+                    await response.write(f"event: progress\ndata: {data}\n\n".encode('utf-8'))
+                    last_event, last_write = data, now
+                elif now - last_write >= _PROGRESS_EVENT_KEEPALIVE:
+                    await response.write(b": keep-alive\n\n")
+                    last_write = now
+
+                if event['status'] != KgeUploadProgressStatusCode.ONGOING or not tracker['active']:
+                    break
+
+                await asyncio.sleep(Upload_Progress_Event_Interval)
+                tracker = await store.get(upload_token)
+
+        except ConnectionResetError:
+            logger.debug(f"kge_upload_progress_events(): client of upload '{upload_token}' disconnected")
+
+        return response
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
 class ProgressPercentage(object):
     """
     Class to track percentage completion of an upload.
@@ -746,6 +1071,8 @@ class ProgressPercentage(object):
             dt = t_now-self.t0+0.001
             mb = self._seen_so_far / (1024*1024)
             mbps = mb / dt
+            # throughput (bytes per second) of the transfer, for the upload progress events
+            self.transfer_tracker['rate'] = self._seen_so_far / dt
             dt_log = t_now-self.t_log_prev
             if dt_log >= self.dt_log_min:
                 logger.info(f"ProgressPercentage mbps={mbps} mb={mb}")
@@ -756,13 +1083,17 @@ _num_s3_threads = 16
 _s3_transfer_cfg = Config(signature_version='s3v4', max_pool_connections=_num_s3_threads)
 
 
-async def threaded_file_transfer(filename, tracker, transfer_function, source):
+async def threaded_file_transfer(filename, upload_token, tracker, transfer_function, source, user):
     """
+    Schedule the transfer of a file on the (bounded, fair between users) transfer scheduler.
 
     :param filename:
+    :param upload_token: upload token of the transfer, the (live) upload tracker of which is detached once done
     :param tracker:
     :param transfer_function:
     :param source:
+    :param user: identifier of the user submitting the transfer
+    :raises TransferSchedulerSaturated: if the transfer queue (of the user) is full
     """
     
     def threaded_upload():
@@ -771,8 +1102,8 @@ async def threaded_file_transfer(filename, tracker, transfer_function, source):
         :return:
         """
         
-        local_role = AssumeRole()
-        client = s3_client(assumed_role=local_role, config=_s3_transfer_cfg)
+        # pooled client of this executor thread, sharing the assumed role credentials
+        client = s3_client(config=_s3_transfer_cfg)
         
         if 'content_name' in tracker:
             content_name = tracker['content_name']
@@ -838,8 +1169,10 @@ async def threaded_file_transfer(filename, tracker, transfer_function, source):
             logger.error(exc_msg)
             raise RuntimeError(exc_msg)
 
-    loop = asyncio.get_event_loop()
-    loop.run_in_executor(None, threaded_upload)
+    transfer = get_transfer_scheduler().submit(user, threaded_upload)
+
+    # the final state of the upload tracker is published once the transfer is done
+    transfer.add_done_callback(lambda done: asyncio.ensure_future(get_upload_tracker_store().detach(upload_token)))
 
 
 async def kge_upload_file(
@@ -862,7 +1195,9 @@ async def kge_upload_file(
     session = await get_session(request)
     if user_permitted(session):
         
-        tracker: Dict = get_upload_tracker_details(upload_token)
+        tracker: Optional[Dict] = await get_upload_tracker_store().attach(upload_token)
+        if not tracker:
+            await report_not_found(request, f"kge_upload_file(): unknown upload token '{upload_token}'?")
         
         tracker['end_position'] = get_pathless_file_size(uploaded_file.file)
 
@@ -877,12 +1212,19 @@ async def kge_upload_file(
                 tracker['status'] = KgeUploadProgressStatusCode.ERROR
                 raise e
 
-        await threaded_file_transfer(
-            filename=uploaded_file.filename,
-            tracker=tracker,
-            transfer_function=_upload_file,
-            source=uploaded_file.file  # The raw file object (e.g. as a byte stream)
-        )
+        try:
+            await threaded_file_transfer(
+                filename=uploaded_file.filename,
+                upload_token=upload_token,
+                tracker=tracker,
+                transfer_function=_upload_file,
+                source=uploaded_file.file,  # The raw file object (e.g. as a byte stream)
+                user=session_user(session)
+            )
+        except TransferSchedulerSaturated as tss:
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            await get_upload_tracker_store().detach(upload_token)
+            await report_too_many_requests(request, f"kge_upload_file(): {str(tss)}", tss.retry_after)
         
         response = web.Response(text=str(tracker['end_position']), status=200)
         
@@ -894,6 +1236,468 @@ async def kge_upload_file(
         await redirect(request, LANDING_PAGE)
 
 
+# Size of the chunks read at once from the body of a streamed upload
+_STREAM_READ_SIZE = 1024**2
+
+
+async def kge_stream_upload_file(request: web.Request) -> web.Response:
+    """Streaming upload of a specified file from a local computer.
+
+    The 'uploaded_file' part of the multipart/form-data request body is piped, as it is
+    received, into an S3 multipart upload, rather than being spooled in full (as connexion
+    does for the /upload POST), thus this handler is directly routed by aiohttp.
+
+    Query parameters: the 'upload_token' given by a preceding /upload GET call and
+    (optionally) the 'content_length' of the file, in bytes (for progress monitoring).
+
+    :param request:
+    :type request: web.Request
+    :rtype: web.Response
+    """
+    logger.debug("Entering kge_stream_upload_file()")
+
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        store = get_upload_tracker_store()
+        if not await store.get(upload_token):
+            await report_bad_request(request, f"kge_stream_upload_file(): unknown upload token '{upload_token}'?")
+
+        content_length: str = request.query.get('content_length', '')
+        if content_length.isdigit():
+            end_position = int(content_length)
+        else:
+            # the size of the whole request body is an upper bound of the size of the file
+            end_position = request.content_length if request.content_length else 0
+
+        reader = await request.multipart()
+        field = await reader.next()
+        while field is not None and field.name != 'uploaded_file':
+            await field.release()
+            field = await reader.next()
+        if field is None:
+            await report_bad_request(request, "kge_stream_upload_file(): no 'uploaded_file' in the request?")
+
+        # the upload tracker is live in this process, for the duration of the upload
+        tracker: Dict = await store.attach(upload_token)
+        tracker['end_position'] = end_position
+        tracker['status'] = KgeUploadProgressStatusCode.ONGOING
+
+        content_name: str = tracker['content_name']
+        object_key = get_object_key(tracker['file_set_location'], content_name)
+        progress_monitor = ProgressPercentage(filename=content_name, transfer_tracker=tracker)
+
+        async def chunks():
+            while True:
+                if not tracker['active']:
+                    raise RuntimeWarning("Transfer/upload was cancelled?")
+                chunk = await field.read_chunk(_STREAM_READ_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+
+        scheduler = get_transfer_scheduler()
+        try:
+            # the parts of the stream are uploaded by the transfer thread pool
+            async with scheduler.transfer(session_user(session)):
+                size: int = await async_stream_to_s3(
+                    chunks(),
+                    object_key=object_key,
+                    expected_size=tracker['end_position'],
+                    callback=progress_monitor,
+                    executor=scheduler.get_executor()
+                )
+            tracker['end_position'] = tracker['current_position'] = size
+
+            await run_in_s3_executor(
+                KnowledgeGraphCatalog.catalog().add_to_kge_file_set,
+                kg_id=tracker["kg_id"],
+                fileset_version=tracker["fileset_version"],
+                file_type=tracker["file_type"],
+                file_name=content_name,
+                file_size=size,
+                object_key=object_key
+            )
+            tracker['status'] = KgeUploadProgressStatusCode.COMPLETED
+
+        except TransferSchedulerSaturated as tss:
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            await report_too_many_requests(request, f"kge_stream_upload_file(): {str(tss)}", tss.retry_after)
+
+        except Exception as exc:
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            exc_msg: str = "kge_stream_upload_file(" + \
+                           "kg_id: " + tracker["kg_id"] + ", " + \
+                           "fileset_version: " + tracker["fileset_version"] + ", " + \
+                           "object_key: " + object_key + ") threw exception: " + str(exc)
+            logger.error(exc_msg)
+            await report_bad_request(request, "kge_stream_upload_file(): upload of '" + content_name + "' failed?")
+
+        finally:
+            await store.detach(upload_token)
+
+        response = web.Response(text=str(size), status=200)
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+#############################################################
+# Resumable upload sessions
+#
+# The file is uploaded as numbered parts (chunks) of an S3 multipart upload:
+#
+# POST   /upload/session?upload_token=...&content_length=...     opens (or resumes) the upload session
+# PUT    /upload/session/part?upload_token=...&part_number=...   uploads a part, as the raw request body
+# GET    /upload/session?upload_token=...                        lists the parts already stored
+# POST   /upload/session/complete?upload_token=...               completes the upload
+# DELETE /upload/session?upload_token=...                        aborts the upload
+#
+# The parts are tracked by S3 itself, and the upload session (i.e. the upload tracker
+# details of the upload token) is persisted in the KGE Archive, thus an upload session
+# survives dropped connections and restarts of the application.
+#############################################################
+
+# Upload tracker details persisted in the record of an upload session
+_UPLOAD_SESSION_FIELDS = [
+    "kg_id", "fileset_version", "file_set_location", "object_key",
+    "kgx_file_content", "content_name", "upload_id", "part_size", "end_position"
+]
+
+
+def _upload_session_state(upload_token: str, tracker: Dict) -> Dict:
+    return {
+        'upload_token': upload_token,
+        'part_size': tracker['part_size'],
+        'content_length': tracker['end_position'],
+        'parts': [
+            {'part_number': part_number, 'size': size}
+            for part_number, size in sorted(tracker['parts'].items())
+        ]
+    }
+
+
+async def _refresh_upload_session_parts(upload_token: str, tracker: Dict):
+    # the parts stored by S3 are authoritative
+    parts: Dict[int, Dict] = await run_in_s3_executor(
+        list_multipart_parts, default_s3_bucket, tracker['object_key'], tracker['upload_id']
+    )
+    tracker['parts'] = {part_number: part['Size'] for part_number, part in parts.items()}
+    tracker['current_position'] = sum(tracker['parts'].values())
+    # the tracker is (re-)saved first, the backend only recording the parts of known upload sessions
+    store = get_upload_tracker_store()
+    await store.save(upload_token, tracker)
+    await store.save_parts(upload_token, tracker['parts'])
+
+
+async def _get_upload_session(request: web.Request, upload_token: str) -> Dict:
+    """
+    :param request:
+    :param upload_token:
+    :return: upload tracker details of an open upload session, restored from its record if need be
+    """
+    tracker: Optional[Dict] = await get_upload_tracker_store().get(upload_token)
+    if tracker and 'upload_id' in tracker:
+        return tracker
+
+    # e.g. after a restart of the application
+    record: Optional[Dict] = await run_in_s3_executor(load_upload_session, upload_token)
+    if not record:
+        await report_not_found(request, f"_get_upload_session(): unknown upload session '{upload_token}'?")
+
+    tracker = dict(record)
+    tracker['file_type'] = KgeFileType(record['file_type'])
+    tracker['active'] = True
+    tracker['status'] = KgeUploadProgressStatusCode.ONGOING
+    try:
+        await _refresh_upload_session_parts(upload_token, tracker)
+    except ClientError:
+        # the multipart upload was completed or aborted meanwhile
+        await run_in_s3_executor(delete_upload_session, upload_token)
+        await report_not_found(request, f"_get_upload_session(): upload session '{upload_token}' is closed?")
+
+    return tracker
+
+
+async def kge_open_upload_session(request: web.Request) -> web.Response:
+    """Open (or resume) a resumable upload session of the file of a given upload token.
+
+    Query parameters: the 'upload_token' given by a preceding /upload GET call
+    and the 'content_length' of the file, in bytes.
+
+    :param request:
+    :type request: web.Request
+    :return: the state of the upload session: the 'part_size' in which the file is to be
+             uploaded, its 'content_length' and the 'parts' already uploaded
+    :rtype: web.Response
+    """
+    logger.debug("Entering kge_open_upload_session()")
+
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        content_length: str = request.query.get('content_length', '')
+
+        tracker: Optional[Dict] = await get_upload_tracker_store().get(upload_token)
+        if not tracker or 'upload_id' in tracker:
+            # an already opened upload session is resumed
+            tracker = await _get_upload_session(request, upload_token)
+
+        elif 'status' in tracker:
+            await report_bad_request(request, f"kge_open_upload_session(): upload '{upload_token}' already done?")
+
+        else:
+            if not content_length.isdigit():
+                await report_bad_request(request, "kge_open_upload_session(): missing or invalid 'content_length'?")
+
+            size = int(content_length)
+            part_size = max(Upload_Part_Size * 1024**2, -(-size // S3_MAX_PARTS), S3_MIN_PART_SIZE)
+            if part_size > Upload_Session_Max_Part_Size * 1024**2:
+                await report_bad_request(request, f"kge_open_upload_session(): file of {size} bytes is too large?")
+
+            tracker['object_key'] = get_object_key(tracker['file_set_location'], tracker['content_name'])
+            tracker['upload_id'] = await run_in_s3_executor(
+                create_multipart_upload, default_s3_bucket, tracker['object_key']
+            )
+            tracker['part_size'] = part_size
+            tracker['end_position'] = size
+            tracker['current_position'] = 0
+            tracker['parts'] = dict()
+            tracker['status'] = KgeUploadProgressStatusCode.ONGOING
+
+            record: Dict = {field: tracker[field] for field in _UPLOAD_SESSION_FIELDS}
+            record['file_type'] = tracker['file_type'].value
+            await run_in_s3_executor(save_upload_session, upload_token, record)
+            await get_upload_tracker_store().save(upload_token, tracker)
+
+        response = web.json_response(_upload_session_state(upload_token, tracker))
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+async def kge_get_upload_session_parts(request: web.Request) -> web.Response:
+    """List the parts already uploaded in a resumable upload session.
+
+    :param request:
+    :type request: web.Request
+    :return: the state of the upload session (see kge_open_upload_session())
+    :rtype: web.Response
+    """
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        tracker: Dict = await _get_upload_session(request, upload_token)
+        try:
+            await _refresh_upload_session_parts(upload_token, tracker)
+        except ClientError as ce:
+            await report_not_found(request, f"kge_get_upload_session_parts('{upload_token}'): {str(ce)}")
+
+        response = web.json_response(_upload_session_state(upload_token, tracker))
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+async def kge_upload_session_part(request: web.Request) -> web.Response:
+    """Upload a numbered part of the file of a resumable upload session, as the raw request body.
+
+    A part may be uploaded again (e.g. after a dropped connection), replacing its previous upload.
+    All the parts, except the last one, should be of the 'part_size' of the upload session.
+
+    Query parameters: the 'upload_token' and the 'part_number' (from 1) of the part.
+
+    :param request:
+    :type request: web.Request
+    :rtype: web.Response
+    """
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        tracker: Dict = await _get_upload_session(request, upload_token)
+
+        if not tracker['active']:
+            await report_bad_request(request, f"kge_upload_session_part(): upload '{upload_token}' was cancelled?")
+
+        # the file is split into parts of the 'part_size' of the upload session
+        part_count: int = max(-(-tracker['end_position'] // tracker['part_size']), 1)
+        part_number: str = request.query.get('part_number', '')
+        if not (part_number.isdigit() and 1 <= int(part_number) <= part_count):
+            await report_bad_request(request, "kge_upload_session_part(): missing or invalid 'part_number'?")
+
+        # the part is held in memory, thus its size is checked before it is read
+        if request.content_length is None or request.content_length > tracker['part_size']:
+            await report_bad_request(
+                request,
+                f"kge_upload_session_part(): parts of at most {tracker['part_size']} bytes, " +
+                "with a Content-Length, are expected?"
+            )
+
+        data: bytes = await request.read()
+        if len(data) != request.content_length:
+            await report_bad_request(request, "kge_upload_session_part(): incomplete part?")
+
+        try:
+            # the part uploads of all the users share the (bounded) transfer thread pool
+            etag: str = await get_transfer_scheduler().run(
+                session_user(session),
+                upload_part, default_s3_bucket, tracker['object_key'], tracker['upload_id'], int(part_number), data
+            )
+        except TransferSchedulerSaturated as tss:
+            await report_too_many_requests(request, f"kge_upload_session_part(): {str(tss)}", tss.retry_after)
+        except ClientError as ce:
+            await report_not_found(request, f"kge_upload_session_part('{upload_token}'): {str(ce)}")
+
+        # the parts of a session may be concurrently uploaded (through several worker processes),
+        # thus each part is recorded on its own, rather than in the upload tracker details
+        await get_upload_tracker_store().save_part(upload_token, int(part_number), len(data))
+
+        response = web.json_response({'part_number': int(part_number), 'size': len(data), 'etag': etag})
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+async def kge_complete_upload_session(request: web.Request) -> web.Response:
+    """Complete a resumable upload session, once all the parts of its file are uploaded.
+
+    :param request:
+    :type request: web.Request
+    :rtype: web.Response
+    """
+    logger.debug("Entering kge_complete_upload_session()")
+
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        tracker: Dict = await _get_upload_session(request, upload_token)
+
+        parts: Dict[int, Dict] = await run_in_s3_executor(
+            list_multipart_parts, default_s3_bucket, tracker['object_key'], tracker['upload_id']
+        )
+        size = sum(part['Size'] for part in parts.values())
+        if not parts or size != tracker['end_position']:
+            await report_bad_request(
+                request,
+                f"kge_complete_upload_session(): {size} of {tracker['end_position']} bytes uploaded?"
+            )
+
+        try:
+            await run_in_s3_executor(
+                complete_multipart_upload,
+                default_s3_bucket,
+                tracker['object_key'],
+                tracker['upload_id'],
+                {part_number: part['ETag'] for part_number, part in parts.items()}
+            )
+            await run_in_s3_executor(
+                KnowledgeGraphCatalog.catalog().add_to_kge_file_set,
+                kg_id=tracker["kg_id"],
+                fileset_version=tracker["fileset_version"],
+                file_type=tracker["file_type"],
+                file_name=tracker["content_name"],
+                file_size=size,
+                object_key=tracker['object_key']
+            )
+        except Exception as exc:
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            await get_upload_tracker_store().save(upload_token, tracker)
+            logger.error(f"kge_complete_upload_session('{upload_token}') threw exception: {str(exc)}")
+            await report_bad_request(request, "kge_complete_upload_session(): upload not completed?")
+
+        await run_in_s3_executor(delete_upload_session, upload_token)
+
+        tracker.pop('upload_id')
+        tracker['current_position'] = size
+        tracker['status'] = KgeUploadProgressStatusCode.COMPLETED
+        await get_upload_tracker_store().save(upload_token, tracker)
+
+        response = web.Response(text=str(size), status=200)
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+async def kge_abort_upload_session(request: web.Request) -> web.Response:
+    """Abort a resumable upload session, discarding the parts already uploaded.
+
+    :param request:
+    :type request: web.Request
+    :rtype: web.Response
+    """
+    logger.debug("Entering kge_abort_upload_session()")
+
+    session = await get_session(request)
+    if user_permitted(session):
+
+        upload_token: str = request.query.get('upload_token', '')
+        tracker: Dict = await _get_upload_session(request, upload_token)
+
+        await run_in_s3_executor(
+            abort_multipart_upload, default_s3_bucket, tracker['object_key'], tracker['upload_id']
+        )
+        await run_in_s3_executor(delete_upload_session, upload_token)
+
+        tracker.pop('upload_id')
+        tracker['active'] = False
+        tracker['status'] = KgeUploadProgressStatusCode.ERROR
+        await get_upload_tracker_store().save(upload_token, tracker)
+
+        response = web.Response(status=204)
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
+async def kge_transfer_metrics(request: web.Request) -> web.Response:
+    """Metrics of the file transfer scheduler: numbers of transfers running and queued, overall and per user.
+
+    :param request:
+    :type request: web.Request
+    :rtype: web.Response
+    """
+    session = await get_session(request)
+    if user_permitted(session):
+
+        response = web.json_response(get_transfer_scheduler().get_metrics())
+
+        return await with_session(request, response)
+
+    else:
+        # If session is not active, then just a redirect
+        # directly back to unauthenticated landing page
+        await redirect(request, LANDING_PAGE)
+
+
 async def kge_transfer_from_url(
         request: web.Request,
         kg_id: str,
@@ -927,13 +1731,15 @@ async def kge_transfer_from_url(
         upload_token_object: UploadTokenObject = \
             await _initialize_upload_token(request, kg_id, fileset_version, kgx_file_content, content_name)
         
-        tracker: Dict = get_upload_tracker_details(upload_token_object.upload_token)
+        upload_token: str = upload_token_object.upload_token
         
-        tracker['end_position'] = get_url_file_size(content_url)
+        end_position: int = await async_get_url_file_size(content_url)
         
-        if tracker['end_position'] <= 0:
+        if end_position <= 0:
             await report_bad_request(request, f"kge_transfer_from_url({content_url}): unknown URL resource size?")
-            
+        
+        tracker: Dict = await get_upload_tracker_store().attach(upload_token)
+        tracker['end_position'] = end_position
         tracker['status'] = KgeUploadProgressStatusCode.ONGOING
 
         # create a wrapper of the upload_from_link function to modify status codes
@@ -945,12 +1751,19 @@ async def kge_transfer_from_url(
                 tracker['status'] = KgeUploadProgressStatusCode.ERROR
                 raise e
 
-        await threaded_file_transfer(
-            filename=content_name,
-            tracker=tracker,
-            transfer_function=_upload_from_link,
-            source=content_url
-        )
+        try:
+            await threaded_file_transfer(
+                filename=content_name,
+                upload_token=upload_token,
+                tracker=tracker,
+                transfer_function=_upload_from_link,
+                source=content_url,
+                user=session_user(session)
+            )
+        except TransferSchedulerSaturated as tss:
+            tracker['status'] = KgeUploadProgressStatusCode.ERROR
+            await get_upload_tracker_store().detach(upload_token)
+            await report_too_many_requests(request, f"kge_transfer_from_url(): {str(tss)}", tss.retry_after)
         
         response = web.json_response(upload_token_object.to_dict())
         
@@ -962,20 +1775,15 @@ async def kge_transfer_from_url(
         await redirect(request, LANDING_PAGE)
 
 
-def abort_upload(upload_token: str):
+async def abort_upload(upload_token: str):
     """
-    Signal cancellation of a given upload or transfer.
+    Signal cancellation of a given upload or transfer (possibly run by another worker process).
 
     :param upload_token:
     :return:
     """
-    global _upload_tracker
-
-    if upload_token not in _upload_tracker['upload']:
+    if not await get_upload_tracker_store().cancel(upload_token):
         logger.error(f"abort_upload(): unrecognized token {upload_token}")
-        return
-
-    _upload_tracker['upload'][upload_token]['active'] = False
     
 
 async def cancel_kge_upload(request: web.Request, upload_token):
@@ -1001,7 +1809,16 @@ async def cancel_kge_upload(request: web.Request, upload_token):
         # TODO: trigger deletion of the current upload/transfer operation here(?)
         logger.info(f"cancel_kge_upload() called for upload token '{upload_token}'")
         
-        abort_upload(upload_token)
+        await abort_upload(upload_token)
+
+        # a resumable upload session also discards its parts already uploaded
+        tracker: Dict = await get_upload_tracker_store().get(upload_token) or {}
+        if 'upload_id' in tracker:
+            await run_in_s3_executor(
+                abort_multipart_upload, default_s3_bucket, tracker['object_key'], tracker.pop('upload_id')
+            )
+            await run_in_s3_executor(delete_upload_session, upload_token)
+            await get_upload_tracker_store().save(upload_token, tracker)
         
         # Standard success response for upload file
         # operation deletion, without any returned content
@@ -1075,7 +1892,8 @@ async def get_kge_file_set_metadata(request: web.Request, kg_id: str, fileset_ve
             )
         
         try:
-            file_set_metadata: KgeMetadata = knowledge_graph.get_metadata(fileset_version)
+            # may need to load the data file records of the file set from the KGE Archive
+            file_set_metadata: KgeMetadata = await run_in_s3_executor(knowledge_graph.get_metadata, fileset_version)
 
             if not file_set_metadata:
                 await report_not_found(
@@ -1144,7 +1962,7 @@ async def kge_meta_knowledge_graph(request: web.Request, kg_id: str, fileset_ver
 
         content_metadata_file_key = file_set_location + CONTENT_METADATA_FILE
         
-        if not object_key_exists(object_key=content_metadata_file_key):
+        if not await async_object_key_exists(object_key=content_metadata_file_key):
             if downloading:
                 await redirect(
                     request,
@@ -1158,7 +1976,7 @@ async def kge_meta_knowledge_graph(request: web.Request, kg_id: str, fileset_ver
 
         # Current implementation of this handler triggers a
         # download of the KGX content metadata file, if available
-        download_url = create_presigned_url(object_key=content_metadata_file_key)
+        download_url = await async_create_presigned_url(object_key=content_metadata_file_key)
         logger.debug(f"kge_meta_knowledge_graph() download_url: '{download_url}'")
         if downloading:
             await download(request, download_url)
@@ -1204,18 +2022,16 @@ async def download_kge_file_set_archive(request: web.Request, kg_id, fileset_ver
 
         file_set_object_key, _ = with_version(get_object_location, fileset_version)(kg_id)
 
-        kg_files_for_version = object_keys_in_location(
+        # only list the 'archive' subfolder of the KGE File Set
+        kg_files_for_version = await async_object_keys_in_location(
             default_s3_bucket,
-            file_set_object_key
+            f"{file_set_object_key}archive/"
         )
 
-        maybe_archive = [
-            kg_path for kg_path in kg_files_for_version
-            if ".tar.gz" in kg_path and "archive/" in kg_path
-        ]
+        maybe_archive = [kg_path for kg_path in kg_files_for_version if ".tar.gz" in kg_path]
 
         if len(maybe_archive) > 0:
-            download_url = create_presigned_url(object_key=maybe_archive[0])
+            download_url = await async_create_presigned_url(object_key=maybe_archive[0])
             logger.debug(f"download_kge_file_set_archive() download_url: '{download_url}'")
 
             await download(request, download_url)
@@ -1258,7 +2074,7 @@ async def download_kge_file_set_archive_sha1hash(request: web.Request, kg_id: st
     if not session.empty:
 
         maybe_sha1hash, fileset_version = \
-            object_keys_for_fileset_version(
+            await async_object_keys_for_fileset_version(
                 kg_id=kg_id,
                 fileset_version=fileset_version,
                 match_function=lambda x: "sha1.txt" in x
@@ -1275,7 +2091,7 @@ async def download_kge_file_set_archive_sha1hash(request: web.Request, kg_id: st
             )
 
         if sha1hash_file_key:
-            download_url = create_presigned_url(object_key=sha1hash_file_key)
+            download_url = await async_create_presigned_url(object_key=sha1hash_file_key)
     
             await download(request, download_url)
 
@@ -0,0 +1,121 @@
+"""
+Codec of the pre-parsed ('sidecar') copies of the KGE Archive metadata files.
+
+Parsing the provider.yaml and file_set.yaml metadata files of every knowledge graph is the
+CPU hot spot of a full catalog rebuild. Thus, whenever the application writes one of these
+YAML files, it also writes a compact JSON 'sidecar' file next to it (e.g. 'provider.yaml.json'),
+holding the catalog parameters already parsed (and normalized) from the YAML file. A catalog
+rebuild reads the sidecar files instead, and only parses the YAML files without a fresh sidecar.
+
+Each sidecar records the S3 ETag of its YAML file. The ETag of an (unencrypted, single part)
+S3 object is the MD5 digest of its contents, thus a sidecar is recognized as stale whenever the
+YAML file is rewritten (e.g. by hand, or by an older release of the application) without it.
+"""
+from typing import Dict, Optional, Any
+from hashlib import md5
+
+import json
+
+import yaml
+try:
+    from yaml import CLoader as Loader
+except ImportError:
+    from yaml import Loader
+
+from kgea.config import PROVIDER_METADATA_FILE, FILE_SET_METADATA_FILE
+
+import logging
+logger = logging.getLogger(__name__)
+
+# File name suffix of the sidecar files, appended to the name of their metadata file
+METADATA_SIDECAR_SUFFIX = '.json'
+
+# Version of the sidecar format: sidecars of any other version are ignored (as if stale)
+METADATA_CODEC_VERSION = 1
+
+_SIDECAR_FILE_NAMES = [
+    PROVIDER_METADATA_FILE + METADATA_SIDECAR_SUFFIX,
+    FILE_SET_METADATA_FILE + METADATA_SIDECAR_SUFFIX
+]
+
+
+def get_sidecar_object_key(object_key: str) -> str:
+    """
+    :param object_key: S3 object key of a metadata file
+    :return: S3 object key of the sidecar of the metadata file
+    """
+    return object_key + METADATA_SIDECAR_SUFFIX
+
+
+def is_sidecar_object_key(object_key: str) -> bool:
+    """
+    :param object_key: S3 object key
+    :return: True if the object key is the one of a metadata sidecar file
+    """
+    return object_key.rsplit('/', 1)[-1] in _SIDECAR_FILE_NAMES
+
+
+def normalize_etag(etag: Optional[str]) -> str:
+    """
+    :param etag: S3 ETag, as listed (i.e. quoted) or not
+    :return: the unquoted ETag
+    """
+    return etag.strip('"') if etag else ''
+
+
+def get_metadata_etag(text: str) -> str:
+    """
+    :param text: contents of a metadata file
+    :return: S3 ETag of the metadata file, once uploaded (as a single part, unencrypted, object)
+    """
+    return md5(text.encode('utf-8')).hexdigest()
+
+
+def parse_metadata_yaml(text: str) -> Optional[Dict[str, Any]]:
+    """
+    :param text: YAML contents of a metadata file
+    :return: the parsed metadata; None if the YAML text is improperly formed
+    """
+    try:
+        metadata = yaml.load(text, Loader=Loader)
+    except (yaml.YAMLError, TypeError) as exc:
+        logger.warning(f"parse_metadata_yaml(): improperly formed metadata YAML file: {str(exc)}")
+        return None
+    return dict(metadata) if isinstance(metadata, dict) else None
+
+
+def encode_metadata_sidecar(text: str, parameters: Dict[str, Any]) -> str:
+    """
+    :param text: YAML contents of the metadata file
+    :param parameters: catalog parameters, as parsed from the metadata file
+    :return: contents of the sidecar of the metadata file
+    """
+    return json.dumps(
+        {
+            'codec': METADATA_CODEC_VERSION,
+            'source_etag': get_metadata_etag(text),
+            'parameters': parameters
+        },
+        separators=(',', ':')
+    )
+
+
+def decode_metadata_sidecar(sidecar_text: Optional[str], source_etag: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    :param sidecar_text: contents of the sidecar of a metadata file
+    :param source_etag: S3 ETag of the metadata file, as listed
+    :return: catalog parameters recorded in the sidecar; None if the sidecar is missing, stale or corrupted
+    """
+    if not sidecar_text:
+        return None
+    try:
+        sidecar: Dict[str, Any] = json.loads(sidecar_text)
+    except ValueError:
+        logger.warning("decode_metadata_sidecar(): ignoring corrupted metadata sidecar file")
+        return None
+    if not isinstance(sidecar, dict) or \
+            sidecar.get('codec', None) != METADATA_CODEC_VERSION or \
+            sidecar.get('source_etag', None) != normalize_etag(source_etag):
+        return None
+    parameters = sidecar.get('parameters', None)
+    return parameters if isinstance(parameters, dict) else None
@@ -185,6 +185,15 @@ def user_permitted(session: Session):
     return not session.empty and permitted
 
 
+def session_user(session: Session) -> str:
+    """
+
+    :param session:
+    :return: identifier of the user of the session (e.g. for accounting of the user's file transfers)
+    """
+    return session.get('username', session.get('uid', 'anonymous'))
+
+
 async def with_session(request, response):
     """
     Wraps a response with a session cookie
@@ -282,3 +291,18 @@ async def report_bad_request(request, reason: str, active_session: bool = False)
         web.HTTPBadRequest(reason=reason + f" <a href=\"{HOME_PAGE}\">Go back Home</a>."),
         active_session
     )
+
+
+async def report_too_many_requests(request, reason: str, retry_after: int, active_session: bool = False):
+    """
+
+    :param request:
+    :param reason:
+    :param retry_after: number of seconds after which the request may be retried
+    :param active_session:
+    """
+    await _process_redirection(
+        request,
+        web.HTTPTooManyRequests(reason=reason, headers={'Retry-After': str(retry_after)}),
+        active_session
+    )
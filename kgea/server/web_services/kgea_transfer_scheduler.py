@@ -0,0 +1,312 @@
+"""
+Bounded scheduler of the (long running) file transfers of the KGE Archive, i.e. the uploads
+of the KGX data files and their transfers from URLs.
+
+Transfers run on a dedicated thread pool, separate from the S3 thread pool of kgea_async_file_ops
+(thus, large uploads do not starve the metadata writes and catalog updates run on the latter).
+Each user runs at most a few transfers at once; further transfers are queued, and the queued
+transfers of the users take turns (round robin) as running transfers complete. A transfer
+submitted while the queue is full is refused (see TransferSchedulerSaturated), rather than
+letting the backlog of transfers grow without bounds.
+"""
+from typing import Dict, Callable, Any, Optional
+from asyncio import get_event_loop, create_task, Future, Task, CancelledError
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+from kgea.config import get_app_config
+
+import logging
+logger = logging.getLogger(__name__)
+
+_KGEA_APP_CONFIG = get_app_config()
+
+# Maximum number of file transfers running at once, overall and per user
+Transfer_Concurrency = \
+    _KGEA_APP_CONFIG['Transfer_Concurrency'] if 'Transfer_Concurrency' in _KGEA_APP_CONFIG else 8
+Transfer_Concurrency_Per_User = \
+    _KGEA_APP_CONFIG['Transfer_Concurrency_Per_User'] if 'Transfer_Concurrency_Per_User' in _KGEA_APP_CONFIG \
+    else 2
+
+# Maximum number of file transfers waiting to run, overall and per user, beyond which further
+# transfers are refused, with the number of seconds after which their clients are advised to retry
+Transfer_Queue_Size = \
+    _KGEA_APP_CONFIG['Transfer_Queue_Size'] if 'Transfer_Queue_Size' in _KGEA_APP_CONFIG else 64
+Transfer_Queue_Size_Per_User = \
+    _KGEA_APP_CONFIG['Transfer_Queue_Size_Per_User'] if 'Transfer_Queue_Size_Per_User' in _KGEA_APP_CONFIG \
+    else 16
+Transfer_Retry_After = \
+    _KGEA_APP_CONFIG['Transfer_Retry_After'] if 'Transfer_Retry_After' in _KGEA_APP_CONFIG else 30
+
+
+class TransferSchedulerSaturated(Exception):
+    """
+    Raised when a file transfer is refused, the transfer queue (of the user) being full.
+    """
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
+class TransferScheduler:
+    """
+    Fair, bounded scheduler of file transfers (see the module documentation).
+
+    The scheduler state is only touched from the event loop (thus, needs no lock);
+    the transfers themselves run on the thread pool of the scheduler.
+    """
+    def __init__(
+            self,
+            max_transfers: int = Transfer_Concurrency,
+            max_transfers_per_user: int = Transfer_Concurrency_Per_User,
+            max_queued: int = Transfer_Queue_Size,
+            max_queued_per_user: int = Transfer_Queue_Size_Per_User,
+            retry_after: int = Transfer_Retry_After
+    ):
+        """
+        :param max_transfers: maximum number of transfers running at once
+        :param max_transfers_per_user: maximum number of transfers of a given user running at once
+        :param max_queued: maximum number of transfers waiting to run
+        :param max_queued_per_user: maximum number of transfers of a given user waiting to run
+        :param retry_after: number of seconds after which refused transfers may be retried
+        """
+        self.max_transfers = max_transfers
+        self.max_transfers_per_user = max_transfers_per_user
+        self.max_queued = max_queued
+        self.max_queued_per_user = max_queued_per_user
+        self.retry_after = retry_after
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self._running: Dict[str, int] = dict()
+
+        # waiting transfers of each user, the users in their (round robin) order of service
+        self._queues: OrderedDict = OrderedDict()
+        self._queued: int = 0
+
+        self._metrics: Dict = {
+            'completed': 0,
+            'refused': 0,
+            'max_queued': 0
+        }
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        :return: thread pool executor of the transfers
+        """
+        if not self._executor:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_transfers, thread_name_prefix="kgea-transfer")
+        return self._executor
+
+    def shutdown(self):
+        """
+        Shut down the thread pool executor of the transfers, waiting for the running transfers to complete.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def running(self) -> int:
+        """
+        :return: number of transfers running
+        """
+        return sum(self._running.values())
+
+    def queued(self) -> int:
+        """
+        :return: number of transfers waiting to run
+        """
+        return self._queued
+
+    def _can_run(self, user: str) -> bool:
+        return self.running() < self.max_transfers and \
+            self._running.get(user, 0) < self.max_transfers_per_user
+
+    def admit(self, user: str):
+        """
+        Check that a transfer of a user may be scheduled, i.e. run at once or queued.
+
+        :param user: identifier of the user
+        :raises TransferSchedulerSaturated: if the transfer queue (of the user) is full
+        """
+        if self._can_run(user) and user not in self._queues:
+            return
+
+        if self._queued >= self.max_queued:
+            reason = f"{self._queued} file transfers already waiting"
+        elif len(self._queues.get(user, ())) >= self.max_queued_per_user:
+            reason = f"{self.max_queued_per_user} file transfers of user '{user}' already waiting"
+        else:
+            return
+
+        self._metrics['refused'] += 1
+        logger.warning(f"TransferScheduler.admit(): transfer refused, {reason}")
+        raise TransferSchedulerSaturated(reason, self.retry_after)
+
+    async def acquire(self, user: str):
+        """
+        Wait for a transfer slot of a user; the transfer must have been admitted (see admit()).
+
+        :param user: identifier of the user
+        """
+        if self._can_run(user) and user not in self._queues:
+            self._running[user] = self._running.get(user, 0) + 1
+            return
+
+        slot: Future = get_event_loop().create_future()
+        self._queues.setdefault(user, deque()).append(slot)
+        self._queued += 1
+        self._metrics['max_queued'] = max(self._metrics['max_queued'], self._queued)
+        logger.debug(f"TransferScheduler.acquire(): transfer of '{user}' queued, {self._queued} waiting")
+        try:
+            await slot
+        except CancelledError:
+            if slot.done() and not slot.cancelled():
+                # the slot was granted just as the wait was cancelled
+                self.release(user)
+            elif user in self._queues and slot in self._queues[user]:
+                self._queues[user].remove(slot)
+                self._queued -= 1
+                if not self._queues[user]:
+                    del self._queues[user]
+            raise
+
+    def release(self, user: str):
+        """
+        Release a transfer slot of a user, granting it to the next queued transfer (if any).
+
+        :param user: identifier of the user
+        """
+        self._running[user] -= 1
+        if not self._running[user]:
+            del self._running[user]
+        self._metrics['completed'] += 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._queues and self.running() < self.max_transfers:
+            for user in self._queues:
+                if self._running.get(user, 0) < self.max_transfers_per_user:
+                    break
+            else:
+                # every user having queued transfers runs all of the transfers it may
+                return
+
+            queue = self._queues[user]
+            slot: Future = queue.popleft()
+            self._queued -= 1
+            if queue:
+                # the user takes its next turn after the other users waiting
+                self._queues.move_to_end(user)
+            else:
+                del self._queues[user]
+
+            if slot.cancelled():
+                # the waiting transfer was cancelled, but its task has not yet resumed
+                continue
+
+            self._running[user] = self._running.get(user, 0) + 1
+            slot.set_result(True)
+
+    @asynccontextmanager
+    async def transfer(self, user: str):
+        """
+        Asynchronous context of a transfer of a user (e.g. a streamed upload, run on the event loop),
+        admitted then holding a transfer slot.
+
+        :param user: identifier of the user
+        :raises TransferSchedulerSaturated: if the transfer queue (of the user) is full
+        """
+        self.admit(user)
+        await self.acquire(user)
+        try:
+            yield
+        finally:
+            self.release(user)
+
+    async def run(self, user: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking transfer function of a user on the transfer thread pool, once admitted and scheduled.
+
+        :param user: identifier of the user
+        :param func: transfer function to run
+        :param args: positional arguments of the function
+        :param kwargs: keyword arguments of the function
+        :return: result of the function
+        :raises TransferSchedulerSaturated: if the transfer queue (of the user) is full
+        """
+        async with self.transfer(user):
+            return await get_event_loop().run_in_executor(self.get_executor(), partial(func, *args, **kwargs))
+
+    def submit(self, user: str, func: Callable, *args, **kwargs) -> Task:
+        """
+        Schedule a blocking transfer function of a user in the background (see run()).
+        The transfer is admitted at once, thus the caller may report a refusal to its client.
+
+        :param user: identifier of the user
+        :param func: transfer function to run
+        :param args: positional arguments of the function
+        :param kwargs: keyword arguments of the function
+        :return: asyncio Task of the transfer
+        :raises TransferSchedulerSaturated: if the transfer queue (of the user) is full
+        """
+        self.admit(user)
+
+        async def background_transfer():
+            try:
+                await self.acquire(user)
+            except CancelledError:
+                return
+            try:
+                return await get_event_loop().run_in_executor(self.get_executor(), partial(func, *args, **kwargs))
+            except Exception as exc:
+                logger.error(f"TransferScheduler.submit(): transfer of '{user}' failed: {str(exc)}")
+            finally:
+                self.release(user)
+
+        return create_task(background_transfer())
+
+    def get_metrics(self) -> Dict:
+        """
+        :return: dictionary of transfer metrics: numbers of transfers running and queued (overall and
+                 per user), completed and refused, and the largest number of transfers ever queued
+        """
+        return {
+            'running': self.running(),
+            'queued': self._queued,
+            'max_transfers': self.max_transfers,
+            'max_queue_size': self.max_queued,
+            'users': {
+                user: {
+                    'running': self._running.get(user, 0),
+                    'queued': len(self._queues.get(user, ()))
+                }
+                for user in set(self._running) | set(self._queues)
+            },
+            **self._metrics
+        }
+
+
+_transfer_scheduler: Optional[TransferScheduler] = None
+
+
+def get_transfer_scheduler() -> TransferScheduler:
+    """
+    :return: (singleton) transfer scheduler of the application
+    """
+    global _transfer_scheduler
+    if not _transfer_scheduler:
+        _transfer_scheduler = TransferScheduler()
+    return _transfer_scheduler
+
+
+def shutdown_transfer_scheduler():
+    """
+    Shut down the transfer scheduler, waiting for the running transfers to complete.
+    """
+    global _transfer_scheduler
+    if _transfer_scheduler:
+        _transfer_scheduler.shutdown()
+        _transfer_scheduler = None
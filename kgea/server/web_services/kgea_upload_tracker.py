@@ -0,0 +1,435 @@
+"""
+Pluggable storage backends of the upload trackers of the KGE Archive, i.e. the details and progress
+of the uploads (and URL transfers) of the files of KGE File Sets, indexed by upload token.
+
+The tracker of a transfer run by a web service worker process is 'live' in that process: it is
+updated in place (e.g. by the ProgressPercentage callbacks of the transfer thread), and its snapshots
+are published to the tracker backend at most once per flush interval, rather than upon every progress
+callback. The trackers are thus visible to every worker sharing the backend (e.g. memcached), such that
+the progress of an upload may be polled from, and the upload cancelled through, any worker.
+
+The sizes of the parts uploaded in a resumable upload session are held by the backends as distinct
+entries (one per part, rather than in the tracker details), thus the parts of a session may be uploaded
+concurrently, e.g. through several workers, without any of them overwriting the parts recorded by the others.
+
+Trackers are evicted by the backends once unused for some time (see Upload_Tracker_TTL).
+"""
+from typing import Dict, Optional, Any, Iterable, List
+from abc import ABC, abstractmethod
+from asyncio import sleep, create_task, Task, CancelledError
+from collections import OrderedDict
+from time import time
+
+import json
+
+from kgea.config import get_app_config
+
+from kgea.server.web_services.catalog import KgeFileType
+
+import logging
+logger = logging.getLogger(__name__)
+
+_KGEA_APP_CONFIG = get_app_config()
+
+# Upload tracker backend: 'memory' (trackers private to each process) or 'memcached'
+Upload_Tracker_Backend = \
+    _KGEA_APP_CONFIG['Upload_Tracker_Backend'] if 'Upload_Tracker_Backend' in _KGEA_APP_CONFIG else 'memory'
+
+# Host and port of the memcached upload tracker backend (by default, the session memcached server)
+Upload_Tracker_Memcached_Host = \
+    _KGEA_APP_CONFIG['Upload_Tracker_Memcached_Host'] if 'Upload_Tracker_Memcached_Host' in _KGEA_APP_CONFIG \
+    else 'memcached'
+Upload_Tracker_Memcached_Port = \
+    _KGEA_APP_CONFIG['Upload_Tracker_Memcached_Port'] if 'Upload_Tracker_Memcached_Port' in _KGEA_APP_CONFIG \
+    else 11211
+
+# Number of seconds after their last update after which upload trackers are evicted, and
+# maximum number of upload trackers held by the 'memory' backend (least recently used evicted first)
+Upload_Tracker_TTL = \
+    _KGEA_APP_CONFIG['Upload_Tracker_TTL'] if 'Upload_Tracker_TTL' in _KGEA_APP_CONFIG else 86400
+Upload_Tracker_Max_Entries = \
+    _KGEA_APP_CONFIG['Upload_Tracker_Max_Entries'] if 'Upload_Tracker_Max_Entries' in _KGEA_APP_CONFIG \
+    else 10000
+
+# Number of seconds between the publications of the progress of the live upload trackers
+Upload_Tracker_Flush_Interval = \
+    _KGEA_APP_CONFIG['Upload_Tracker_Flush_Interval'] if 'Upload_Tracker_Flush_Interval' in _KGEA_APP_CONFIG \
+    else 1.0
+
+# Number of seconds between the (changed) upload progress events pushed to the clients
+Upload_Progress_Event_Interval = \
+    _KGEA_APP_CONFIG['Upload_Progress_Event_Interval'] if 'Upload_Progress_Event_Interval' in _KGEA_APP_CONFIG \
+    else 1.0
+
+
+def encode_upload_tracker(details: Dict[str, Any]) -> str:
+    """
+    :param details: upload tracker details
+    :return: JSON text of the upload tracker details
+    """
+    record: Dict[str, Any] = dict(details)
+    if isinstance(record.get('file_type', None), KgeFileType):
+        record['file_type'] = record['file_type'].value
+    return json.dumps(record)
+
+
+def decode_upload_tracker(text: str) -> Dict[str, Any]:
+    """
+    :param text: JSON text of upload tracker details, as encoded by encode_upload_tracker()
+    :return: upload tracker details
+    """
+    details: Dict[str, Any] = json.loads(text)
+    if 'file_type' in details:
+        details['file_type'] = KgeFileType(details['file_type'])
+    if 'parts' in details:
+        # JSON object keys are strings
+        details['parts'] = {int(part_number): size for part_number, size in details['parts'].items()}
+    return details
+
+
+class UploadTrackerBackend(ABC):
+    """
+    Upload tracker storage backend interface, of (JSON encoded) upload tracker details indexed by upload token.
+    """
+    @abstractmethod
+    async def load(self, upload_token: str) -> Optional[str]:
+        """
+        :param upload_token: upload token
+        :return: JSON text of the upload tracker details; None if unknown (or evicted)
+        """
+
+    @abstractmethod
+    async def save(self, upload_token: str, text: str):
+        """
+        :param upload_token: upload token
+        :param text: JSON text of the upload tracker details
+        """
+
+    @abstractmethod
+    async def delete(self, upload_token: str):
+        """
+        :param upload_token: upload token
+        """
+
+    @abstractmethod
+    async def save_part(self, upload_token: str, part_number: int, size: int):
+        """
+        :param upload_token: upload token of a resumable upload session
+        :param part_number: number of a part uploaded in the session
+        :param size: size of the part (number of bytes);
+                     the parts of unknown upload sessions (e.g. of evicted trackers) may be ignored
+        """
+
+    @abstractmethod
+    async def load_parts(self, upload_token: str, part_numbers: Iterable[int]) -> Dict[int, int]:
+        """
+        :param upload_token: upload token of a resumable upload session
+        :param part_numbers: numbers of the parts of the session
+        :return: sizes of the parts uploaded in the session (among the given ones), indexed by part number
+        """
+
+    async def close(self):
+        """
+        Release the resources of the backend.
+        """
+        pass
+
+
+class MemoryUploadTrackerBackend(UploadTrackerBackend):
+    """
+    Upload trackers held in the memory of the process, evicting the least recently used
+    trackers beyond a maximum number of trackers, and the trackers not updated for a while.
+    """
+    def __init__(self, max_entries: int = Upload_Tracker_Max_Entries, ttl: int = Upload_Tracker_TTL):
+        """
+        :param max_entries: maximum number of upload trackers held
+        :param ttl: number of seconds after their last update after which upload trackers are evicted
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # (expiration time, JSON text) of the upload trackers, least recently used first,
+        # and the sizes of the parts of the upload sessions (evicted with their tracker)
+        self._entries: OrderedDict = OrderedDict()
+        self._parts: Dict[str, Dict[int, int]] = dict()
+
+    async def load(self, upload_token: str) -> Optional[str]:
+        entry = self._entries.get(upload_token, None)
+        if not entry:
+            return None
+        expiration, text = entry
+        if expiration < time():
+            del self._entries[upload_token]
+            self._parts.pop(upload_token, None)
+            return None
+        self._entries.move_to_end(upload_token)
+        return text
+
+    async def save(self, upload_token: str, text: str):
+        self._entries[upload_token] = (time() + self.ttl, text)
+        self._entries.move_to_end(upload_token)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._parts.pop(evicted, None)
+
+    async def delete(self, upload_token: str):
+        self._entries.pop(upload_token, None)
+        self._parts.pop(upload_token, None)
+
+    async def save_part(self, upload_token: str, part_number: int, size: int):
+        # only the parts of the (unexpired) trackers are recorded, thus evicted with them
+        entry = self._entries.get(upload_token, None)
+        if not entry or entry[0] < time():
+            logger.debug(f"save_part(): part {part_number} of unknown upload session '{upload_token}' ignored")
+            return
+        self._parts.setdefault(upload_token, dict())[part_number] = size
+
+    async def load_parts(self, upload_token: str, part_numbers: Iterable[int]) -> Dict[int, int]:
+        parts: Dict[int, int] = self._parts.get(upload_token, {})
+        return {part_number: parts[part_number] for part_number in part_numbers if part_number in parts}
+
+
+class MemcachedUploadTrackerBackend(UploadTrackerBackend):
+    """
+    Upload trackers held by a memcached server, shared by all the worker processes of the application.
+    """
+    def __init__(self, client, ttl: int = Upload_Tracker_TTL):
+        """
+        :param client: aiomcache.Client of the memcached server
+        :param ttl: number of seconds after their last update after which upload trackers are evicted
+        """
+        self.client = client
+        self.ttl = ttl
+
+    # maximum number of keys read by a single memcached 'get' command
+    MAX_KEYS_PER_GET = 100
+
+    @staticmethod
+    def _key(upload_token: str) -> bytes:
+        return f"kgea-upload-{upload_token}".encode('utf-8')
+
+    @staticmethod
+    def _part_key(upload_token: str, part_number: int) -> bytes:
+        return f"kgea-upload-{upload_token}-part-{part_number}".encode('utf-8')
+
+    async def load(self, upload_token: str) -> Optional[str]:
+        value: Optional[bytes] = await self.client.get(self._key(upload_token))
+        return value.decode('utf-8') if value is not None else None
+
+    async def save(self, upload_token: str, text: str):
+        await self.client.set(self._key(upload_token), text.encode('utf-8'), exptime=self.ttl)
+
+    async def delete(self, upload_token: str):
+        # (the part entries of an upload session simply expire)
+        await self.client.delete(self._key(upload_token))
+
+    async def save_part(self, upload_token: str, part_number: int, size: int):
+        await self.client.set(self._part_key(upload_token, part_number), str(size).encode('utf-8'), exptime=self.ttl)
+
+    async def load_parts(self, upload_token: str, part_numbers: Iterable[int]) -> Dict[int, int]:
+        part_numbers: List[int] = list(part_numbers)
+        parts: Dict[int, int] = dict()
+        for i in range(0, len(part_numbers), self.MAX_KEYS_PER_GET):
+            batch: List[int] = part_numbers[i:i + self.MAX_KEYS_PER_GET]
+            values = await self.client.multi_get(*[self._part_key(upload_token, n) for n in batch])
+            for part_number, value in zip(batch, values):
+                if value is not None:
+                    parts[part_number] = int(value)
+        return parts
+
+    async def close(self):
+        await self.client.close()
+
+
+class UploadTrackerStore:
+    """
+    Upload trackers of the application, held by an upload tracker backend,
+    with the live trackers of the transfers run by this process (see the module documentation).
+    """
+    def __init__(self, backend: UploadTrackerBackend, flush_interval: float = Upload_Tracker_Flush_Interval):
+        """
+        :param backend: upload tracker backend
+        :param flush_interval: number of seconds between the publications of the live upload trackers
+        """
+        self.backend = backend
+        self.flush_interval = flush_interval
+
+        # live upload trackers, with the JSON text of their last published snapshot
+        self._live: Dict[str, Dict[str, Any]] = dict()
+        self._published: Dict[str, str] = dict()
+
+    async def get(self, upload_token: str) -> Optional[Dict[str, Any]]:
+        """
+        :param upload_token: upload token
+        :return: the live upload tracker details of a transfer run by this process, otherwise
+                 a copy of the upload tracker details (changes of which are to be saved), with the
+                 'parts' (and 'current_position') of an open resumable upload session recorded thus far;
+                 None if the upload token is unknown (or its tracker evicted)
+        """
+        if upload_token in self._live:
+            return self._live[upload_token]
+        text: Optional[str] = await self.backend.load(upload_token)
+        if not text:
+            return None
+        details: Dict[str, Any] = decode_upload_tracker(text)
+        if 'upload_id' in details:
+            part_count: int = max(-(-details['end_position'] // details['part_size']), 1)
+            details['parts'] = await self.backend.load_parts(upload_token, range(1, part_count + 1))
+            details['current_position'] = sum(details['parts'].values())
+        return details
+
+    async def save_part(self, upload_token: str, part_number: int, size: int):
+        """
+        Record a part uploaded in a resumable upload session,
+        independently of the other parts (see the module documentation).
+
+        :param upload_token: upload token of the upload session
+        :param part_number: number of the part
+        :param size: size of the part (number of bytes)
+        """
+        await self.backend.save_part(upload_token, part_number, size)
+
+    async def save_parts(self, upload_token: str, parts: Dict[int, int]):
+        """
+        Record the parts uploaded in a resumable upload session (e.g. as listed by S3).
+
+        :param upload_token: upload token of the upload session
+        :param parts: sizes of the parts, indexed by part number
+        """
+        for part_number, size in parts.items():
+            await self.backend.save_part(upload_token, part_number, size)
+
+    async def save(self, upload_token: str, details: Dict[str, Any]):
+        """
+        :param upload_token: upload token
+        :param details: upload tracker details
+        """
+        text = encode_upload_tracker(details)
+        await self.backend.save(upload_token, text)
+        if upload_token in self._live:
+            self._published[upload_token] = text
+
+    async def attach(self, upload_token: str) -> Optional[Dict[str, Any]]:
+        """
+        Make the upload tracker of a transfer run by this process live (until detached).
+
+        :param upload_token: upload token
+        :return: the live upload tracker details; None if the upload token is unknown (or its tracker evicted)
+        """
+        details: Optional[Dict[str, Any]] = await self.get(upload_token)
+        if details is not None:
+            self._live[upload_token] = details
+        return details
+
+    async def detach(self, upload_token: str):
+        """
+        Publish the final state of a live upload tracker (e.g. once its transfer completed or failed),
+        which is no longer live thereafter.
+
+        :param upload_token: upload token
+        """
+        details: Optional[Dict[str, Any]] = self._live.pop(upload_token, None)
+        self._published.pop(upload_token, None)
+        if details is not None:
+            await self.backend.save(upload_token, encode_upload_tracker(details))
+
+    async def cancel(self, upload_token: str) -> bool:
+        """
+        Signal the cancellation of an upload (or transfer), possibly run by another process.
+
+        :param upload_token: upload token
+        :return: False if the upload token is unknown
+        """
+        details: Optional[Dict[str, Any]] = await self.get(upload_token)
+        if details is None:
+            return False
+        details['active'] = False
+        await self.save(upload_token, details)
+        return True
+
+    async def flush(self):
+        """
+        Publish the snapshots of the live upload trackers updated since their last publication,
+        picking up their cancellation (if any) by other processes.
+        """
+        for upload_token, details in list(self._live.items()):
+            text: Optional[str] = await self.backend.load(upload_token)
+            if text and not json.loads(text).get('active', True):
+                details['active'] = False
+            text = encode_upload_tracker(details)
+            if self._published.get(upload_token, None) != text and upload_token in self._live:
+                await self.backend.save(upload_token, text)
+                self._published[upload_token] = text
+
+    async def flusher(self):
+        """
+        Background task periodically publishing the live upload trackers.
+        """
+        while True:
+            await sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as exc:
+                logger.error("UploadTrackerStore.flusher(): " + str(exc))
+
+
+def get_upload_tracker_backend() -> UploadTrackerBackend:
+    """
+    :return: the upload tracker backend configured by 'Upload_Tracker_Backend'
+    """
+    if Upload_Tracker_Backend == 'memcached':
+        try:
+            import aiomcache
+            logger.info(
+                "Upload trackers shared through the memcached server " +
+                f"'{Upload_Tracker_Memcached_Host}:{Upload_Tracker_Memcached_Port}'"
+            )
+            return MemcachedUploadTrackerBackend(
+                aiomcache.Client(Upload_Tracker_Memcached_Host, Upload_Tracker_Memcached_Port)
+            )
+        except ImportError:
+            logger.warning("aiomcache is not installed... upload trackers only held in memory!")
+    elif Upload_Tracker_Backend != 'memory':
+        logger.warning(
+            f"Unknown Upload_Tracker_Backend '{Upload_Tracker_Backend}'... upload trackers only held in memory!"
+        )
+    return MemoryUploadTrackerBackend()
+
+
+_upload_tracker_store: Optional[UploadTrackerStore] = None
+
+
+def get_upload_tracker_store() -> UploadTrackerStore:
+    """
+    :return: (singleton) upload tracker store of the application
+    """
+    global _upload_tracker_store
+    if not _upload_tracker_store:
+        _upload_tracker_store = UploadTrackerStore(get_upload_tracker_backend())
+    return _upload_tracker_store
+
+
+async def start_upload_tracker_flusher(app):
+    """
+    Web application startup hook, launching the background publication of the live upload trackers.
+
+    :param app: aiohttp web application
+    """
+    app['upload_tracker_flusher'] = create_task(get_upload_tracker_store().flusher())
+
+
+async def stop_upload_tracker_flusher(app):
+    """
+    Web application cleanup hook, cancelling the background publication of the live upload trackers.
+
+    :param app: aiohttp web application
+    """
+    flusher: Optional[Task] = app.get('upload_tracker_flusher', None)
+    if flusher:
+        flusher.cancel()
+        try:
+            await flusher
+        except CancelledError:
+            pass
+    store = get_upload_tracker_store()
+    await store.flush()
+    await store.backend.close()
@@ -28,11 +28,14 @@ from kgea.config import (
     PUBLISH_FILE_SET,
     # SETUP_UPLOAD_CONTEXT,
     UPLOAD_FILE,
+    UPLOAD_SESSION,
+    UPLOAD_PROGRESS_EVENTS,
     DIRECT_URL_TRANSFER,
     CANCEL_UPLOAD,
     # GET_UPLOAD_STATUS,
     get_fileset_metadata_url,
     get_meta_knowledge_graph_url,
+    get_fileset_versions_url,
     BACKEND
 )
 from kgea.server.web_services.catalog import get_biolink_model_releases
@@ -53,7 +56,7 @@ from .kgea_users import (
     authenticate_user,
     mock_user_attributes
 )
-from kgea.server.web_services.kgea_file_ops import get_default_date_stamp, get_fileset_versions_available
+from kgea.server.web_services.kgea_file_ops import get_default_date_stamp
 
 # Master flag for local development runs bypassing authentication and other production processes
 DEV_MODE = getenv('DEV_MODE', default=False)
@@ -284,16 +287,8 @@ async def get_kge_fileset_registration_form(request: web.Request) -> web.Respons
         if not kg_id:
             await redirect(request, HOME_PAGE, active_session=True)
 
-        fileset_versions = get_fileset_versions_available(
-            bucket_name=_KGEA_APP_CONFIG['aws']['s3']['bucket']
-        )
-        # default case when a registered graph has no file versions
-        max_major, max_minor = 1, 0
-        if kg_id in fileset_versions and len(fileset_versions[kg_id]) > 0:  # if a registered graph does have file versions, increment from latest
-            maximum_version = max(float(el) for el in fileset_versions[kg_id])
-            max_major_str, max_minor_str = str(maximum_version).split('.')     # because "1.0" splits into ["1", "0"], and can be destructed
-            max_major, max_minor = int(max_major_str), int(max_minor_str) + 1  # increment minor version to prevent collision
-
+        # The next file set version (by default, "1.0") is looked up by the form itself,
+        # from the file set versions of the knowledge graph in the back end catalog
         context = {
             "kg_id": kg_id,
             "kg_name": kg_name,
@@ -302,8 +297,9 @@ async def get_kge_fileset_registration_form(request: web.Request) -> web.Respons
             "submitter_email": session['email'],
 
             "biolink_model_releases": _biolink_model_releases,
-            "fileset_major_version": max_major,
-            "fileset_minor_version": max_minor,
+            "fileset_major_version": 1,
+            "fileset_minor_version": 0,
+            "get_fileset_versions": get_fileset_versions_url(kg_id),
 
             "date_stamp": get_default_date_stamp(),
             
@@ -349,6 +345,8 @@ async def get_kge_file_upload_form(request: web.Request) -> web.Response:
             "fileset_version": fileset_version,
             "submitter_name": submitter_name,
             "upload_action": UPLOAD_FILE,
+            "upload_session_action": UPLOAD_SESSION,
+            "upload_progress_events": UPLOAD_PROGRESS_EVENTS,
             "direct_url_transfer_action": DIRECT_URL_TRANSFER,
             "cancel_upload_action": CANCEL_UPLOAD,
             "publish_file_set_action": PUBLISH_FILE_SET
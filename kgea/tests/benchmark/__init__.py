@@ -0,0 +1,3 @@
+"""
+Benchmark scripts (run as python modules, not collected by pytest)
+"""
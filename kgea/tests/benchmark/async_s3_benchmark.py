@@ -0,0 +1,107 @@
+"""
+Benchmark of request latencies under concurrent catalog and metadata requests, comparing S3 calls
+made directly on the event loop (as the handlers formerly did) with the kgea_async_file_ops facade.
+
+'Catalog' requests only touch in-memory data, thus their latency measures how long the event loop
+is stalled by the S3 calls of the concurrent 'metadata' requests (object_key_exists() plus
+create_presigned_url(), as in the kge_meta_knowledge_graph() handler).
+
+Usage (requires S3 access to the test bucket):
+
+    python -m kgea.tests.benchmark.async_s3_benchmark --requests 200 --concurrency 32
+"""
+from typing import List, Dict
+from argparse import ArgumentParser
+from asyncio import get_event_loop, gather, sleep, Semaphore
+from statistics import quantiles
+from time import perf_counter
+
+from kgea.tests import TEST_BUCKET, TEST_LARGE_NODES_FILE_KEY
+
+from kgea.server.web_services.kgea_file_ops import object_key_exists, create_presigned_url
+from kgea.server.web_services.kgea_async_file_ops import (
+    async_object_key_exists,
+    async_create_presigned_url,
+    shutdown_s3_executor
+)
+
+
+async def catalog_request():
+    """
+    Simulated (in-memory) catalog request.
+    """
+    await sleep(0)
+
+
+async def blocking_metadata_request():
+    """
+    Metadata request with S3 calls run directly on the event loop.
+    """
+    if object_key_exists(TEST_LARGE_NODES_FILE_KEY, bucket_name=TEST_BUCKET):
+        create_presigned_url(TEST_LARGE_NODES_FILE_KEY, bucket=TEST_BUCKET)
+
+
+async def async_metadata_request():
+    """
+    Metadata request with S3 calls awaited through the asynchronous S3 facade.
+    """
+    if await async_object_key_exists(TEST_LARGE_NODES_FILE_KEY, bucket_name=TEST_BUCKET):
+        await async_create_presigned_url(TEST_LARGE_NODES_FILE_KEY, bucket=TEST_BUCKET)
+
+
+async def run_mode(metadata_request, requests: int, concurrency: int) -> Dict[str, List[float]]:
+    """
+    Run interleaved catalog and metadata requests, with bounded concurrency.
+
+    :return: latencies (in seconds) of each kind of request
+    """
+    latencies: Dict[str, List[float]] = {'catalog': [], 'metadata': []}
+    semaphore = Semaphore(concurrency)
+
+    async def timed(kind: str, request):
+        async with semaphore:
+            start = perf_counter()
+            await request()
+            latencies[kind].append(perf_counter() - start)
+
+    tasks = list()
+    for _ in range(requests):
+        tasks.append(timed('catalog', catalog_request))
+        tasks.append(timed('metadata', metadata_request))
+    await gather(*tasks)
+
+    return latencies
+
+
+def report(mode: str, latencies: Dict[str, List[float]]):
+    """
+    Print the p50, p95 and p99 latencies (in milliseconds) of each kind of request.
+    """
+    for kind, values in latencies.items():
+        percentile = quantiles(values, n=100)
+        print(
+            f"{mode:>8} {kind:>8}: p50 {1000*percentile[49]:8.2f} ms, " +
+            f"p95 {1000*percentile[94]:8.2f} ms, p99 {1000*percentile[98]:8.2f} ms"
+        )
+
+
+def main():
+    """
+    Benchmark entry point
+    """
+    parser = ArgumentParser(description="Latency benchmark of the asynchronous S3 facade")
+    parser.add_argument('--requests', type=int, default=200, help="number of requests of each kind")
+    parser.add_argument('--concurrency', type=int, default=32, help="maximum number of concurrent requests")
+    args = parser.parse_args()
+
+    loop = get_event_loop()
+    try:
+        for mode, metadata_request in [('blocking', blocking_metadata_request), ('async', async_metadata_request)]:
+            latencies = loop.run_until_complete(run_mode(metadata_request, args.requests, args.concurrency))
+            report(mode, latencies)
+    finally:
+        shutdown_s3_executor()
+
+
+if __name__ == '__main__':
+    main()
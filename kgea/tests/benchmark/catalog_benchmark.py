@@ -0,0 +1,234 @@
+"""
+Benchmark of the KnowledgeGraphCatalog load, over a synthetic KGE Archive held in
+a local (moto mocked) S3 bucket, filled with N knowledge graphs, each with M file set
+versions of K data files. The provider.yaml and file_set.yaml metadata files are
+rendered from the templates in kgea/api (as the application itself generates them)
+and, unless --no-sidecars is given, come with their pre-parsed JSON sidecar files.
+
+For increasing N, the following are reported:
+
+- the duration of a full scan of the KGE Archive (get_archive_contents());
+- the startup time of the catalog, cold (from a full scan of the KGE Archive)
+  and warm (from the persisted catalog index), with the peak memory allocated
+  by a cold startup (as traced by tracemalloc, above the memory already held,
+  e.g. by the contents of the mocked bucket);
+- the p50, p95 and p99 latencies of the catalog requests (get_kg_entries())
+  and of single knowledge graph lookups.
+
+Usage (requires the 'moto' package, see requirements-dev.txt):
+
+    python -m kgea.tests.benchmark.catalog_benchmark --sizes 10,100,1000 --versions 2 --files 4
+"""
+from typing import List, Dict, Callable
+from argparse import ArgumentParser
+from os import environ
+from random import choice
+from statistics import quantiles
+from time import perf_counter
+import tracemalloc
+
+try:
+    from moto import mock_s3, mock_sts
+except ImportError:
+    mock_s3 = mock_sts = None
+
+
+def _percentiles(values: List[float]) -> str:
+    percentile = quantiles(values, n=100)
+    return f"p50 {1000*percentile[49]:8.3f} ms, p95 {1000*percentile[94]:8.3f} ms, p99 {1000*percentile[98]:8.3f} ms"
+
+
+def _timed(func: Callable, requests: int) -> List[float]:
+    latencies: List[float] = list()
+    for _ in range(requests):
+        start = perf_counter()
+        func()
+        latencies.append(perf_counter() - start)
+    return latencies
+
+
+class SyntheticArchive:
+    """
+    Synthetic KGE Archive, in the (mocked) S3 bucket of the application.
+    """
+    def __init__(self, versions: int, files: int, sidecars: bool = True):
+        """
+        :param versions: number of file set versions per knowledge graph
+        :param files: number of data files per file set version
+        :param sidecars: if True, the metadata files come with their sidecar files
+        """
+        # imported only once the AWS services are mocked
+        from kgea.server.web_services.kgea_file_ops import (
+            s3_client,
+            default_s3_bucket,
+            default_s3_region,
+            get_object_location
+        )
+        self.bucket = default_s3_bucket
+        self.client = s3_client()
+        self.get_object_location = get_object_location
+        self.versions = versions
+        self.files = files
+        self.sidecars = sidecars
+        self.kg_count = 0
+        self.object_count = 0
+
+        if default_s3_region == 'us-east-1':
+            self.client.create_bucket(Bucket=self.bucket)
+        else:
+            self.client.create_bucket(
+                Bucket=self.bucket,
+                CreateBucketConfiguration={'LocationConstraint': default_s3_region}
+            )
+
+    def _put(self, object_key: str, body: str):
+        self.client.put_object(Bucket=self.bucket, Key=object_key, Body=body.encode('utf-8'))
+        self.object_count += 1
+
+    def _put_metadata(self, object_key: str, text: str, parameters: Dict):
+        from kgea.server.web_services.kgea_metadata_codec import get_sidecar_object_key, encode_metadata_sidecar
+        self._put(object_key, text)
+        if self.sidecars:
+            self._put(get_sidecar_object_key(object_key), encode_metadata_sidecar(text, parameters))
+
+    def add_knowledge_graph(self):
+        """
+        Add a knowledge graph, with its file set versions and data files, to the KGE Archive.
+        """
+        from kgea.config import PROVIDER_METADATA_FILE, FILE_SET_METADATA_FILE
+        from kgea.server.web_services.catalog import KgeKnowledgeGraph, KgeFileSet, KnowledgeGraphCatalog
+
+        kg_id = f"synthetic_graph_{self.kg_count:06d}"
+        self.kg_count += 1
+
+        knowledge_graph = KgeKnowledgeGraph(
+            kg_id=kg_id,
+            kg_name=f"Synthetic Graph {self.kg_count}",
+            kg_description=f"Synthetic knowledge graph number {self.kg_count}, for benchmarking",
+            translator_component="KP",
+            translator_team=f"Benchmark Team {self.kg_count % 10}",
+            submitter_name="Benchmark Submitter",
+            submitter_email="benchmark@example.org",
+            license_name="MIT",
+            license_url="https://opensource.org/licenses/MIT",
+            terms_of_service="https://example.org/terms"
+        )
+        location = self.get_object_location(kg_id)
+        text = knowledge_graph.generate_provider_metadata_file()
+        self._put_metadata(
+            location + PROVIDER_METADATA_FILE, text, KnowledgeGraphCatalog.parse_provider_metadata(kg_id, text)
+        )
+
+        for version in range(self.versions):
+            fileset_version = f"1.{version}"
+            file_set = KgeFileSet(
+                kg_id,
+                biolink_model_release="2.2.11",
+                fileset_version=fileset_version,
+                submitter_name="Benchmark Submitter",
+                submitter_email="benchmark@example.org",
+                size=0
+            )
+            data_file_keys: List[str] = list()
+            for i in range(self.files):
+                kind = 'nodes' if i % 2 == 0 else 'edges'
+                data_file_keys.append(f"{location}{fileset_version}/{kind}/{kind}_{i}.tsv")
+            file_set.load_data_files(data_file_keys)
+
+            text = file_set.generate_fileset_metadata_file()
+            self._put_metadata(
+                f"{location}{fileset_version}/{FILE_SET_METADATA_FILE}",
+                text,
+                {'kg_id': kg_id, **KgeKnowledgeGraph.parse_fileset_metadata(kg_id, text)}
+            )
+            for object_key in data_file_keys:
+                self._put(object_key, "id\tcategory\n")
+
+
+def run_size(archive: SyntheticArchive, requests: int) -> Dict[str, str]:
+    """
+    Benchmark the catalog over the current contents of the synthetic KGE Archive.
+
+    :return: report of the measurements
+    """
+    from kgea.server.web_services.kgea_file_ops import (
+        get_archive_contents,
+        invalidate_listing_cache,
+        CATALOG_INDEX_KEY
+    )
+    from kgea.server.web_services.catalog import KnowledgeGraphCatalog
+
+    def cold_startup() -> KnowledgeGraphCatalog:
+        archive.client.delete_object(Bucket=archive.bucket, Key=CATALOG_INDEX_KEY)
+        invalidate_listing_cache(archive.bucket)
+        return KnowledgeGraphCatalog()
+
+    invalidate_listing_cache(archive.bucket)
+    start = perf_counter()
+    get_archive_contents(bucket_name=archive.bucket)
+    scan = perf_counter() - start
+
+    start = perf_counter()
+    cold_startup()
+    cold = perf_counter() - start
+
+    # the cold startup persisted the catalog index
+    start = perf_counter()
+    catalog = KnowledgeGraphCatalog()
+    warm = perf_counter() - start
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    cold_startup()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    kg_ids: List[str] = list(catalog.get_kg_entries().keys())
+
+    def lookup():
+        catalog.get_kg_entry(catalog.get_knowledge_graph(choice(kg_ids)))
+
+    return {
+        'startup': f"scan {scan:8.3f} s, cold {cold:8.3f} s, warm {warm:8.3f} s, " +
+                   f"cold peak {(peak - baseline)/1024**2:8.2f} MB",
+        'catalog': _percentiles(_timed(catalog.get_kg_entries, requests)),
+        'lookup': _percentiles(_timed(lookup, requests))
+    }
+
+
+def main():
+    """
+    Benchmark entry point
+    """
+    parser = ArgumentParser(description="Catalog load benchmark, over a synthetic (moto mocked) KGE Archive")
+    parser.add_argument('--sizes', type=str, default="10,100,1000", help="numbers of knowledge graphs")
+    parser.add_argument('--versions', type=int, default=2, help="number of file set versions per knowledge graph")
+    parser.add_argument('--files', type=int, default=4, help="number of data files per file set version")
+    parser.add_argument('--requests', type=int, default=200, help="number of requests of each kind")
+    parser.add_argument('--no-sidecars', action='store_true', help="metadata files without their sidecar files")
+    args = parser.parse_args()
+
+    if not mock_s3:
+        raise RuntimeError("catalog_benchmark: the 'moto' package is required (see requirements-dev.txt)")
+
+    # The mocked AWS services must never be confused with real ones
+    for variable in ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SECURITY_TOKEN', 'AWS_SESSION_TOKEN']:
+        environ[variable] = 'testing'
+
+    sizes: List[int] = sorted(int(size) for size in args.sizes.split(','))
+
+    with mock_sts(), mock_s3():
+        archive = SyntheticArchive(versions=args.versions, files=args.files, sidecars=not args.no_sidecars)
+        for size in sizes:
+            # the synthetic KGE Archive grows incrementally
+            while archive.kg_count < size:
+                archive.add_knowledge_graph()
+
+            report = run_size(archive, args.requests)
+            print(f"N {size:>6} ({archive.object_count:>7} objects) {'startup':>8}: {report['startup']}")
+            for kind in ['catalog', 'lookup']:
+                print(f"N {size:>6} ({archive.object_count:>7} objects) {kind:>8}: {report[kind]}")
+
+
+if __name__ == '__main__':
+    main()
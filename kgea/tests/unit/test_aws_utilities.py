@@ -4,6 +4,8 @@ Unit tests for AWS utilities
 from sys import platform
 from os import getenv, remove
 from os.path import isfile
+from datetime import datetime, timedelta
+from time import time
 from pytest import mark
 
 from botocore.config import Config
@@ -276,4 +278,121 @@ def test_s3_unix_remote_copy_to_new_key_in_different_bucket_and_account():
         
     logger.debug("Exiting test_s3_local_copy_to_new_key_in_different_bucket_and_account()")
     
-    
\ No newline at end of file
+    
+
+def test_assumed_role_client_pool():
+    """
+    Test that AssumeRole clients are pooled per thread, service and client configuration.
+    """
+    from threading import Thread
+
+    role = AssumeRole()
+    config = Config(signature_version='s3v4', region_name=aws_config['s3']['region'])
+
+    client = role.get_client('s3', config=config)
+
+    # same thread, equivalent configuration: the pooled client is reused
+    assert role.get_client('s3', config=Config(
+        signature_version='s3v4', region_name=aws_config['s3']['region'])
+    ) is client
+
+    # different client configuration: a distinct client
+    assert role.get_client('s3') is not client
+
+    # another thread gets its own client
+    other_clients = []
+    thread = Thread(target=lambda: other_clients.append(role.get_client('s3', config=config)))
+    thread.start()
+    thread.join()
+    assert other_clients[0] is not client
+
+
+def test_assumed_role_pooled_client_lookup():
+    """
+    Test that pooled AssumeRole clients are looked up without taking the client lock,
+    unless the credentials are due to be renewed, and keyed by their configuration options.
+    """
+    from threading import Thread, Event
+
+    role = AssumeRole(host_account="123456789012", guest_external_id="external-id", iam_role_name="test-role")
+    role.credentials_dict = {"sessionId": "id", "sessionKey": "key", "sessionToken": "token"}
+    role.assumed_role_object = {'Credentials': role.credentials_dict}
+    role.expiration = datetime.now() + timedelta(hours=1)
+    config = Config(signature_version='s3v4', region_name="us-east-1")
+
+    assert AssumeRole._config_key(config) == \
+        AssumeRole._config_key(Config(signature_version='s3v4', region_name="us-east-1"))
+    assert AssumeRole._config_key(config) != AssumeRole._config_key(Config(region_name="us-east-1"))
+
+    clients = []
+    pooled = Event()
+    locked = Event()
+
+    def lookup():
+        clients.append(role.get_client('s3', config=config))
+        pooled.set()
+        locked.wait(5)
+        clients.append(role.get_client('s3', config=config))
+
+    thread = Thread(target=lookup, daemon=True)
+    thread.start()
+    assert pooled.wait(5)
+    with role._client_lock:
+        locked.set()
+        thread.join(timeout=5)
+        # the pooled client was returned while another thread held the lock
+        assert not thread.is_alive()
+    assert clients[0] is clients[1]
+
+
+def test_assumed_role_background_refresher():
+    """
+    Test that the background refresher keeps assumed role credentials current.
+    """
+    role = AssumeRole()
+    role.start_refresher()
+    try:
+        credentials, _ = role.get_credentials_dict()
+        if aws_config['iam_role_name']:
+            assert credentials and role.get_refresh_metrics()['refreshes'] >= 1
+    finally:
+        role.stop_refresher()
+
+
+def test_assumed_role_failed_renewal_backoff():
+    """
+    Test that a failed renewal of still valid credentials is only retried after a delay.
+    """
+    from threading import Thread
+    from kgea.aws import assume_role
+
+    class FailingSTS:
+        calls = 0
+
+        def assume_role(self, **kwargs):
+            FailingSTS.calls += 1
+            raise RuntimeError("STS unavailable")
+
+    role = AssumeRole(host_account="123456789012", guest_external_id="external-id", iam_role_name="test-role")
+    role.sts_client = FailingSTS()
+
+    # current credentials, within the refresh margin of their expiration
+    role.assumed_role_object = {'Credentials': {}}
+    role.credentials_dict = {'sessionId': "id", 'sessionKey': "key", 'sessionToken': "token"}
+    role.expiration = datetime.now() + timedelta(seconds=assume_role.Credentials_Refresh_Margin / 2)
+
+    # concurrent request threads: one STS call, the others use the current credentials
+    threads = [Thread(target=role.get_credentials_dict) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert FailingSTS.calls == 1
+    assert role.get_credentials_dict() == (role.credentials_dict, False)
+    assert FailingSTS.calls == 1
+
+    # the renewal is retried after the delay, doubled upon each consecutive failure
+    role._next_refresh_attempt = 0
+    role.get_credentials_dict()
+    assert FailingSTS.calls == 2
+    assert role._next_refresh_attempt - time() > assume_role._REFRESH_RETRY_DELAY
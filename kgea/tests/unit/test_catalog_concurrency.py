@@ -0,0 +1,156 @@
+"""
+Stress test of concurrent mutations and reads of the (in memory) catalog state,
+as made by upload threads, the KgeArchiver and the catalog request handlers.
+"""
+from typing import List
+from threading import Thread, Barrier, Event
+from time import sleep
+
+import pytest
+
+from kgea.server.web_services.catalog import (
+    ReadWriteLock,
+    KgeKnowledgeGraph,
+    KgeFileSet,
+    KgeFileType,
+    KnowledgeGraphCatalog
+)
+
+_WRITERS = 8
+_FILES_PER_WRITER = 250
+_READERS = 4
+
+
+def test_read_write_lock():
+    lock = ReadWriteLock()
+
+    # readers share the lock
+    barrier = Barrier(2, timeout=5)
+
+    def reader():
+        with lock.read():
+            barrier.wait()
+
+    threads = [Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # the write lock is reentrant, and may be read from
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+
+    # the read lock may not be upgraded
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                lock.acquire_write()
+
+    # writers exclude readers
+    written = Event()
+    observed: List[bool] = list()
+
+    def late_reader():
+        with lock.read():
+            observed.append(written.is_set())
+
+    with lock.write():
+        thread = Thread(target=late_reader)
+        thread.start()
+        sleep(0.1)
+        written.set()
+    thread.join()
+    assert observed == [True]
+
+
+def test_concurrent_catalog_mutations_and_reads():
+    kg = KgeKnowledgeGraph(kg_id="stress_kg", kg_name="Stress Test Graph")
+    file_set = KgeFileSet(
+        kg_id="stress_kg",
+        biolink_model_release="2.0.2",
+        fileset_version="1.0",
+        submitter_name="Kenneth Bruskiewicz",
+        submitter_email="kenneth@starinformatics.com",
+        size=0
+    )
+    kg.add_file_set("1.0", file_set)
+
+    done = Event()
+    start = Barrier(_WRITERS + _READERS, timeout=5)
+    errors: List[Exception] = list()
+
+    # numbers of data files seen by the readers, i.e. the progress of the writers at each snapshot
+    observed: List[int] = list()
+
+    def upload(worker: int):
+        try:
+            start.wait()
+            for i in range(_FILES_PER_WRITER):
+                file_set.add_data_file(
+                    file_type=KgeFileType.KGX_DATA_FILE,
+                    file_name=f"nodes_{worker}_{i}.tsv",
+                    file_size=10,
+                    object_key=f"kge-data/stress_kg/1.0/nodes/nodes_{worker}_{i}.tsv"
+                )
+                if i % 50 == 0:
+                    # a few new file set versions, as concurrently created by other
+                    # submissions (all distinct from the "1.0" file set being written)
+                    version = f"{worker + 2}.{i}"
+                    kg.add_file_set(
+                        version,
+                        KgeFileSet(kg_id="stress_kg", biolink_model_release="2.0.2",
+                                   fileset_version=version,
+                                   submitter_name="Kenneth Bruskiewicz",
+                                   submitter_email="kenneth@starinformatics.com",
+                                   archive_record=True)
+                    )
+                if i % 25 == 0:
+                    file_set.remove_data_file(f"kge-data/stress_kg/1.0/nodes/nodes_{worker}_{i}.tsv")
+                # yield to the other threads, for the readers to interleave with the writers
+                sleep(0)
+        except Exception as exc:
+            errors.append(exc)
+
+    def read():
+        try:
+            start.wait()
+            while not done.is_set():
+                entry = kg.to_index_entry()
+
+                # each snapshot is consistent: the aggregate size of the
+                # file set matches the sizes of its data files
+                fs_entry = entry['versions']['1.0']
+                assert fs_entry['size'] == sum(f['file_size'] for f in fs_entry['data_files'].values())
+                observed.append(len(fs_entry['data_files']))
+
+                KnowledgeGraphCatalog.get_kg_entry(kg)
+                file_set.get_size_by_type()
+                file_set.get_nodes()
+                file_set.get_data_file_names()
+        except Exception as exc:
+            errors.append(exc)
+
+    readers = [Thread(target=read) for _ in range(_READERS)]
+    writers = [Thread(target=upload, args=(worker,)) for worker in range(_WRITERS)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert not errors, errors
+
+    removed = _FILES_PER_WRITER // 25
+    expected = _WRITERS * (_FILES_PER_WRITER - removed)
+    assert len(file_set.get_data_file_object_keys()) == expected
+    assert len(file_set.get_nodes()) == expected
+    assert file_set.size == 10 * expected
+    assert len(kg.get_version_names()) == 1 + _WRITERS * (_FILES_PER_WRITER // 50)
+
+    # the catalog was read while it was being written
+    assert any(0 < count < expected for count in observed), observed[:10]
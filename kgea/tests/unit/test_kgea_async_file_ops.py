@@ -0,0 +1,123 @@
+"""
+Test the streaming of data chunks into an S3 multipart upload, against
+an in-memory record of the S3 multipart upload calls (no S3 access).
+"""
+from typing import List, Dict
+import asyncio
+import threading
+
+import pytest
+
+from kgea.server.web_services import kgea_async_file_ops
+from kgea.server.web_services.kgea_async_file_ops import async_stream_to_s3
+from kgea.server.web_services.kgea_file_ops import S3_MIN_PART_SIZE
+
+_PART_SIZE = S3_MIN_PART_SIZE
+
+
+class _MultipartUploads:
+    """
+    In-memory record of the S3 multipart upload calls.
+    """
+    def __init__(self):
+        self.parts: Dict[int, bytes] = dict()
+        self.completed: List[int] = list()
+        self.aborted = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, bucket, object_key):
+        return "test_upload_id"
+
+    def upload_part(self, bucket, object_key, upload_id, part_number, data):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        threading.Event().wait(0.01)
+        with self._lock:
+            self.in_flight -= 1
+            self.parts[part_number] = data
+        return f'"etag-{part_number}"'
+
+    def complete_multipart_upload(self, bucket, object_key, upload_id, etags):
+        self.completed = sorted(etags.keys())
+
+    def abort_multipart_upload(self, bucket, object_key, upload_id):
+        self.aborted = True
+
+
+@pytest.fixture
+def uploads(monkeypatch) -> _MultipartUploads:
+    recorder = _MultipartUploads()
+    for name in [
+        'create_multipart_upload', 'upload_part', 'complete_multipart_upload', 'abort_multipart_upload'
+    ]:
+        monkeypatch.setattr(kgea_async_file_ops, name, getattr(recorder, name))
+    return recorder
+
+
+async def _chunks(size: int, chunk_size: int = 64 * 1024):
+    sent = 0
+    while sent < size:
+        chunk = bytes([sent % 251]) * min(chunk_size, size - sent)
+        sent += len(chunk)
+        yield chunk
+
+
+def test_stream_to_s3(uploads):
+    size = 5 * _PART_SIZE + 123
+    progress: List[int] = list()
+
+    uploaded = asyncio.run(
+        async_stream_to_s3(
+            _chunks(size),
+            object_key="kge-data/test_kg/1.0/nodes/test_nodes.tsv",
+            part_size=_PART_SIZE,
+            max_in_flight=2,
+            callback=progress.append
+        )
+    )
+
+    assert uploaded == size
+    assert uploads.completed == [1, 2, 3, 4, 5, 6]
+    assert [len(uploads.parts[n]) for n in uploads.completed] == [_PART_SIZE] * 5 + [123]
+    assert sum(progress) == size
+    assert uploads.max_in_flight <= 2
+    assert not uploads.aborted
+
+
+def test_stream_empty_file_to_s3(uploads):
+    assert asyncio.run(async_stream_to_s3(_chunks(0), object_key="kge-data/test_kg/1.0/empty.tsv")) == 0
+    assert uploads.completed == [1]
+    assert uploads.parts[1] == b''
+
+
+def test_stream_to_s3_part_size_fits_expected_size(uploads):
+    # the parts are enlarged for the stream to fit within the maximum number of S3 parts
+    size = 3 * _PART_SIZE
+    asyncio.run(
+        async_stream_to_s3(
+            _chunks(size), object_key="kge-data/test_kg/1.0/big.tsv",
+            expected_size=size * 10000, part_size=_PART_SIZE
+        )
+    )
+    assert uploads.completed == [1]
+
+
+def test_cancelled_stream_to_s3_is_aborted(uploads):
+    def cancel(bytes_amount):
+        raise RuntimeWarning("Transfer/upload was cancelled?")
+
+    with pytest.raises(RuntimeWarning):
+        asyncio.run(
+            async_stream_to_s3(
+                _chunks(4 * _PART_SIZE),
+                object_key="kge-data/test_kg/1.0/nodes/test_nodes.tsv",
+                part_size=_PART_SIZE,
+                max_in_flight=1,
+                callback=cancel
+            )
+        )
+    assert uploads.aborted
+    assert not uploads.completed
@@ -0,0 +1,74 @@
+"""
+Test the SQLite catalog store shared by web service worker processes
+"""
+from os import path
+from tempfile import TemporaryDirectory
+from multiprocessing import Process
+
+import pytest
+
+from kgea.server.web_services.kgea_catalog_store import CatalogStore, SqliteCatalogStore
+
+
+def _write_entries(store_path: str, worker: int, count: int):
+    store = SqliteCatalogStore(store_path)
+    for i in range(count):
+        store.put_entry(f"kg_{worker}_{i}", {'parameter': {'kg_name': f"Graph {worker}.{i}"}, 'versions': {}})
+    store.close()
+
+
+def test_sqlite_catalog_store():
+    with TemporaryDirectory() as directory:
+        store = SqliteCatalogStore(path.join(directory, "catalog.sqlite"))
+
+        assert store.get_entry("test_kg") is None
+        assert store.get_changes() == ({}, 0)
+
+        first = store.put_entry("test_kg", {'parameter': {'kg_name': "Test Graph"}, 'versions': {}})
+        second = store.put_entry("other_kg", {'parameter': {'kg_name': "Other Graph"}, 'versions': {}})
+        assert second > first
+        assert store.get_entry("test_kg")['parameter']['kg_name'] == "Test Graph"
+
+        changes, revision = store.get_changes(since=first)
+        assert list(changes.keys()) == ["other_kg"]
+        assert revision == second
+
+        # overwriting an entry gives it a new revision
+        third = store.put_entry("test_kg", {'parameter': {'kg_name': "Renamed Graph"}, 'versions': {}})
+        changes, revision = store.get_changes(since=second)
+        assert changes == {"test_kg": (third, {'parameter': {'kg_name': "Renamed Graph"}, 'versions': {}})}
+
+        store.close()
+
+
+def test_sqlite_catalog_store_shared_by_processes():
+    with TemporaryDirectory() as directory:
+        store_path = path.join(directory, "catalog.sqlite")
+        SqliteCatalogStore(store_path).close()
+
+        workers = [Process(target=_write_entries, args=(store_path, worker, 20)) for worker in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            assert worker.exitcode == 0
+
+        store = SqliteCatalogStore(store_path)
+        changes, revision = store.get_changes()
+        assert len(changes) == 80
+
+        # store revisions are unique across processes
+        assert revision == 80
+        assert len({kg_revision for kg_revision, _ in changes.values()}) == 80
+        store.close()
+
+
+def test_incomplete_catalog_store():
+
+    class IncompleteCatalogStore(CatalogStore):
+        def get_entry(self, kg_id):
+            return None
+
+    # the missing methods of a catalog store are reported as it is created, rather than upon their calls
+    with pytest.raises(TypeError):
+        IncompleteCatalogStore()
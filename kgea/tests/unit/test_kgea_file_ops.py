@@ -1,8 +1,10 @@
 """
 Test Parameters + Decorator
 """
+from typing import List, Dict
 from sys import stderr
 from os import getenv
+from datetime import datetime, timezone
 from functools import wraps
 
 import logging
@@ -36,13 +38,16 @@ from kgea.tests import (
     TEST_HUGE_FILE_RESOURCE_URL,
 )
 
+from kgea.server.web_services import kgea_file_ops
 from kgea.server.web_services.kgea_file_ops import (
     upload_from_link, get_url_file_size, get_archive_contents, aggregate_files,
     print_error_trace, compress_fileset, object_keys_in_location, get_object_key,
     upload_file, with_version, get_object_location, upload_file_multipart,
     create_presigned_url, get_fileset_versions_available, random_alpha_string,
     s3_client, location_available, copy_file, object_key_exists,
-    object_keys_for_fileset_version, object_folder_contents_size
+    object_keys_for_fileset_version, object_folder_contents_size, load_s3_text_files,
+    iter_folder_names, default_s3_root_key, get_listing_cache_statistics,
+    get_presigned_url_cache_statistics, PROVIDER_METADATA_FILE, FILE_SET_METADATA_FILE
 )
 
 logger = logging.getLogger(__name__)
@@ -130,6 +135,37 @@ def test_object_keys_in_location(test_object_location=TEST_LARGE_NODES_FILE_KEY,
         raise AssertionError(e)
 
 
+def test_object_keys_in_location_prefix_scope(test_bucket=TEST_BUCKET):
+    # 'kg' must not match the objects of 'kg10' (nor 'kg10', those of 'kg')
+    test_kg = random_alpha_string()
+    test_object_key = get_object_key(get_object_location(test_kg), TEST_OBJECT)
+    other_object_key = get_object_key(get_object_location(f"{test_kg}10"), TEST_OBJECT)
+    for object_key in [test_object_key, other_object_key]:
+        s3_client().put_object(Bucket=test_bucket, Key=object_key)
+    try:
+        assert object_keys_in_location(test_bucket, get_object_location(test_kg)) == [test_object_key]
+        kg_ids = list(iter_folder_names(test_bucket, prefix=f"{default_s3_root_key}/"))
+        assert test_kg in kg_ids and f"{test_kg}10" in kg_ids
+    finally:
+        for object_key in [test_object_key, other_object_key]:
+            delete_test_file(test_object_key=object_key, test_bucket=test_bucket)
+
+
+def test_listing_cache(test_bucket=TEST_BUCKET, test_kg=TEST_KG_ID):
+    test_location, _ = with_version(get_object_location)(test_kg)
+    
+    object_keys_in_location(test_bucket, test_location)
+    hits = get_listing_cache_statistics()['hits']
+    object_keys_in_location(test_bucket, test_location)
+    assert get_listing_cache_statistics()['hits'] == hits + 1
+    
+    # an upload through kgea_file_ops invalidates the cached listing
+    test_object_key = upload_test_file(test_bucket=test_bucket, test_kg=test_kg)
+    assert test_object_key in object_keys_in_location(test_bucket, test_location)
+    
+    delete_test_file(test_object_key=test_object_key, test_bucket=test_bucket)
+
+
 def test_object_folder_contents_size(
         test_kg_id=TEST_KG_ID,
         test_fileset_version=TEST_FS_VERSION,
@@ -163,6 +199,21 @@ def test_create_presigned_url(test_bucket=TEST_BUCKET):
         assert False
 
 
+def test_presigned_url_cache(test_bucket=TEST_BUCKET):
+    test_object_key = get_object_key(get_object_location(TEST_KG_ID), TEST_OBJECT)
+    
+    url = create_presigned_url(object_key=test_object_key, bucket=test_bucket)
+    assert url
+    
+    # signed once, then served from the cache...
+    hits = get_presigned_url_cache_statistics()['hits']
+    assert create_presigned_url(object_key=test_object_key, bucket=test_bucket) == url
+    assert get_presigned_url_cache_statistics()['hits'] == hits + 1
+    
+    # ...but distinctly for each content disposition
+    assert create_presigned_url(object_key=test_object_key, bucket=test_bucket, disposition='inline') != url
+
+
 def get_remote_client():
     """
 
@@ -476,7 +527,58 @@ def test_get_archive_contents(test_bucket=TEST_BUCKET):
     logger.info(f"test_get_archive_contents() test output:")
     contents = get_archive_contents(test_bucket)
     logger.info(str(contents))
+
+
+def test_get_archive_contents_metadata_cache(monkeypatch, test_bucket=TEST_BUCKET):
+    # an archive of two knowledge graphs, as listed (without S3 access)
+    entries = [
+        {'Key': f"{default_s3_root_key}/{kg_id}/{file_path}", 'ETag': f'"{kg_id}"', 'Size': 1,
+         'LastModified': datetime.now(timezone.utc)}
+        for kg_id in ['kg_1', 'kg_2']
+        for file_path in [PROVIDER_METADATA_FILE, f"1.0/{FILE_SET_METADATA_FILE}", "1.0/nodes/nodes.tsv"]
+    ]
+    fetched: List[str] = list()
+
+    def list_entries(bucket, prefix='', client=None):
+        return [entry for entry in entries if entry['Key'].startswith(prefix)]
+
+    def load_files(bucket_name, object_names, **kwargs):
+        fetched.extend(object_names)
+        return {object_key: "metadata" for object_key in object_names}
+
+    monkeypatch.setattr(kgea_file_ops, 'iter_object_entries', list_entries)
+    monkeypatch.setattr(kgea_file_ops, 'load_s3_text_files', load_files)
+
+    metadata_cache: Dict[str, List[str]] = dict()
+    get_archive_contents(test_bucket, metadata_cache=metadata_cache)
+    assert len(fetched) == len(metadata_cache) == 4
+
+    # the (change polling) listings of the knowledge graphs, in turn, leave the others cached
+    for kg_id in ['kg_1', 'kg_2']:
+        contents = get_archive_contents(test_bucket, metadata_cache=metadata_cache, kg_id=kg_id)
+        assert list(contents.keys()) == [kg_id]
+        assert len(metadata_cache) == 4
+    assert len(fetched) == 4
+
+    # the metadata files removed from a knowledge graph leave the cache
+    entries = [entry for entry in entries if not entry['Key'].endswith(f"kg_2/{PROVIDER_METADATA_FILE}")]
+    get_archive_contents(test_bucket, metadata_cache=metadata_cache, kg_id='kg_2')
+    assert len(metadata_cache) == 3 and len(fetched) == 4
+    
+
+def test_load_s3_text_files(test_bucket=TEST_BUCKET, test_kg=TEST_KG_ID):
+    test_object_key = upload_test_file(test_bucket=test_bucket, test_kg=test_kg)
+    missing_object_key = f"{test_object_key}.missing"
     
+    contents = load_s3_text_files(test_bucket, [test_object_key, missing_object_key], max_workers=2, retries=1)
+    
+    with open(TEST_SMALL_FILE_PATH, 'r') as test_file:
+        assert contents[test_object_key] == test_file.read()
+    
+    assert contents[missing_object_key] is None
+    
+    delete_test_file(test_object_key=test_object_key, test_bucket=test_bucket)
+
 
 def test_get_url_file_size():
     url_resource_size: int = get_url_file_size(url=TEST_SMALL_FILE_RESOURCE_URL)
@@ -0,0 +1,162 @@
+"""
+Test the helper functions of the KGE Archive web service handlers, and the stream
+of upload progress events (against an in-memory upload tracker store).
+"""
+from typing import List, Dict
+from unittest import mock
+import asyncio
+import json
+
+import pytest
+
+from aiohttp.test_utils import make_mocked_request
+from aiohttp_session import Session
+
+from kgea.server.web_services import kgea_handlers
+from kgea.server.web_services.kgea_handlers import (
+    _preferred_encoding,
+    upload_progress_event,
+    kge_upload_progress_events
+)
+from kgea.server.web_services.kgea_upload_tracker import MemoryUploadTrackerBackend, UploadTrackerStore
+from kgea.server.web_services.models.kge_upload_progress_status_code import KgeUploadProgressStatusCode
+
+
+def _encoding(accept_encoding: str) -> str:
+    return _preferred_encoding(make_mocked_request('GET', "/catalog", headers={'Accept-Encoding': accept_encoding}))
+
+
+def test_preferred_encoding(monkeypatch):
+    # as when Brotli is not installed
+    monkeypatch.setattr(kgea_handlers, 'brotli', None)
+    assert _encoding("gzip, deflate, br") == 'gzip'
+    assert _encoding("deflate") == 'identity'
+    assert _encoding("") == 'identity'
+
+    # codings of quality 'q=0' are unacceptable
+    assert _encoding("gzip;q=0, deflate") == 'identity'
+    assert _encoding("*;q=0") == 'identity'
+    assert _encoding("GZIP ; Q=0.5") == 'gzip'
+
+    monkeypatch.setattr(kgea_handlers, 'brotli', object())
+    assert _encoding("gzip, deflate, br") == 'br'
+    assert _encoding("gzip, br;q=0") == 'gzip'
+    assert _encoding("gzip;q=1.0, br;q=0.5") == 'gzip'
+    assert _encoding("br;q=0.5, *") == 'gzip'
+    assert _encoding("*") == 'br'
+    assert _encoding("*, br;q=0, gzip;q=0") == 'identity'
+
+
+def test_upload_progress_event():
+    tracker = {'current_position': 25, 'end_position': 100, 'active': True}
+    assert upload_progress_event('token', tracker, 25.0) == {
+        'upload_token': 'token',
+        'current_position': 25,
+        'end_position': 100,
+        'status': KgeUploadProgressStatusCode.ONGOING,
+        'throughput': 25,
+        'eta': 3
+    }
+
+    # no estimated time to completion, without throughput or known size
+    assert upload_progress_event('token', tracker, 0.0)['eta'] is None
+    assert upload_progress_event('token', {'current_position': 25}, 25.0)['eta'] is None
+
+    # nor before the upload starts
+    event = upload_progress_event('token', {}, 0.0)
+    assert event['current_position'] == 0 and event['end_position'] is None and event['eta'] is None
+
+    tracker = {'current_position': 100, 'end_position': 100, 'status': KgeUploadProgressStatusCode.COMPLETED}
+    event = upload_progress_event('token', tracker, 50.0)
+    assert event['status'] == KgeUploadProgressStatusCode.COMPLETED and event['eta'] == 0
+
+
+class _EventStream:
+    """
+    Client of the upload progress event stream, recording the events received.
+    """
+    def __init__(self):
+        self.writer = mock.Mock()
+        self.writer.write_headers = mock.AsyncMock()
+        self.writer.write_eof = mock.AsyncMock()
+        self.writer.drain = mock.AsyncMock()
+        self.writer.write = mock.AsyncMock(side_effect=self._write)
+        self.events: List[Dict] = list()
+        self.received = asyncio.Event()
+
+    async def _write(self, data: bytes):
+        for message in data.decode('utf-8').split("\n\n"):
+            if message.startswith("event: progress\n"):
+                self.events.append(json.loads(message.split("data: ", 1)[1]))
+        self.received.set()
+
+    async def next_event(self) -> Dict:
+        await asyncio.wait_for(self.received.wait(), 1)
+        self.received.clear()
+        return self.events[-1]
+
+    def open(self, upload_token: str) -> asyncio.Task:
+        request = make_mocked_request('GET', f"/upload/progress/events?upload_token={upload_token}", writer=self.writer)
+        return asyncio.ensure_future(kge_upload_progress_events(request))
+
+
+@pytest.fixture
+def tracker_store(monkeypatch) -> UploadTrackerStore:
+    store = UploadTrackerStore(MemoryUploadTrackerBackend())
+    monkeypatch.setattr(kgea_handlers, 'get_upload_tracker_store', lambda: store)
+
+    # a signed in user
+    async def get_session(request):
+        return Session("test", data={'session': {'user_role': 1, 'username': "tester"}}, new=False)
+
+    async def with_session(request, response):
+        return response
+
+    monkeypatch.setattr(kgea_handlers, 'get_session', get_session)
+    monkeypatch.setattr(kgea_handlers, 'with_session', with_session)
+    monkeypatch.setattr(kgea_handlers, 'Upload_Progress_Event_Interval', 0.01)
+    return store
+
+
+def test_upload_progress_events_until_completed(tracker_store):
+
+    async def scenario():
+        await tracker_store.save('token', {'current_position': 0, 'end_position': 100, 'active': True})
+        stream = _EventStream()
+        task = stream.open('token')
+        assert (await stream.next_event())['current_position'] == 0
+
+        # the upload progresses (as published by the worker running it)
+        tracker = await tracker_store.attach('token')
+        tracker['current_position'] = 40
+        tracker['rate'] = 20.0
+        await tracker_store.flush()
+        event = await stream.next_event()
+        assert event['current_position'] == 40 and event['throughput'] == 20 and event['eta'] == 3
+
+        # the stream ends with the final event of the upload
+        tracker['current_position'] = 100
+        tracker['status'] = KgeUploadProgressStatusCode.COMPLETED
+        await tracker_store.detach('token')
+        await asyncio.wait_for(task, 1)
+        assert stream.events[-1]['status'] == KgeUploadProgressStatusCode.COMPLETED
+        assert [event['current_position'] for event in stream.events] == [0, 40, 100]
+
+    asyncio.run(scenario())
+
+
+def test_upload_progress_events_until_cancelled(tracker_store):
+
+    async def scenario():
+        await tracker_store.save('token', {'current_position': 10, 'end_position': 100, 'active': True})
+        stream = _EventStream()
+        task = stream.open('token')
+        await stream.next_event()
+
+        # the stream ends with the cancellation of the upload, still 'Ongoing'
+        assert await tracker_store.cancel('token')
+        await asyncio.wait_for(task, 1)
+        assert stream.events[-1]['status'] == KgeUploadProgressStatusCode.ONGOING
+        assert stream.events[-1]['current_position'] == 10
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+"""
+Test the codec of the pre-parsed ('sidecar') copies of the KGE Archive metadata files
+"""
+from kgea.server.web_services.kgea_metadata_codec import (
+    get_sidecar_object_key,
+    is_sidecar_object_key,
+    get_metadata_etag,
+    parse_metadata_yaml,
+    encode_metadata_sidecar,
+    decode_metadata_sidecar
+)
+
+_TEST_METADATA = """id: "test_kg"
+fileset_version:  "1.0"
+submitter:
+  name: "Mickey Mouse"
+size: 10
+"""
+
+
+def test_sidecar_object_keys():
+    sidecar_key = get_sidecar_object_key("kge-data/test_kg/1.0/file_set.yaml")
+    assert sidecar_key == "kge-data/test_kg/1.0/file_set.yaml.json"
+    assert is_sidecar_object_key(sidecar_key)
+    assert is_sidecar_object_key(get_sidecar_object_key("kge-data/test_kg/provider.yaml"))
+    assert not is_sidecar_object_key("kge-data/test_kg/1.0/file_set.yaml")
+    assert not is_sidecar_object_key("kge-data/test_kg/1.0/content_metadata.json")
+
+
+def test_parse_metadata_yaml():
+    metadata = parse_metadata_yaml(_TEST_METADATA)
+    assert metadata['id'] == "test_kg"
+    assert metadata['submitter'] == {'name': "Mickey Mouse"}
+    assert metadata['size'] == 10
+
+    assert parse_metadata_yaml("id: [unclosed") is None
+    assert parse_metadata_yaml("just a string") is None
+
+
+def test_metadata_sidecar_round_trip():
+    parameters = {'kg_id': "test_kg", 'fileset_version': "1.0", 'size': 10}
+    sidecar = encode_metadata_sidecar(_TEST_METADATA, parameters)
+
+    # S3 ETags are listed quoted
+    assert decode_metadata_sidecar(sidecar, f'"{get_metadata_etag(_TEST_METADATA)}"') == parameters
+    assert decode_metadata_sidecar(sidecar, get_metadata_etag(_TEST_METADATA)) == parameters
+
+    # stale, missing or corrupted sidecars are ignored
+    assert decode_metadata_sidecar(sidecar, get_metadata_etag(_TEST_METADATA + "revisions: 2\n")) is None
+    assert decode_metadata_sidecar(sidecar, None) is None
+    assert decode_metadata_sidecar(None, get_metadata_etag(_TEST_METADATA)) is None
+    assert decode_metadata_sidecar(sidecar[:-1], get_metadata_etag(_TEST_METADATA)) is None
+    assert decode_metadata_sidecar(
+        sidecar.replace('"codec":1', '"codec":0'), get_metadata_etag(_TEST_METADATA)
+    ) is None
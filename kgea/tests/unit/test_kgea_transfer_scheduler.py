@@ -0,0 +1,91 @@
+"""
+Test the bounded, fair (between users) scheduling of file transfers.
+"""
+from typing import List
+import asyncio
+import threading
+
+import pytest
+
+from kgea.server.web_services.kgea_transfer_scheduler import (
+    TransferScheduler,
+    TransferSchedulerSaturated
+)
+
+
+def test_transfer_scheduler_limits():
+
+    async def scenario():
+        scheduler = TransferScheduler(max_transfers=2, max_transfers_per_user=1, max_queued=2, retry_after=5)
+        release = threading.Event()
+
+        def transfer():
+            release.wait(5)
+
+        # one transfer of each user runs, the second transfer of 'alice' waits
+        tasks = [scheduler.submit(user, transfer) for user in ['alice', 'bob', 'alice']]
+        await asyncio.sleep(0.05)
+        assert scheduler.running() == 2
+        assert scheduler.queued() == 1
+
+        metrics = scheduler.get_metrics()
+        assert metrics['users']['alice'] == {'running': 1, 'queued': 1}
+        assert metrics['users']['bob'] == {'running': 1, 'queued': 0}
+
+        tasks.append(scheduler.submit('carol', transfer))
+        await asyncio.sleep(0.05)
+
+        # the queue is full
+        with pytest.raises(TransferSchedulerSaturated) as saturated:
+            scheduler.submit('dave', transfer)
+        assert saturated.value.retry_after == 5
+        assert scheduler.get_metrics()['refused'] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.running() == 0 and scheduler.queued() == 0
+        assert scheduler.get_metrics()['completed'] == 4
+        scheduler.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_transfer_scheduler_fairness():
+
+    async def scenario():
+        scheduler = TransferScheduler(max_transfers=1, max_transfers_per_user=1, max_queued=16)
+        order: List[str] = list()
+
+        def transfer(name: str):
+            order.append(name)
+
+        # 'alice' queues many transfers before 'bob', but they take turns once the first completes
+        tasks = [scheduler.submit('alice', transfer, f"alice-{i}") for i in range(4)]
+        tasks += [scheduler.submit('bob', transfer, f"bob-{i}") for i in range(2)]
+        await asyncio.gather(*tasks)
+        scheduler.shutdown()
+
+        assert order == ['alice-0', 'alice-1', 'bob-0', 'alice-2', 'bob-1', 'alice-3']
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_transfer_leaves_the_queue():
+
+    async def scenario():
+        scheduler = TransferScheduler(max_transfers=1, max_transfers_per_user=1, max_queued=4)
+
+        async with scheduler.transfer('alice'):
+            waiting = asyncio.ensure_future(scheduler.run('bob', lambda: None))
+            await asyncio.sleep(0.01)
+            assert scheduler.queued() == 1
+
+            waiting.cancel()
+            await asyncio.sleep(0.01)
+            assert scheduler.queued() == 0
+
+        assert scheduler.running() == 0
+        assert await scheduler.run('bob', lambda: 42) == 42
+        scheduler.shutdown()
+
+    asyncio.run(scenario())
@@ -0,0 +1,255 @@
+"""
+Test the resumable upload sessions (and the reaping of the abandoned ones), against an in-memory
+record of the S3 multipart upload calls and of the upload session records (no S3 access).
+"""
+from typing import List, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+import asyncio
+import json
+import threading
+
+import pytest
+
+from aiohttp import web
+from aiohttp.streams import StreamReader
+from aiohttp.test_utils import make_mocked_request
+from aiohttp_session import Session
+from botocore.exceptions import ClientError
+
+from kgea.server.web_services import kgea_file_ops, kgea_handlers
+from kgea.server.web_services.catalog import KgeFileType
+from kgea.server.web_services.kgea_file_ops import UPLOAD_SESSIONS_PREFIX, reap_upload_sessions
+from kgea.server.web_services.kgea_handlers import (
+    kge_open_upload_session,
+    kge_upload_session_part,
+    kge_complete_upload_session
+)
+from kgea.server.web_services.kgea_transfer_scheduler import TransferScheduler
+from kgea.server.web_services.kgea_upload_tracker import MemoryUploadTrackerBackend, UploadTrackerStore
+
+_OBJECT_KEY = "kge-data/test_kg/1.0/nodes/test_nodes.tsv"
+
+
+class _UploadSessions:
+    """
+    In-memory record of the S3 multipart upload calls and of the upload session records.
+    """
+    def __init__(self):
+        # parts of the open multipart uploads, indexed by upload id then part number
+        self.uploads: Dict[str, Dict[int, Dict]] = dict()
+        self.completed: Dict[str, List[int]] = dict()
+        self.aborted: List[str] = list()
+        # (last modification time, record) of the upload sessions, indexed by upload token
+        self.sessions: Dict[str, tuple] = dict()
+        self.added_files: List[Dict] = list()
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, bucket, object_key):
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = dict()
+        return upload_id
+
+    def upload_part(self, bucket, object_key, upload_id, part_number, data):
+        with self._lock:
+            self.uploads[upload_id][part_number] = {
+                'Size': len(data),
+                'ETag': f'"etag-{part_number}"',
+                'LastModified': datetime.now(timezone.utc)
+            }
+        return f'"etag-{part_number}"'
+
+    def list_multipart_parts(self, bucket, object_key, upload_id, client=None):
+        if upload_id not in self.uploads:
+            raise ClientError({'Error': {'Code': 'NoSuchUpload', 'Message': upload_id}}, 'ListParts')
+        return dict(self.uploads[upload_id])
+
+    def complete_multipart_upload(self, bucket, object_key, upload_id, etags):
+        self.completed[upload_id] = sorted(etags.keys())
+        del self.uploads[upload_id]
+
+    def abort_multipart_upload(self, bucket, object_key, upload_id):
+        self.aborted.append(upload_id)
+        del self.uploads[upload_id]
+
+    def save_upload_session(self, upload_token, session, bucket_name=None):
+        self.sessions[upload_token] = (datetime.now(timezone.utc), json.loads(json.dumps(session)))
+
+    def load_upload_session(self, upload_token, bucket_name=None) -> Optional[Dict]:
+        return self.sessions[upload_token][1] if upload_token in self.sessions else None
+
+    def delete_upload_session(self, upload_token, bucket_name=None):
+        self.sessions.pop(upload_token, None)
+
+    def iter_object_entries(self, bucket, prefix='', client=None):
+        for upload_token, (last_modified, _) in list(self.sessions.items()):
+            yield {'Key': f"{UPLOAD_SESSIONS_PREFIX}{upload_token}.json", 'LastModified': last_modified}
+
+    def add_to_kge_file_set(self, **kwargs):
+        self.added_files.append(kwargs)
+
+
+@pytest.fixture
+def uploads(monkeypatch) -> _UploadSessions:
+    recorder = _UploadSessions()
+    for name in [
+        'create_multipart_upload', 'upload_part', 'list_multipart_parts', 'complete_multipart_upload',
+        'abort_multipart_upload', 'save_upload_session', 'load_upload_session', 'delete_upload_session'
+    ]:
+        monkeypatch.setattr(kgea_handlers, name, getattr(recorder, name))
+        monkeypatch.setattr(kgea_file_ops, name, getattr(recorder, name))
+    monkeypatch.setattr(kgea_file_ops, 'iter_object_entries', recorder.iter_object_entries)
+
+    # a signed in user
+    async def get_session(request):
+        return Session("test", data={'session': {'user_role': 1, 'username': "tester"}}, new=False)
+
+    async def with_session(request, response):
+        return response
+
+    monkeypatch.setattr(kgea_handlers, 'get_session', get_session)
+    monkeypatch.setattr(kgea_handlers, 'with_session', with_session)
+
+    catalog = mock.Mock()
+    catalog.catalog.return_value = recorder
+    monkeypatch.setattr(kgea_handlers, 'KnowledgeGraphCatalog', catalog)
+
+    # parts of 10 bytes
+    monkeypatch.setattr(kgea_handlers, 'Upload_Part_Size', 0)
+    monkeypatch.setattr(kgea_handlers, 'S3_MIN_PART_SIZE', 10)
+
+    scheduler = TransferScheduler(max_transfers=4, max_transfers_per_user=4)
+    monkeypatch.setattr(kgea_handlers, 'get_transfer_scheduler', lambda: scheduler)
+    yield recorder
+    scheduler.shutdown()
+
+
+def _use_tracker_store(monkeypatch) -> UploadTrackerStore:
+    store = UploadTrackerStore(MemoryUploadTrackerBackend())
+    monkeypatch.setattr(kgea_handlers, 'get_upload_tracker_store', lambda: store)
+    return store
+
+
+async def _new_upload_token(store: UploadTrackerStore) -> str:
+    # as by a preceding /upload GET call
+    await store.save('test-token', {
+        'kg_id': "test_kg",
+        'fileset_version': "1.0",
+        'file_set_location': "kge-data/test_kg/1.0/nodes/",
+        'object_key': None,
+        'kgx_file_content': "nodes",
+        'file_type': KgeFileType.KGX_DATA_FILE,
+        'content_name': "test_nodes.tsv",
+        'active': True
+    })
+    return 'test-token'
+
+
+def _request(method: str, path: str, data: Optional[bytes] = None) -> web.Request:
+    if data is None:
+        return make_mocked_request(method, path)
+    payload = StreamReader(mock.Mock(), limit=2**16, loop=asyncio.get_event_loop())
+    payload.feed_data(data)
+    payload.feed_eof()
+    return make_mocked_request(method, path, headers={'Content-Length': str(len(data))}, payload=payload)
+
+
+async def _upload_part(upload_token: str, part_number: int, data: bytes) -> Dict:
+    response = await kge_upload_session_part(
+        _request('PUT', f"/upload/session/part?upload_token={upload_token}&part_number={part_number}", data)
+    )
+    return json.loads(response.body)
+
+
+def test_upload_session(uploads, monkeypatch):
+    store = _use_tracker_store(monkeypatch)
+
+    async def scenario():
+        upload_token = await _new_upload_token(store)
+
+        response = await kge_open_upload_session(
+            _request('POST', f"/upload/session?upload_token={upload_token}&content_length=25")
+        )
+        state = json.loads(response.body)
+        assert state == {'upload_token': upload_token, 'part_size': 10, 'content_length': 25, 'parts': []}
+        assert uploads.load_upload_session(upload_token)['object_key'] == _OBJECT_KEY
+
+        # the parts are uploaded concurrently, and all recorded
+        await asyncio.gather(*[
+            _upload_part(upload_token, part_number, data)
+            for part_number, data in [(2, b'b' * 10), (1, b'a' * 10), (3, b'c' * 5)]
+        ])
+        assert (await store.get(upload_token))['current_position'] == 25
+
+        # the file has no fourth part
+        with pytest.raises(web.HTTPBadRequest):
+            await _upload_part(upload_token, 4, b'd')
+
+        response = await kge_complete_upload_session(
+            _request('POST', f"/upload/session/complete?upload_token={upload_token}")
+        )
+        assert response.text == "25"
+        assert uploads.completed == {'upload-1': [1, 2, 3]}
+        assert uploads.added_files[0]['object_key'] == _OBJECT_KEY
+        assert upload_token not in uploads.sessions
+        assert (await store.get(upload_token))['status'] == "Completed"
+
+    asyncio.run(scenario())
+
+
+def test_upload_session_resumed_after_tracker_loss(uploads, monkeypatch):
+    store = _use_tracker_store(monkeypatch)
+
+    async def scenario():
+        upload_token = await _new_upload_token(store)
+        await kge_open_upload_session(_request('POST', f"/upload/session?upload_token={upload_token}&content_length=25"))
+        await _upload_part(upload_token, 1, b'a' * 10)
+
+        # e.g. a restart of the application, or the eviction of the upload tracker
+        restarted = _use_tracker_store(monkeypatch)
+
+        response = await kge_open_upload_session(_request('POST', f"/upload/session?upload_token={upload_token}"))
+        state = json.loads(response.body)
+        assert state['parts'] == [{'part_number': 1, 'size': 10}]
+
+        tracker = await restarted.get(upload_token)
+        assert tracker['upload_id'] == "upload-1" and tracker['current_position'] == 10
+        assert tracker['file_type'] == KgeFileType.KGX_DATA_FILE
+
+    asyncio.run(scenario())
+
+
+def test_incomplete_upload_session_not_completed(uploads, monkeypatch):
+    store = _use_tracker_store(monkeypatch)
+
+    async def scenario():
+        upload_token = await _new_upload_token(store)
+        await kge_open_upload_session(_request('POST', f"/upload/session?upload_token={upload_token}&content_length=25"))
+        await _upload_part(upload_token, 1, b'a' * 10)
+        await _upload_part(upload_token, 2, b'b' * 10)
+
+        with pytest.raises(web.HTTPBadRequest) as bad_request:
+            await kge_complete_upload_session(_request('POST', f"/upload/session/complete?upload_token={upload_token}"))
+        assert bad_request.value.status == 400
+        assert "20 of 25 bytes" in bad_request.value.reason
+
+        # the upload session stays open, for the missing part to be uploaded
+        assert not uploads.completed and not uploads.aborted
+        assert upload_token in uploads.sessions
+
+    asyncio.run(scenario())
+
+
+def test_reap_upload_sessions(uploads):
+    abandoned = datetime.now(timezone.utc) - timedelta(hours=2)
+    for upload_token in ['idle', 'active']:
+        upload_id = uploads.create_multipart_upload("bucket", _OBJECT_KEY)
+        uploads.sessions[upload_token] = (abandoned, {'object_key': _OBJECT_KEY, 'upload_id': upload_id})
+
+    # a part was recently uploaded in the 'active' session, opened as long ago as the 'idle' one
+    uploads.upload_part("bucket", _OBJECT_KEY, 'upload-2', 1, b'data')
+
+    assert reap_upload_sessions(timeout=3600, bucket_name="bucket") == 1
+    assert uploads.aborted == ['upload-1']
+    assert list(uploads.sessions.keys()) == ['active']
+    assert 'upload-2' in uploads.uploads
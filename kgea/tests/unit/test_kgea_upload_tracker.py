@@ -0,0 +1,123 @@
+"""
+Test the upload tracker store, with two stores sharing an in-memory
+backend standing in for two web service worker processes sharing memcached.
+"""
+import asyncio
+from time import sleep
+
+import pytest
+
+from kgea.server.web_services.catalog import KgeFileType
+from kgea.server.web_services.kgea_upload_tracker import (
+    encode_upload_tracker,
+    decode_upload_tracker,
+    UploadTrackerBackend,
+    MemoryUploadTrackerBackend,
+    UploadTrackerStore
+)
+
+
+def test_upload_tracker_codec():
+    details = {
+        'kg_id': "test_kg",
+        'file_type': KgeFileType.KGE_NODES,
+        'active': True,
+        'parts': {1: 100, 2: 50}
+    }
+    assert decode_upload_tracker(encode_upload_tracker(details)) == details
+
+
+def test_memory_upload_tracker_backend_eviction():
+
+    async def scenario():
+        backend = MemoryUploadTrackerBackend(max_entries=2, ttl=3600)
+        for token in ['a', 'b']:
+            await backend.save(token, '{}')
+        # 'a' is the most recently used
+        assert await backend.load('a') == '{}'
+        await backend.save('c', '{}')
+        assert await backend.load('b') is None
+        assert await backend.load('a') == '{}'
+
+        backend = MemoryUploadTrackerBackend(ttl=0.01)
+        await backend.save('a', '{}')
+        sleep(0.02)
+        assert await backend.load('a') is None
+
+    asyncio.run(scenario())
+
+
+def test_upload_tracker_store():
+
+    async def scenario():
+        backend = MemoryUploadTrackerBackend()
+        worker = UploadTrackerStore(backend)
+        other_worker = UploadTrackerStore(backend)
+
+        await worker.save('token', {'kg_id': "test_kg", 'active': True, 'current_position': 0})
+
+        # progress is published upon flushes, rather than upon each update
+        tracker = await worker.attach('token')
+        tracker['current_position'] = 10
+        assert (await other_worker.get('token'))['current_position'] == 0
+        await worker.flush()
+        assert (await other_worker.get('token'))['current_position'] == 10
+
+        # an upload is cancelled through any worker
+        assert await other_worker.cancel('token')
+        await worker.flush()
+        assert not tracker['active']
+
+        tracker['status'] = "Completed"
+        await worker.detach('token')
+        assert (await other_worker.get('token'))['status'] == "Completed"
+
+        assert await worker.get('unknown') is None
+        assert not await worker.cancel('unknown')
+
+    asyncio.run(scenario())
+
+
+def test_upload_session_parts():
+
+    async def scenario():
+        backend = MemoryUploadTrackerBackend()
+        worker = UploadTrackerStore(backend)
+        other_worker = UploadTrackerStore(backend)
+
+        await worker.save('token', {'kg_id': "test_kg", 'upload_id': "upload", 'part_size': 100, 'end_position': 250})
+
+        # parts concurrently uploaded through two workers are all recorded
+        await asyncio.gather(*[
+            store.save_part('token', part_number, size)
+            for store, part_number, size in [(worker, 2, 100), (other_worker, 1, 100), (worker, 3, 50)]
+        ])
+        tracker = await other_worker.get('token')
+        assert tracker['parts'] == {1: 100, 2: 100, 3: 50}
+        assert tracker['current_position'] == 250
+
+        # a part uploaded again replaces its previous upload
+        await other_worker.save_part('token', 3, 40)
+        assert (await worker.get('token'))['current_position'] == 240
+
+        # the parts are evicted with their tracker
+        await backend.delete('token')
+        assert await backend.load_parts('token', [1, 2, 3]) == {}
+
+        # nor are the parts of unknown upload sessions recorded
+        await worker.save_part('token', 1, 100)
+        await worker.save_part('unknown', 1, 100)
+        assert await backend.load_parts('token', [1]) == {} and not backend._parts
+
+    asyncio.run(scenario())
+
+
+def test_incomplete_upload_tracker_backend():
+
+    class IncompleteUploadTrackerBackend(UploadTrackerBackend):
+        async def load(self, upload_token):
+            return None
+
+    # the missing methods of a backend are reported as it is created, rather than upon their calls
+    with pytest.raises(TypeError):
+        IncompleteUploadTrackerBackend()